@@ -0,0 +1,49 @@
+import hmac
+
+from fastapi import APIRouter, Header, HTTPException
+from starlette.concurrency import run_in_threadpool
+
+from app.config import ADMIN_TOKEN
+from app.model.predict import registry
+
+router = APIRouter(prefix="/api/admin", tags=["Admin"])
+
+
+def require_admin(token: str):
+    """Admin actions are disabled unless ADMIN_TOKEN is configured"""
+    if not ADMIN_TOKEN:
+        raise HTTPException(status_code=403, detail="Admin endpoints are disabled (ADMIN_TOKEN is not set)")
+    if not hmac.compare_digest(token.encode(), ADMIN_TOKEN.encode()):
+        raise HTTPException(status_code=403, detail="Invalid admin token")
+
+
+# ===============================
+# MODEL VERSION / HOT RELOAD
+# ===============================
+@router.get("/model")
+def model_version():
+    """Version of the model currently served by this worker"""
+    return registry.get().info()
+
+
+@router.post("/model/reload")
+async def reload_model(x_admin_token: str = Header("")):
+    """
+    Reload model artifacts from disk without a restart.
+    In-flight requests finish on the previous version. Only this worker
+    reloads immediately; the others pick up changed files on their next
+    MODEL_RELOAD_INTERVAL check.
+    """
+    require_admin(x_admin_token)
+
+    current = registry.current
+    previous = current.version if current is not None else None
+    try:
+        bundle = await run_in_threadpool(registry.reload)
+    except Exception as e:
+        raise HTTPException(
+            status_code=409,
+            detail=f"Reload rejected, still serving {previous}: {e}"
+        )
+
+    return {"previous_version": previous, **bundle.info()}
@@ -0,0 +1,248 @@
+"""
+Columnar (Apache Arrow IPC / Parquet) bodies for POST /api/predict/batch.
+
+Bulk clients send one table with a column per PatientInput field instead
+of a JSON list of objects, and get a table back:
+
+    Content-Type: application/vnd.apache.arrow.stream   Arrow IPC stream
+    Content-Type: application/vnd.apache.arrow.file     Arrow IPC file
+    Content-Type: application/vnd.apache.parquet        Parquet
+
+The response uses the request's format unless Accept names another one of
+the three. Result columns, in input order: success, probability (%),
+risk_level, recommendation, error; the model version and row counts are in
+the schema metadata.
+
+Columns are checked with vectorized range / choice checks derived from
+PatientInput's Field(ge=, le=) and Literal constraints and encoded straight
+into the model matrix, so no per-row Python objects are created. Invalid
+rows are reported in place (first failing field) like the JSON path.
+Integer fields are coerced like PatientInput's lax mode: bool columns read
+as 0 / 1, and string columns are parsed by pydantic once per distinct value.
+
+Unlike the JSON path, columnar rows skip the prediction cache and the
+lookup-table scorer (LOOKUP_SCORING), which both work on one dict per row:
+every valid row goes through the encoded matrix and the model in a single
+pass, giving the same probabilities up to float rounding.
+
+pyarrow is optional (pip install pyarrow); without it these content types
+are answered with 415.
+"""
+import typing
+
+import numpy as np
+from pydantic import TypeAdapter, ValidationError
+
+ARROW_STREAM = "application/vnd.apache.arrow.stream"
+ARROW_FILE = "application/vnd.apache.arrow.file"
+PARQUET = "application/vnd.apache.parquet"
+MEDIA_TYPES = (ARROW_STREAM, ARROW_FILE, PARQUET)
+
+NULL_ERROR = "Value error, Field cannot be null"
+INT_ERROR = "Input should be a valid integer"
+
+_INT = TypeAdapter(int)
+
+
+class ColumnarError(ValueError):
+    """
+    The body cannot be scored at all (unreadable, missing columns): 4xx
+    """
+
+    def __init__(self, message, status_code=400):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+def media_type(header) -> str:
+    return header.split(";")[0].strip().lower() if header else ""
+
+
+def response_media_type(accept, request_type) -> str:
+    """
+    First columnar type named in Accept, else the request's own format
+    """
+    for part in (accept or "").split(","):
+        if media_type(part) in MEDIA_TYPES:
+            return media_type(part)
+    return request_type
+
+
+# ======================================================
+# CONSTRAINTS (FROM THE PYDANTIC MODEL)
+# ======================================================
+
+def field_rules(model) -> dict:
+    """
+    {field: ("int", ge, le) or ("choice", allowed values)} for a pydantic model
+    """
+    rules = {}
+    for name, field in model.model_fields.items():
+        if typing.get_origin(field.annotation) is typing.Literal:
+            rules[name] = ("choice", typing.get_args(field.annotation))
+        else:
+            ge = next((m.ge for m in field.metadata if hasattr(m, "ge")), None)
+            le = next((m.le for m in field.metadata if hasattr(m, "le")), None)
+            rules[name] = ("int", ge, le)
+    return rules
+
+
+def coerce_ints(values):
+    """
+    (int64 values, error per distinct-value row or None) for a string column,
+    parsed the way pydantic's lax mode parses a str for an int field
+    (" 60 " and "60.0" are 60, "6e1" is an error)
+    """
+    uniques, inverse = np.unique(values.astype(str), return_inverse=True)
+    parsed = np.zeros(len(uniques), dtype=np.int64)
+    messages = np.full(len(uniques), None, dtype=object)
+    for i, value in enumerate(uniques.tolist()):
+        try:
+            parsed[i] = _INT.validate_python(value)
+        except ValidationError as e:
+            messages[i] = e.errors()[0]["msg"]
+        except OverflowError:  # a valid int, but beyond int64
+            messages[i] = INT_ERROR
+    return parsed[inverse], messages[inverse]
+
+
+def validate_columns(columns, nulls, n_rows, rules):
+    """
+    Vectorized PatientInput validation.
+
+    columns: {field: values ndarray}, nulls: {field: bool ndarray}.
+    Bool and string columns of integer fields are replaced in `columns` by
+    their coerced int64 values.
+    Returns (valid mask, error per row as an object array, None where valid).
+    """
+    missing = [f for f in rules if f not in columns]
+    if missing:
+        raise ColumnarError(f"Missing columns: {missing}")
+
+    errors = np.full(n_rows, None, dtype=object)
+
+    def fail(mask, field, message):
+        mask = mask & (errors == None)  # noqa: E711  (keep the first error per row)
+        errors[mask] = f"{field}: {message}"
+
+    for field, rule in rules.items():
+        values, null = columns[field], nulls[field]
+        fail(null, field, NULL_ERROR)
+
+        if rule[0] == "choice":
+            allowed = rule[1]
+            fail(~np.isin(values, allowed), field,
+                 "Input should be " + " or ".join(repr(v) for v in allowed))
+            continue
+
+        _, ge, le = rule
+        if values.dtype.kind == "b":
+            values = columns[field] = values.astype(np.int64)
+        elif values.dtype.kind in "OUS":
+            values, messages = coerce_ints(values)
+            columns[field] = values
+            for message in set(messages[messages != None].tolist()):  # noqa: E711
+                fail(messages == message, field, message)
+        elif values.dtype.kind not in "iuf":
+            fail(np.ones(n_rows, dtype=bool), field, INT_ERROR)
+            continue
+        if values.dtype.kind == "f":
+            fail(~np.isfinite(values) | (values != np.round(values)), field, INT_ERROR)
+        if ge is not None:
+            fail(values < ge, field, f"Input should be greater than or equal to {ge}")
+        if le is not None:
+            fail(values > le, field, f"Input should be less than or equal to {le}")
+
+    return errors == None, errors  # noqa: E711
+
+
+# ======================================================
+# ARROW / PARQUET I/O
+# ======================================================
+
+def _pyarrow():
+    try:
+        import pyarrow as pa
+    except ImportError:
+        raise ColumnarError("Arrow / Parquet bodies need pyarrow on the server", status_code=415)
+    return pa
+
+
+def read_table(body: bytes, content_type: str):
+    pa = _pyarrow()
+    try:
+        if content_type == PARQUET:
+            import pyarrow.parquet as pq
+
+            return pq.read_table(pa.BufferReader(body))
+        if content_type == ARROW_FILE:
+            return pa.ipc.open_file(pa.BufferReader(body)).read_all()
+        return pa.ipc.open_stream(pa.BufferReader(body)).read_all()
+    except (pa.ArrowException, OSError) as e:
+        raise ColumnarError(f"Unreadable {content_type} body: {e}")
+
+
+def table_columns(table, rules):
+    """
+    ({field: values}, {field: null mask}) as NumPy arrays for the rule fields
+    """
+    pa = _pyarrow()
+    columns, nulls = {}, {}
+    for field, rule in rules.items():
+        if field not in table.column_names:
+            continue
+        column = table.column(field)
+        if pa.types.is_dictionary(column.type):
+            column = column.cast(pa.string())
+        nulls[field] = column.is_null().to_numpy()
+
+        if pa.types.is_integer(column.type) or pa.types.is_floating(column.type):
+            column = column.fill_null(0)
+        elif pa.types.is_boolean(column.type):
+            column = column.fill_null(False)
+        elif pa.types.is_string(column.type) or pa.types.is_large_string(column.type):
+            column = column.fill_null("")
+        columns[field] = column.to_numpy()
+    return columns, nulls
+
+
+def write_table(table, content_type) -> bytes:
+    pa = _pyarrow()
+    sink = pa.BufferOutputStream()
+    if content_type == PARQUET:
+        import pyarrow.parquet as pq
+
+        pq.write_table(table, sink)
+    else:
+        new_writer = pa.ipc.new_file if content_type == ARROW_FILE else pa.ipc.new_stream
+        with new_writer(sink, table.schema) as writer:
+            writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def result_table(n_rows, valid, errors, probabilities, banding, metadata):
+    """
+    Results of all rows in input order; risk_level / recommendation are
+    dictionary-encoded band codes (no per-row strings)
+    """
+    pa = _pyarrow()
+    codes = np.zeros(n_rows, dtype=np.int8)
+    codes[valid] = banding.codes(probabilities)
+    percent = np.zeros(n_rows)
+    percent[valid] = np.round(probabilities * 100, 2)
+    indices = pa.array(codes, mask=~valid)
+
+    return pa.table(
+        {
+            "success": pa.array(valid),
+            "probability": pa.array(percent, mask=~valid),
+            "risk_level": pa.DictionaryArray.from_arrays(
+                indices, pa.array(banding.risk_levels.tolist(), type=pa.string())
+            ),
+            "recommendation": pa.DictionaryArray.from_arrays(
+                indices, pa.array(banding.recommendations.tolist(), type=pa.string())
+            ),
+            "error": pa.array(errors, type=pa.string()),
+        },
+        metadata={k: str(v) for k, v in metadata.items() if v is not None},
+    )
@@ -0,0 +1,41 @@
+from fastapi import APIRouter, HTTPException
+
+from app.config import RETRY_AFTER_SECONDS
+from app.model.predict import registry
+
+router = APIRouter(prefix="/health", tags=["Health"])
+
+
+# ===============================
+# LIVENESS
+# ===============================
+@router.get("/live")
+async def live():
+    """The process is up and the event loop answers (never touches the model)"""
+    return {"status": "alive"}
+
+
+# ===============================
+# READINESS
+# ===============================
+@router.get("/ready")
+def ready():
+    """
+    200 once this worker's model is loaded, validated and warmed up,
+    503 otherwise. The first probe triggers the load, so a worker becomes
+    ready without taking traffic first.
+    """
+    try:
+        bundle = registry.get()
+    except Exception as e:
+        raise HTTPException(
+            status_code=503,
+            detail=f"Model not ready: {e}",
+            headers={"Retry-After": str(RETRY_AFTER_SECONDS)},
+        )
+    return {"status": "ready", **bundle.info()}
+
+
+@router.get("", include_in_schema=False)
+def health():
+    return ready()
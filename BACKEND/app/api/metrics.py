@@ -0,0 +1,84 @@
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import Response
+
+from app.api.predict import batcher
+from app.config import MICRO_BATCHING
+from app.model.predict import cache, executor, registry
+from app.utils.metrics import CONTENT_TYPE, metrics
+
+router = APIRouter(tags=["Monitoring"])
+
+
+# ===============================
+# COLLECTORS (READ AT SCRAPE TIME)
+# ===============================
+@metrics.collector
+def cache_metrics():
+    stats = cache.stats()
+    return [
+        ("prediction_cache_entries", "gauge", "Entries in the prediction cache",
+         [({}, stats["size"])]),
+        ("prediction_cache_lookups_total", "counter", "Prediction cache lookups by result",
+         [({"result": "hit"}, stats["hits"]), ({"result": "miss"}, stats["misses"])]),
+        ("prediction_cache_evictions_total", "counter", "Entries dropped by size or TTL",
+         [({"reason": "size"}, stats["evictions"]), ({"reason": "ttl"}, stats["expirations"])]),
+    ]
+
+
+@metrics.collector
+def batcher_metrics():
+    if not MICRO_BATCHING:
+        return []
+    stats = batcher.stats.snapshot()
+    return [
+        ("micro_batches_total", "counter", "Micro-batches run by the model",
+         [({"result": "ok"}, stats["batches"] - stats["failed_batches"]),
+          ({"result": "failed"}, stats["failed_batches"])]),
+        ("micro_batch_requests_total", "counter", "Requests scored through the micro-batcher",
+         [({}, stats["requests"])]),
+        ("micro_batch_queue_wait_seconds_max", "gauge", "Longest queue wait seen so far",
+         [({}, stats["max_queue_wait_ms"] / 1000)]),
+    ]
+
+
+@metrics.collector
+def executor_metrics():
+    stats = executor.stats()
+    return [
+        ("inference_pending_requests", "gauge", "Admitted requests not yet answered",
+         [({}, stats["pending"])]),
+        ("inference_queue_depth", "gauge", "Admitted requests waiting for an inference worker",
+         [({}, stats["queue_depth"])]),
+        ("inference_rejected_total", "counter", "Requests rejected with 503 because the queue was full",
+         [({}, stats["rejected"])]),
+    ]
+
+
+@metrics.collector
+def model_metrics():
+    if not registry.loaded:
+        return []
+    info = registry.get().info()
+    families = [
+        ("model_info", "gauge", "Model version currently served by this worker",
+         [({"version": info["version"], "engine": info["engine"], "source": info["source"]}, 1)]),
+        ("model_load_seconds", "gauge", "Time to load and validate the served model",
+         [({}, info["load_ms"] / 1000)]),
+    ]
+    if info["warmup"]:
+        families.append(
+            ("model_warmup_seconds", "gauge", "Warm-up pass of the served model before it went live",
+             [({}, info["warmup"]["total_ms"] / 1000)])
+        )
+    return families
+
+
+# ===============================
+# PROMETHEUS ENDPOINT
+# ===============================
+@router.get("/metrics", include_in_schema=False)
+def prometheus_metrics():
+    """Prometheus text exposition of this worker's metrics"""
+    if not metrics.enabled:
+        raise HTTPException(status_code=404, detail="Metrics are disabled")
+    return Response(metrics.render(), media_type=CONTENT_TYPE)
@@ -1,59 +1,310 @@
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel, Field, validator
-from typing import Literal
+import logging
+from functools import partial
 
-from app.model.predict import predict_diabetic_retinopathy
+import numpy as np
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.exceptions import RequestValidationError
+from starlette.concurrency import run_in_threadpool
+from pydantic import TypeAdapter, ValidationError
+from typing import Any, Dict, List
+
+from app.api import columnar
+
+from app.config import (
+    MAX_BATCH_SIZE,
+    MICRO_BATCHING,
+    MICRO_BATCH_MAX_SIZE,
+    MICRO_BATCH_WINDOW_MS,
+    RETRY_AFTER_SECONDS,
+)
+from app.model.batcher import MicroBatcher
+from app.model.cache import cache_key
+from app.model.executor import Overloaded
+from app.model.predict import (
+    MODEL_NAME,
+    cache,
+    executor,
+    predict_batch,
+    predict_diabetic_retinopathy,
+    registry,
+)
+from app.model.risk import RISK_BANDS
+from app.schemas.patient import PatientInput
+from app.utils.metrics import count_error, count_predictions, time_stage
+
+logger = logging.getLogger(__name__)
 
 # Router
 router = APIRouter(prefix="/api", tags=["Prediction"])
 
+# Concurrent single predictions share one forward pass
+# (the route already checked the cache before queueing)
+batcher = MicroBatcher(
+    partial(predict_batch, use_cache=False),
+    max_batch_size=MICRO_BATCH_MAX_SIZE,
+    window_ms=MICRO_BATCH_WINDOW_MS,
+    executor=executor.pool,
+)
 
-# ===============================
-# INPUT SCHEMA (STRICT + SAFE)
-# ===============================
-class PatientInput(BaseModel):
-    age: int = Field(..., ge=1, le=120)
-    gender: Literal["Male", "Female"]
 
-    time_in_hospital: int = Field(..., ge=0, le=30)
-    num_lab_procedures: int = Field(..., ge=0)
-    num_medications: int = Field(..., ge=0)
+async def current_bundle():
+    """
+    Live model bundle for async handlers. The first load and the periodic
+    reload check (unpickling, validation, warm-up) run in a worker thread,
+    never on the event loop.
+    """
+    bundle = registry.current
+    if bundle is None or registry.refresh_due:
+        bundle = await run_in_threadpool(registry.get)
+    return bundle
 
-    number_outpatient: int = Field(..., ge=0)
-    number_emergency: int = Field(..., ge=0)
-    number_inpatient: int = Field(..., ge=0)
 
-    number_diagnoses: int = Field(..., ge=0)
+def version_headers(version) -> dict:
+    """X-Model-Version header, left out when the bundle has no version"""
+    return {"X-Model-Version": str(version)} if version is not None else {}
 
-    insulin: Literal["Yes", "No"]
-    diabetesMed: Literal["Yes", "No"]
 
-    @validator("*", pre=True)
-    def no_null_values(cls, v):
-        if v is None:
-            raise ValueError("Field cannot be null")
-        return v
+def overloaded(error: Overloaded) -> HTTPException:
+    """503 telling the client when to retry"""
+    return HTTPException(
+        status_code=503,
+        detail=str(error),
+        headers={"Retry-After": str(RETRY_AFTER_SECONDS)},
+    )
 
 
 # ===============================
 # PREDICTION ENDPOINT
 # ===============================
 @router.post("/predict")
-def predict(data: PatientInput):
+async def predict(data: PatientInput):
     try:
         # Convert validated input to dict
-        input_data = data.dict()
+        input_data = data.model_dump()
 
-        # Call model logic (UNCHANGED)
-        result = predict_diabetic_retinopathy(input_data)
+        if not MICRO_BATCHING:
+            with executor.admit():
+                return await executor.run(predict_diabetic_retinopathy, input_data)
 
-        return result
+        bundle = await current_bundle()
+        result = cache.get(cache_key(input_data, bundle.version))
+
+        if result is None:
+            # Scored together with any other requests in the batching window
+            with executor.admit():
+                result = await batcher.submit(input_data)
+        else:
+            count_predictions("cache")
+
+        return {
+            "success": True,
+            **result,
+            "model": MODEL_NAME,
+            "features_used": list(bundle.feature_names)
+        }
+
+    except Overloaded as e:
+        raise overloaded(e)
 
     except ValueError as ve:
-        raise HTTPException(status_code=400, detail=str(ve))
+        count_error(ve)
+        logger.warning("Prediction rejected: %s", ve)
+        raise HTTPException(status_code=400, detail="Invalid input for prediction")
 
     except Exception as e:
+        count_error(e)
+        logger.exception("Prediction failed")
         raise HTTPException(
             status_code=500,
             detail="Internal server error during prediction"
         )
+
+
+@router.get("/predict/batcher")
+def batcher_stats():
+    """Micro-batcher batch-size and queue-wait metrics"""
+    return {
+        "enabled": MICRO_BATCHING,
+        "window_ms": MICRO_BATCH_WINDOW_MS,
+        "max_batch_size": MICRO_BATCH_MAX_SIZE,
+        **batcher.stats.snapshot(),
+    }
+
+
+@router.get("/predict/cache")
+def cache_stats():
+    """Prediction cache hit/miss counters"""
+    return cache.stats()
+
+
+@router.get("/predict/queue")
+def queue_stats():
+    """Inference executor admission queue depth and rejections"""
+    return executor.stats()
+
+
+# ===============================
+# BATCH PREDICTION ENDPOINT
+# ===============================
+BATCH_ADAPTER = TypeAdapter(List[Any])
+
+
+def validation_errors(error: ValidationError) -> list:
+    """Keep only the JSON-safe parts of a pydantic ValidationError"""
+    return [
+        {"loc": list(e["loc"]), "msg": e["msg"]}
+        for e in error.errors()
+    ]
+
+
+BATCH_REQUEST_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "application/json": {"schema": {"type": "array", "items": {"type": "object"}}},
+            **{t: {"schema": {"type": "string", "format": "binary"}} for t in columnar.MEDIA_TYPES},
+        },
+    }
+}
+
+
+@router.post("/predict/batch", openapi_extra=BATCH_REQUEST_BODY)
+async def predict_batch_endpoint(request: Request):
+    """
+    Score a list of patients with a single model forward pass.
+    Each record is validated on its own: invalid records are reported
+    in place and do not fail the rest of the batch.
+
+    JSON list of records, or an Arrow IPC / Parquet table with one column
+    per field (see app/api/columnar.py) answered with a table.
+    """
+    content_type = columnar.media_type(request.headers.get("content-type"))
+    if content_type in columnar.MEDIA_TYPES:
+        return await predict_batch_columnar(request, content_type)
+
+    try:
+        records = BATCH_ADAPTER.validate_json(await request.body())
+    except ValidationError as ve:
+        raise RequestValidationError(
+            [{**e, "loc": ("body", *e["loc"])} for e in ve.errors(include_url=False)]
+        )
+
+    if len(records) > MAX_BATCH_SIZE:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Batch too large: {len(records)} records (max {MAX_BATCH_SIZE})"
+        )
+
+    try:
+        with executor.admit():
+            # Validation and scoring both run on the inference executor
+            return await executor.run(score_batch, records)
+    except Overloaded as e:
+        raise overloaded(e)
+
+
+def score_batch(records: List[Any]) -> dict:
+    results: List[Dict[str, Any]] = [None] * len(records)
+    valid_index, valid_records = [], []
+
+    for i, record in enumerate(records):
+        if not isinstance(record, dict):
+            results[i] = {"index": i, "success": False, "errors": [{"loc": [], "msg": "Expected a JSON object"}]}
+            continue
+        try:
+            valid_records.append(PatientInput(**record).model_dump())
+            valid_index.append(i)
+        except ValidationError as ve:
+            results[i] = {"index": i, "success": False, "errors": validation_errors(ve)}
+
+    try:
+        bundle = registry.get()
+        scored = predict_batch(valid_records, bundle)
+    except Exception as e:
+        count_error(e)
+        raise HTTPException(
+            status_code=500,
+            detail="Internal server error during prediction"
+        )
+
+    for i, result in zip(valid_index, scored):
+        results[i] = {"index": i, "success": True, **result}
+
+    return {
+        "count": len(records),
+        "succeeded": len(valid_records),
+        "failed": len(records) - len(valid_records),
+        "model": MODEL_NAME,
+        "model_version": bundle.version,
+        "features_used": list(bundle.feature_names),
+        "results": results,
+    }
+
+
+# ===============================
+# COLUMNAR (ARROW / PARQUET) BATCHES
+# ===============================
+PATIENT_RULES = columnar.field_rules(PatientInput)
+
+
+async def predict_batch_columnar(request: Request, content_type: str) -> Response:
+    body = await request.body()
+    response_type = columnar.response_media_type(request.headers.get("accept"), content_type)
+
+    try:
+        with executor.admit():
+            payload, version = await executor.run(score_columnar, body, content_type, response_type)
+    except Overloaded as e:
+        raise overloaded(e)
+    except columnar.ColumnarError as e:
+        raise HTTPException(status_code=e.status_code, detail=str(e))
+
+    return Response(payload, media_type=response_type, headers=version_headers(version))
+
+
+def score_columnar(body: bytes, content_type: str, response_type: str):
+    """
+    Decode, validate, encode and score a columnar body without per-row objects
+    """
+    table = columnar.read_table(body, content_type)
+    n_rows = table.num_rows
+    if n_rows > MAX_BATCH_SIZE:
+        raise columnar.ColumnarError(
+            f"Batch too large: {n_rows} records (max {MAX_BATCH_SIZE})", status_code=413
+        )
+
+    columns, nulls = columnar.table_columns(table, PATIENT_RULES)
+    valid, errors = columnar.validate_columns(columns, nulls, n_rows, PATIENT_RULES)
+    n_valid = int(valid.sum())
+
+    try:
+        bundle = registry.get()
+        with time_stage("preprocess"):
+            X_scaled = bundle.preprocessor.transform_columns(
+                {f: values[valid] for f, values in columns.items()}, n_valid
+            )
+        with time_stage("inference"):
+            probabilities = (
+                np.clip(bundle.model.predict_proba(X_scaled)[:, 1], 0.0, 1.0) if n_valid else np.empty(0)
+            )
+    except Exception as e:
+        count_error(e)
+        raise HTTPException(
+            status_code=500,
+            detail="Internal server error during prediction"
+        )
+    count_predictions("model", n_valid)
+
+    with time_stage("interpret"):
+        table = columnar.result_table(
+            n_rows, valid, errors, probabilities, RISK_BANDS,
+            {
+                "count": n_rows,
+                "succeeded": n_valid,
+                "failed": n_rows - n_valid,
+                "model": MODEL_NAME,
+                "model_version": bundle.version,
+                "features_used": ",".join(bundle.feature_names),
+            },
+        )
+    return columnar.write_table(table, response_type), bundle.version
@@ -1,13 +1,20 @@
 from fastapi import APIRouter, HTTPException
 from app.schemas.patient import PatientData
 from app.schemas.prediction_response import PredictionResponse
-from app.model.predict import predict_diabetic_retinopathy
+from app.api.predict import overloaded
+from app.model.executor import Overloaded
+from app.model.predict import executor, predict_diabetic_retinopathy
+from app.model.risk import RISK_BANDS
 
 router = APIRouter()
 
 @router.post("/predict", response_model=PredictionResponse)
-def predict(patient: PatientData):
-    result = predict_diabetic_retinopathy(patient.dict())
+async def predict(patient: PatientData):
+    try:
+        with executor.admit():
+            result = await executor.run(predict_diabetic_retinopathy, patient.model_dump())
+    except Overloaded as e:
+        raise overloaded(e)
 
     if not result.get("success", False):
         raise HTTPException(
@@ -39,35 +46,8 @@ async def model_info():
 
 def interpret_risk_level(probability):
     """Interpret the probability score"""
-    if probability >= 0.7:
-        return "High probability of developing diabetic retinopathy within 1-3 years"
-    elif probability >= 0.5:
-        return "Moderate risk, likely to develop within 3-5 years"
-    elif probability >= 0.3:
-        return "Low risk, regular monitoring recommended"
-    else:
-        return "Very low risk, continue preventive care"
+    return RISK_BANDS.band(probability).outlook
 
 def get_next_steps(risk_level):
     """Get recommended next steps based on risk level"""
-    if "HIGH" in risk_level:
-        return [
-            "Schedule appointment with ophthalmologist within 2 weeks",
-            "Consider retinal photography or OCT scan",
-            "Tighten blood sugar control (target HbA1c < 7.0)",
-            "Monitor blood pressure regularly"
-        ]
-    elif "MODERATE" in risk_level:
-        return [
-            "Schedule comprehensive eye exam within 1 month",
-            "Annual retinal screening",
-            "Maintain HbA1c < 7.5",
-            "Increase physical activity"
-        ]
-    else:
-        return [
-            "Annual diabetic eye screening",
-            "Continue current management plan",
-            "Maintain healthy lifestyle",
-            "Regular follow-up with primary care"
-        ]
\ No newline at end of file
+    return list(RISK_BANDS.by_risk_level(risk_level).next_steps)
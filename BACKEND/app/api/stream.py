@@ -0,0 +1,158 @@
+import json
+
+from fastapi import APIRouter, HTTPException, Request
+from pydantic import ValidationError
+from starlette.requests import ClientDisconnect
+from starlette.responses import StreamingResponse
+
+from app.api.predict import PatientInput, current_bundle, overloaded, validation_errors, version_headers
+from app.config import STREAM_CHUNK_SIZE, STREAM_MAX_LINE_BYTES
+from app.model.executor import Overloaded
+from app.model.predict import executor, predict_batch
+from app.utils.metrics import count_error
+
+router = APIRouter(prefix="/api", tags=["Prediction"])
+
+# Stands in for a line that exceeded STREAM_MAX_LINE_BYTES
+OVERSIZED_LINE = object()
+
+
+# ===============================
+# NDJSON INPUT
+# ===============================
+async def iter_lines(byte_chunks, max_line_bytes: int = STREAM_MAX_LINE_BYTES):
+    """
+    Split an async stream of body chunks into non-empty lines.
+    Only one partial line is ever buffered; lines longer than
+    max_line_bytes are dropped and reported as OVERSIZED_LINE.
+    """
+    buffer = b""
+    skipping = False
+
+    async for chunk in byte_chunks:
+        buffer += chunk
+        while True:
+            end = buffer.find(b"\n")
+            if end < 0:
+                break
+            line, buffer = buffer[:end], buffer[end + 1:]
+            if skipping:
+                skipping = False
+            elif len(line) > max_line_bytes:
+                yield OVERSIZED_LINE
+            elif line.strip():
+                yield line
+
+        if not skipping and len(buffer) > max_line_bytes:
+            yield OVERSIZED_LINE
+            skipping = True
+        if skipping:
+            buffer = b""
+
+    if not skipping and buffer.strip():
+        yield buffer
+
+
+def score_lines(lines: list, start: int, bundle) -> bytes:
+    """
+    Validate and score one chunk of NDJSON lines; returns NDJSON results
+    """
+    results = [None] * len(lines)
+    valid_index, valid_records = [], []
+
+    for i, line in enumerate(lines):
+        try:
+            if line is OVERSIZED_LINE:
+                raise ValueError(f"Line longer than {STREAM_MAX_LINE_BYTES} bytes")
+            record = json.loads(line)
+            if not isinstance(record, dict):
+                raise ValueError("Expected a JSON object")
+            valid_records.append(PatientInput(**record).model_dump())
+            valid_index.append(i)
+        except ValidationError as ve:
+            results[i] = {"index": start + i, "success": False, "errors": validation_errors(ve)}
+        except ValueError as e:
+            results[i] = {"index": start + i, "success": False, "errors": [{"loc": [], "msg": str(e)}]}
+
+    for i, result in zip(valid_index, predict_batch(valid_records, bundle)):
+        results[i] = {"index": start + i, "success": True, **result}
+
+    return "".join(json.dumps(r, separators=(",", ":")) + "\n" for r in results).encode()
+
+
+# ===============================
+# STREAMING RESPONSE
+# ===============================
+class NDJSONStreamingResponse(StreamingResponse):
+    """
+    StreamingResponse that can run while the request body is still being
+    read: it does not consume receive() to watch for disconnects (the body
+    reader raises ClientDisconnect itself). on_close runs however the
+    response ends.
+    """
+
+    media_type = "application/x-ndjson"
+
+    def __init__(self, content, on_close=None, **kwargs):
+        super().__init__(content, **kwargs)
+        self._on_close = on_close
+
+    async def __call__(self, scope, receive, send):
+        try:
+            await self.stream_response(send)
+        except OSError:
+            raise ClientDisconnect()
+        finally:
+            if self._on_close is not None:
+                self._on_close()
+
+
+# ===============================
+# STREAMING PREDICTION ENDPOINT
+# ===============================
+@router.post("/predict/stream")
+async def predict_stream(request: Request):
+    """
+    Score newline-delimited PatientInput JSON of any size.
+
+    The body is read incrementally and scored in chunks of
+    STREAM_CHUNK_SIZE records through the batch model path; one NDJSON
+    result line ({"index", "success", ...}) is streamed back per input
+    line, in order, while the upload is still in progress.
+    """
+    try:
+        # One admission slot for the whole stream, released when it ends
+        executor.try_admit()
+    except Overloaded as e:
+        raise overloaded(e)
+
+    try:
+        bundle = await current_bundle()
+    except Exception as e:
+        executor.release()
+        count_error(e)
+        raise HTTPException(status_code=500, detail="Internal server error during prediction")
+
+    async def results():
+        lines, start = [], 0
+        try:
+            async for line in iter_lines(request.stream(), STREAM_MAX_LINE_BYTES):
+                lines.append(line)
+                if len(lines) >= STREAM_CHUNK_SIZE:
+                    yield await executor.run(score_lines, lines, start, bundle)
+                    start += len(lines)
+                    lines = []
+            if lines:
+                yield await executor.run(score_lines, lines, start, bundle)
+        except ClientDisconnect:
+            return
+        except Exception as e:
+            # Headers are already sent: report the failure as a last line
+            count_error(e)
+            yield json.dumps({"success": False, "error": "Internal server error during prediction"}).encode() + b"\n"
+
+    return NDJSONStreamingResponse(
+        results(),
+        on_close=executor.release,
+        headers=version_headers(bundle.version),
+    )
@@ -1,18 +1,88 @@
 from pathlib import Path
 import logging
+import os
+
+from app.utils.threads import available_cores
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-BASE_DIR = Path(__file__).parent.parent.parent  # backend/
+BASE_DIR = Path(__file__).resolve().parent.parent  # backend/
 
-MODEL_PATH = BASE_DIR / "app" / "model" / "ann_model.h5"
-SCALER_PATH = BASE_DIR / "app" / "model" / "scaler.pkl"
-FEATURE_NAMES_PATH = BASE_DIR / "app" / "model" / "feature_names.pkl"
+MODEL_DIR = Path(os.getenv("MODEL_DIR", str(BASE_DIR / "model")))
+MODEL_PATH = MODEL_DIR / "ann_model.pkl"
+SCALER_PATH = MODEL_DIR / "scaler.pkl"
+FEATURE_NAMES_PATH = MODEL_DIR / "feature_names.pkl"
 DATA_PATH = BASE_DIR / "data" / "diabetic_retinopathy.csv"
 
+# Lower probability bound of every risk band above "very low" (app/model/risk.py);
+# each can be overridden with RISK_THRESHOLD_LOW / _MODERATE / _HIGH
 RISK_THRESHOLDS = {
-    "low": 0.3,
-    "moderate": 0.7  # Anything above is high
-}
\ No newline at end of file
+    band: float(os.getenv(f"RISK_THRESHOLD_{band.upper()}", default))
+    for band, default in (("low", "0.3"), ("moderate", "0.5"), ("high", "0.7"))
+}
+
+# ===============================
+# SERVING
+# Every setting can be overridden with an environment variable of the same name
+# ===============================
+def _env_flag(name: str, default: bool) -> bool:
+    return os.getenv(name, "1" if default else "0").strip().lower() in ("1", "true", "yes", "on")
+
+
+MAX_BATCH_SIZE = int(os.getenv("MAX_BATCH_SIZE", "10000"))  # records per /api/predict/batch call
+
+# /api/predict/stream: records scored per chunk, and the longest accepted NDJSON line
+STREAM_CHUNK_SIZE = int(os.getenv("STREAM_CHUNK_SIZE", "1000"))
+STREAM_MAX_LINE_BYTES = int(os.getenv("STREAM_MAX_LINE_BYTES", "65536"))
+
+# Micro-batching of concurrent single /api/predict calls
+MICRO_BATCHING = _env_flag("MICRO_BATCHING", True)
+MICRO_BATCH_WINDOW_MS = float(os.getenv("MICRO_BATCH_WINDOW_MS", "2"))  # batch window when requests queue up
+MICRO_BATCH_MAX_SIZE = int(os.getenv("MICRO_BATCH_MAX_SIZE", "64"))     # flush early when full
+
+# Thread budget per node (see app/utils/threads.py): WEB_WORKERS uvicorn
+# processes × INFERENCE_WORKERS threads × BLAS_THREADS per model call should
+# not exceed CPU_CORES; benchmarks/bench_threads.py finds the best split
+CPU_CORES = int(os.getenv("CPU_CORES", str(available_cores())))
+WEB_WORKERS = int(os.getenv("WEB_WORKERS", "1"))
+BLAS_THREADS = int(os.getenv("BLAS_THREADS", "1"))
+
+# Dedicated inference threads and admission queue; requests beyond
+# workers + queue size get 503 with Retry-After instead of queueing forever.
+# Default: the cores left per web worker (at most 4)
+INFERENCE_WORKERS = int(os.getenv(
+    "INFERENCE_WORKERS", str(max(1, min(4, CPU_CORES // (WEB_WORKERS * BLAS_THREADS))))
+))
+INFERENCE_QUEUE_SIZE = int(os.getenv("INFERENCE_QUEUE_SIZE", "256"))
+RETRY_AFTER_SECONDS = int(os.getenv("RETRY_AFTER_SECONDS", "1"))
+
+# Inference backend: "numpy" (exported weights, no sklearn at serve time), "sklearn",
+# or "onnx" (model.onnx in onnxruntime, optional dependency; see app/model/onnx_engine.py)
+INFERENCE_ENGINE = os.getenv("INFERENCE_ENGINE", "numpy")
+ONNX_INTRA_OP_THREADS = int(os.getenv("ONNX_INTRA_OP_THREADS", "1"))  # per session
+# Weights: "float64" (exact model), "float32" (half the memory), or quantized
+# "float16" / "int8" (ann_weights_<dtype>.npz, see app/model/quantize.py)
+INFERENCE_DTYPE = os.getenv("INFERENCE_DTYPE", "float64")
+
+# Score from precomputed first-layer tables (app/model/lookup.py); numeric
+# fields without an upper bound get table rows for 0..LOOKUP_MAX_VALUE
+LOOKUP_SCORING = _env_flag("LOOKUP_SCORING", False)
+LOOKUP_MAX_VALUE = int(os.getenv("LOOKUP_MAX_VALUE", "255"))
+
+# Load the model in the startup hook instead of on the first request
+PRELOAD_MODEL = _env_flag("PRELOAD_MODEL", False)
+# Synthetic records scored by every new model before it goes live (0 = no warm-up)
+WARMUP_ROWS = int(os.getenv("WARMUP_ROWS", "64"))
+
+# Model hot reload: seconds between artifact file checks (0 = only via admin endpoint)
+MODEL_RELOAD_INTERVAL = float(os.getenv("MODEL_RELOAD_INTERVAL", "10"))
+ADMIN_TOKEN = os.getenv("ADMIN_TOKEN", "")  # required as X-Admin-Token; admin actions are off when unset
+
+# Prediction result cache (cleared on every model reload)
+PREDICTION_CACHE_SIZE = int(os.getenv("PREDICTION_CACHE_SIZE", "10000"))  # entries, 0 = disabled
+PREDICTION_CACHE_TTL = float(os.getenv("PREDICTION_CACHE_TTL", "3600"))   # seconds
+
+# Prometheus metrics at /metrics (stage timers, request/error counters, latency histograms)
+METRICS_ENABLED = _env_flag("METRICS_ENABLED", True)
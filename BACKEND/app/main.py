@@ -1,11 +1,51 @@
+import logging
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.api.admin import router as admin_router
+from app.api.health import router as health_router
+from app.api.metrics import router as metrics_router
 from app.api.predict import router as predict_router
+from app.api.stream import router as stream_router
+from app.config import BLAS_THREADS, CPU_CORES, INFERENCE_WORKERS, PRELOAD_MODEL, WEB_WORKERS
+from app.model.predict import registry
+from app.utils.metrics import MetricsMiddleware
+from app.utils.threads import limit_blas_threads, thread_plan
+
+logger = logging.getLogger(__name__)
+
+
+# ===============================
+# STARTUP
+# Importing this module loads no model and no pandas / sklearn;
+# the NumPy artifacts are mapped on first use, or here with PRELOAD_MODEL=1.
+# BLAS thread limits are applied here (and in every inference thread)
+# ===============================
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    plan = thread_plan(CPU_CORES, WEB_WORKERS, INFERENCE_WORKERS, BLAS_THREADS)
+    libraries = limit_blas_threads(BLAS_THREADS)
+    logger.info("Thread plan: %s, BLAS libraries: %s", plan, libraries)
+    if plan["oversubscribed"]:
+        logger.warning(
+            "%d web workers x %d inference threads x %d BLAS threads exceed %d cores",
+            WEB_WORKERS, INFERENCE_WORKERS, BLAS_THREADS, CPU_CORES,
+        )
+
+    if PRELOAD_MODEL:
+        try:
+            registry.get()
+        except Exception:
+            logger.exception("Model preload failed, loading on first request instead")
+    yield
+
 
 app = FastAPI(
     title="DR Risk Predictor API",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
 )
 
 # ===============================
@@ -19,10 +59,17 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Request counts and latency per route (no-op when METRICS_ENABLED=0)
+app.add_middleware(MetricsMiddleware)
+
 # ===============================
 # ROUTES
 # ===============================
+app.include_router(health_router)
 app.include_router(predict_router)
+app.include_router(stream_router)
+app.include_router(admin_router)
+app.include_router(metrics_router)
 
 
 @app.get("/")
@@ -0,0 +1,163 @@
+"""
+Memory-mappable serving artifacts shared by all worker processes.
+
+Unpickling ann_model.pkl / scaler.pkl gives every uvicorn worker its own
+private copy of the weights. The serving format stores the raw arrays as
+.npy files that are opened with np.load(mmap_mode="r"), so all workers on a
+node share the same pages through the OS page cache and cold start is just
+a few mmap calls:
+
+    model/serving/
+    ├── manifest.json       ← version (hash of the pickles), activation, feature names
+    ├── coef_0.npy ...      ← MLP weights, one file per layer
+    ├── intercept_0.npy ...
+    ├── scaler_mean.npy
+    └── scaler_scale.npy
+
+Export (after every retrain):
+    python -m app.model.artifacts [model_dir]
+"""
+import hashlib
+import json
+import os
+import shutil
+import sys
+from pathlib import Path
+
+import numpy as np
+
+from app.model.engine import NumpyMLP
+
+SERVING_DIR_NAME = "serving"
+FORMAT_VERSION = 1
+SOURCE_FILES = ("ann_model.pkl", "scaler.pkl", "feature_names.pkl")
+
+
+# ======================================================
+# SCALER PARAMETERS (NO SKLEARN NEEDED)
+# ======================================================
+
+class ScalerParams:
+    """
+    The fitted StandardScaler reduced to mean_ / scale_
+    """
+
+    def __init__(self, mean, scale, feature_names=None):
+        self.mean_ = mean
+        self.scale_ = scale
+        self.n_features_in_ = len(mean)
+        if feature_names is not None:
+            self.feature_names_in_ = np.asarray(feature_names, dtype=object)
+
+    def transform(self, X):
+        return (np.asarray(X, dtype=np.float64) - self.mean_) / self.scale_
+
+
+def artifact_version(model_dir) -> str:
+    """
+    Short content hash of the pickled artifacts, shared by every export
+    """
+    digest = hashlib.sha256()
+    for name in SOURCE_FILES:
+        digest.update((Path(model_dir) / name).read_bytes())
+    preprocessor = Path(model_dir) / "preprocessor.pkl"  # optional, saved by newer training runs
+    if preprocessor.exists():
+        digest.update(preprocessor.read_bytes())
+    return digest.hexdigest()[:12]
+
+
+# ======================================================
+# EXPORT
+# ======================================================
+
+def export_artifacts(model_dir, out_dir=None) -> Path:
+    """
+    Convert the pickled model, scaler and feature names to the serving format.
+    The directory is built next to the target and swapped in with a rename.
+    """
+    import joblib
+
+    model_dir = Path(model_dir)
+    out_dir = Path(out_dir) if out_dir else model_dir / SERVING_DIR_NAME
+
+    mlp = NumpyMLP.from_sklearn(joblib.load(model_dir / "ann_model.pkl"))
+    scaler = joblib.load(model_dir / "scaler.pkl")
+    feature_names = [str(f) for f in joblib.load(model_dir / "feature_names.pkl")]
+
+    tmp_dir = out_dir.with_name(f"{out_dir.name}.tmp-{os.getpid()}")
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    tmp_dir.mkdir(parents=True)
+
+    for i, (coef, intercept) in enumerate(zip(mlp.coefs, mlp.intercepts)):
+        np.save(tmp_dir / f"coef_{i}.npy", coef)
+        np.save(tmp_dir / f"intercept_{i}.npy", intercept)
+    np.save(tmp_dir / "scaler_mean.npy", np.asarray(scaler.mean_, dtype=np.float64))
+    np.save(tmp_dir / "scaler_scale.npy", np.asarray(scaler.scale_, dtype=np.float64))
+
+    manifest = {
+        "format": FORMAT_VERSION,
+        "version": artifact_version(model_dir),
+        "activation": mlp.activation,
+        "n_layers": len(mlp.coefs),
+        "feature_names": feature_names,
+    }
+    (tmp_dir / "manifest.json").write_text(json.dumps(manifest, indent=2))
+
+    old_dir = out_dir.with_name(f"{out_dir.name}.old-{os.getpid()}")
+    if out_dir.exists():
+        out_dir.rename(old_dir)
+    tmp_dir.rename(out_dir)
+    shutil.rmtree(old_dir, ignore_errors=True)
+
+    return out_dir
+
+
+# ======================================================
+# LOAD (MEMORY-MAPPED)
+# ======================================================
+
+def read_manifest(serving_dir):
+    path = Path(serving_dir) / "manifest.json"
+    if not path.exists():
+        return None
+    manifest = json.loads(path.read_text())
+    if manifest.get("format") != FORMAT_VERSION:
+        raise ValueError(f"Unsupported serving artifact format: {manifest.get('format')}")
+    return manifest
+
+
+def load_artifacts(serving_dir, dtype="float64"):
+    """
+    Open the serving artifacts with np.load(mmap_mode="r").
+
+    Returns (model, scaler, feature_names, manifest). With dtype="float64"
+    the weight arrays stay backed by the shared file pages; float32 mode
+    makes a private, half-size copy.
+    """
+    serving_dir = Path(serving_dir)
+    manifest = read_manifest(serving_dir)
+    if manifest is None:
+        raise FileNotFoundError(f"No serving artifacts in {serving_dir}")
+
+    def mmap(name):
+        return np.load(serving_dir / name, mmap_mode="r")
+
+    n_layers = manifest["n_layers"]
+    model = NumpyMLP(
+        [mmap(f"coef_{i}.npy") for i in range(n_layers)],
+        [mmap(f"intercept_{i}.npy") for i in range(n_layers)],
+        manifest["activation"],
+        dtype=dtype,
+    )
+    feature_names = manifest["feature_names"]
+    scaler = ScalerParams(mmap("scaler_mean.npy"), mmap("scaler_scale.npy"), feature_names)
+
+    return model, scaler, feature_names, manifest
+
+
+if __name__ == "__main__":
+    model_dir = Path(sys.argv[1]) if len(sys.argv) > 1 else Path(__file__).resolve().parents[2] / "model"
+
+    out_dir = export_artifacts(model_dir)
+    size = sum(p.stat().st_size for p in out_dir.iterdir())
+    print(f"✅ Serving artifacts written to {out_dir} ({size:,} bytes)")
@@ -0,0 +1,182 @@
+import asyncio
+import threading
+import time
+
+# ======================================================
+# BATCH METRICS
+# ======================================================
+
+# Upper bounds of the batch-size histogram buckets
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256)
+
+
+class BatcherStats:
+    """
+    Running counters for batch sizes and queue wait, cheap enough to
+    update on every batch
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.batches = 0
+        self.requests = 0
+        self.failed_batches = 0
+        self.max_batch_size = 0
+        self.queue_wait_total = 0.0
+        self.queue_wait_max = 0.0
+        self.batch_size_counts = [0] * (len(BATCH_SIZE_BUCKETS) + 1)
+
+    def observe(self, batch_size: int, waits: list):
+        bucket = next(
+            (i for i, bound in enumerate(BATCH_SIZE_BUCKETS) if batch_size <= bound),
+            len(BATCH_SIZE_BUCKETS)
+        )
+        with self._lock:
+            self.batches += 1
+            self.requests += batch_size
+            self.max_batch_size = max(self.max_batch_size, batch_size)
+            self.queue_wait_total += sum(waits)
+            self.queue_wait_max = max(self.queue_wait_max, max(waits))
+            self.batch_size_counts[bucket] += 1
+
+    def observe_failure(self):
+        with self._lock:
+            self.failed_batches += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            labels = [f"<={b}" for b in BATCH_SIZE_BUCKETS] + [f">{BATCH_SIZE_BUCKETS[-1]}"]
+            return {
+                "batches": self.batches,
+                "requests": self.requests,
+                "failed_batches": self.failed_batches,
+                "mean_batch_size": round(self.requests / self.batches, 3) if self.batches else 0.0,
+                "largest_batch": self.max_batch_size,
+                "mean_queue_wait_ms": round(1000 * self.queue_wait_total / self.requests, 3) if self.requests else 0.0,
+                "max_queue_wait_ms": round(1000 * self.queue_wait_max, 3),
+                "batch_size_histogram": dict(zip(labels, self.batch_size_counts)),
+            }
+
+
+# ======================================================
+# MICRO-BATCHER
+# ======================================================
+
+class MicroBatcher:
+    """
+    Collect concurrent single-patient requests into one forward pass.
+
+    Records are scored together by `predict_fn(records) -> results` in a
+    worker thread (of `executor`, or the loop's default executor), and each
+    caller gets its own result back. While a batch is running the next one
+    keeps filling, so batches grow on their own under load.
+
+    A request that finds the queue otherwise empty with no batch in flight
+    is scored at once. When others are already waiting, the first one opens
+    a window of `window_ms` and everything that arrives before it closes
+    (up to `max_batch_size`) joins the batch.
+
+    If the batched call raises, its records are scored one at a time so
+    only the callers whose own record fails get the exception.
+    """
+
+    def __init__(self, predict_fn, max_batch_size: int = 64, window_ms: float = 2.0, executor=None):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be >= 1")
+
+        self._predict_fn = predict_fn
+        self.max_batch_size = max_batch_size
+        self.window = window_ms / 1000.0
+        self.executor = executor
+        self.stats = BatcherStats()
+
+        self._loop = None
+        self._queue = None
+        self._worker = None
+
+    def _ensure_worker(self):
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._worker is None or self._worker.done():
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._run())
+
+    async def submit(self, record: dict):
+        """
+        Queue one record and wait for its result
+        """
+        self._ensure_worker()
+        future = self._loop.create_future()
+        self._queue.put_nowait((record, future, time.perf_counter()))
+        return await future
+
+    async def _collect(self) -> list:
+        batch = [await self._queue.get()]
+        if self._queue.empty():
+            return batch  # a lone request: nothing to wait for
+        deadline = self._loop.time() + self.window
+
+        while len(batch) < self.max_batch_size:
+            if not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+                continue
+            timeout = deadline - self._loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+        return batch
+
+    async def _run(self):
+        while True:
+            batch = await self._collect()
+
+            started = time.perf_counter()
+            self.stats.observe(len(batch), [started - queued for _, _, queued in batch])
+
+            records = [record for record, _, _ in batch]
+            try:
+                results = await self._loop.run_in_executor(self.executor, self._predict_fn, records)
+                outcomes = [(result, None) for result in results]
+            except Exception as e:
+                self.stats.observe_failure()
+                if len(records) == 1:
+                    outcomes = [(None, e)]
+                else:
+                    outcomes = await self._loop.run_in_executor(self.executor, self._predict_each, records)
+
+            for (_, future, _), (result, error) in zip(batch, outcomes):
+                if future.done():
+                    continue
+                if error is not None:
+                    future.set_exception(error)
+                else:
+                    future.set_result(result)
+
+    def _predict_each(self, records) -> list:
+        """
+        (result, exception) per record, each scored on its own after the
+        batched call failed
+        """
+        outcomes = []
+        for record in records:
+            try:
+                outcomes.append((self._predict_fn([record])[0], None))
+            except Exception as e:
+                outcomes.append((None, e))
+        return outcomes
+
+    async def close(self):
+        """
+        Stop the background worker (pending requests are cancelled)
+        """
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
@@ -0,0 +1,165 @@
+import numpy as np
+
+# ======================================================
+# RAW CATEGORICAL INPUTS
+# Training one-hot encodes these with get_dummies(drop_first=True),
+# producing columns such as "gender_Male" / "insulin_Yes"
+# ======================================================
+
+CATEGORICAL_FEATURES = ("gender", "insulin", "diabetesMed")
+
+
+# ======================================================
+# HELPER: CLEAN INPUT (FRONTEND MAY SEND JUNK)
+# ======================================================
+
+def clean_value(val, default=0):
+    """
+    Convert junk frontend values to safe numeric values
+    """
+    if val is None:
+        return default
+    if isinstance(val, str):
+        val = val.strip()
+        if val in ["", "?", "NA", "None"]:
+            return default
+    return val
+
+
+# ======================================================
+# PRECOMPILED FEATURE ENCODER
+# ======================================================
+
+class FeatureEncoder:
+    """
+    Turn validated PatientInput dicts straight into scaled model rows.
+
+    Compiled once from feature_names.pkl and the fitted StandardScaler:
+    every one-hot slot and every "missing" slot is pre-standardized, so a
+    request only has to standardize its numeric fields. The result is
+    bit-for-bit what get_dummies -> reindex -> scaler.transform produces
+    on a frame that contains every category.
+    """
+
+    def __init__(self, feature_names, scaler):
+        self.feature_names = list(feature_names)
+        n_features = len(self.feature_names)
+
+        mean = getattr(scaler, "mean_", None)
+        scale = getattr(scaler, "scale_", None)
+        mean = np.zeros(n_features) if mean is None else np.asarray(mean, dtype=np.float64)
+        scale = np.ones(n_features) if scale is None else np.asarray(scale, dtype=np.float64)
+
+        if mean.shape != (n_features,) or scale.shape != (n_features,):
+            raise ValueError(
+                f"Scaler was fitted on {mean.shape[0]} features, "
+                f"feature_names has {n_features}"
+            )
+
+        # Row for an all-zero input (what reindex(fill_value=0) yields)
+        self._base = (np.zeros(n_features) - mean) / scale
+
+        numeric_fields, numeric_index = [], []
+        self._one_hot = {}  # (field, value) -> (column index, scaled 1.0)
+
+        for idx, name in enumerate(self.feature_names):
+            field = next(
+                (f for f in CATEGORICAL_FEATURES if name.startswith(f + "_")),
+                None
+            )
+            if field is None:
+                numeric_fields.append(name)
+                numeric_index.append(idx)
+            else:
+                value = name[len(field) + 1:]
+                self._one_hot[(field, value)] = (idx, (1.0 - mean[idx]) / scale[idx])
+
+        self.numeric_fields = tuple(numeric_fields)
+        self._numeric_index = np.asarray(numeric_index, dtype=np.intp)
+        self._numeric_mean = mean[self._numeric_index]
+        self._numeric_scale = scale[self._numeric_index]
+
+    @property
+    def n_features(self):
+        return len(self.feature_names)
+
+    def _numeric_values(self, record):
+        return [float(clean_value(record.get(f))) for f in self.numeric_fields]
+
+    def _set_one_hot(self, record, row):
+        for field in CATEGORICAL_FEATURES:
+            slot = self._one_hot.get((field, clean_value(record.get(field), None)))
+            if slot is not None:
+                row[slot[0]] = slot[1]
+
+    def transform(self, record, out=None):
+        """
+        Encode one patient dict into a (1, n_features) float64 row
+        """
+        row = np.empty((1, self.n_features)) if out is None else out
+        row[0] = self._base
+        row[0, self._numeric_index] = (
+            (np.asarray(self._numeric_values(record)) - self._numeric_mean)
+            / self._numeric_scale
+        )
+        self._set_one_hot(record, row[0])
+        return row
+
+    def transform_frame(self, df):
+        """
+        Encode a cleaned DataFrame (one column per PatientInput field)
+        with column operations only, no per-row Python
+        """
+        X = np.empty((len(df), self.n_features))
+        X[:] = self._base
+
+        if len(df):
+            numeric = np.column_stack([
+                df[f].to_numpy(dtype=np.float64, na_value=0.0) if f in df
+                else np.zeros(len(df))
+                for f in self.numeric_fields
+            ])
+            X[:, self._numeric_index] = (numeric - self._numeric_mean) / self._numeric_scale
+
+            for (field, value), (idx, hot) in self._one_hot.items():
+                if field in df:
+                    X[(df[field] == value).to_numpy(dtype=bool, na_value=False), idx] = hot
+
+        return X
+
+    def transform_columns(self, columns, n_rows):
+        """
+        Encode validated column arrays ({field: ndarray}, e.g. from an
+        Arrow table) with array operations only
+        """
+        X = np.empty((n_rows, self.n_features))
+        X[:] = self._base
+
+        if n_rows:
+            numeric = np.column_stack([
+                np.asarray(columns[f], dtype=np.float64) if f in columns else np.zeros(n_rows)
+                for f in self.numeric_fields
+            ])
+            X[:, self._numeric_index] = (numeric - self._numeric_mean) / self._numeric_scale
+
+            for (field, value), (idx, hot) in self._one_hot.items():
+                if field in columns:
+                    X[np.asarray(columns[field]) == value, idx] = hot
+
+        return X
+
+    def transform_many(self, records, out=None):
+        """
+        Encode a list of patient dicts into one (n, n_features) matrix
+        """
+        n_rows = len(records)
+        X = np.empty((n_rows, self.n_features)) if out is None else out
+        X[:] = self._base
+
+        if n_rows:
+            numeric = np.array([self._numeric_values(r) for r in records])
+            X[:, self._numeric_index] = (numeric - self._numeric_mean) / self._numeric_scale
+            for i, record in enumerate(records):
+                self._set_one_hot(record, X[i])
+
+        return X
@@ -0,0 +1,170 @@
+"""
+Pure-NumPy forward pass for the trained MLPClassifier.
+
+Serving only needs three or four small matmuls; sklearn's predict_proba
+adds input validation and dtype checks on every call that cost more than
+the maths. The exporter pulls coefs_/intercepts_ out of ann_model.pkl into
+a compact .npz weights file that NumpyMLP runs directly.
+
+Export:
+    python -m app.model.engine [model/ann_model.pkl] [model/ann_weights.npz]
+"""
+import hashlib
+import sys
+from pathlib import Path
+
+import numpy as np
+
+SUPPORTED_DTYPES = ("float64", "float32")
+
+
+# ======================================================
+# ACTIVATIONS (IN PLACE, SAME AS sklearn.neural_network)
+# ======================================================
+
+def _relu(x):
+    np.maximum(x, 0, out=x)
+
+
+def _tanh(x):
+    np.tanh(x, out=x)
+
+
+def _logistic(x):
+    np.negative(x, out=x)
+    np.exp(x, out=x)
+    x += 1
+    np.reciprocal(x, out=x)
+
+
+def _identity(x):
+    pass
+
+
+ACTIVATIONS = {
+    "relu": _relu,
+    "tanh": _tanh,
+    "logistic": _logistic,
+    "identity": _identity,
+}
+
+
+# ======================================================
+# INFERENCE ENGINE
+# ======================================================
+
+class NumpyMLP:
+    """
+    Binary MLP classifier forward pass with the predict_proba interface
+    of sklearn's MLPClassifier, without any of sklearn at serve time
+    """
+
+    def __init__(self, coefs, intercepts, activation="relu", dtype="float64"):
+        if dtype not in SUPPORTED_DTYPES:
+            raise ValueError(f"dtype must be one of {SUPPORTED_DTYPES}, got {dtype!r}")
+        if activation not in ACTIVATIONS:
+            raise ValueError(f"Unsupported hidden activation: {activation!r}")
+        if len(coefs) != len(intercepts) or not coefs:
+            raise ValueError("coefs and intercepts must be non-empty and of equal length")
+        if coefs[-1].shape[1] != 1:
+            raise ValueError("Only binary classifiers (one logistic output) are supported")
+
+        self.dtype = np.dtype(dtype)
+        self.activation = activation
+        self.coefs = [np.ascontiguousarray(c, dtype=self.dtype) for c in coefs]
+        self.intercepts = [np.ascontiguousarray(b, dtype=self.dtype) for b in intercepts]
+        self.n_features_in_ = self.coefs[0].shape[0]
+        self.classes_ = np.array([0, 1])
+        self.source_sha256 = ""  # hash of the pickle the weights came from
+        self._hidden = ACTIVATIONS[activation]
+
+    # --------------------------------------------------
+    # CONSTRUCTION
+    # --------------------------------------------------
+
+    @classmethod
+    def from_sklearn(cls, model, dtype="float64"):
+        if getattr(model, "out_activation_", None) != "logistic":
+            raise ValueError("Only binary MLPClassifier models are supported")
+        return cls(model.coefs_, model.intercepts_, model.activation, dtype=dtype)
+
+    @classmethod
+    def load(cls, path, dtype="float64"):
+        with np.load(path, allow_pickle=False) as weights:
+            n_layers = int(weights["n_layers"])
+            coefs = [weights[f"coef_{i}"] for i in range(n_layers)]
+            intercepts = [weights[f"intercept_{i}"] for i in range(n_layers)]
+            activation = str(weights["activation"])
+            source_sha256 = str(weights["source_sha256"]) if "source_sha256" in weights else ""
+        engine = cls(coefs, intercepts, activation, dtype=dtype)
+        engine.source_sha256 = source_sha256
+        return engine
+
+    def save(self, path):
+        arrays = {
+            "n_layers": np.array(len(self.coefs)),
+            "activation": np.array(self.activation),
+            "source_sha256": np.array(self.source_sha256),
+        }
+        for i, (coef, intercept) in enumerate(zip(self.coefs, self.intercepts)):
+            arrays[f"coef_{i}"] = coef
+            arrays[f"intercept_{i}"] = intercept
+        np.savez(path, **arrays)
+
+    # --------------------------------------------------
+    # FORWARD PASS
+    # --------------------------------------------------
+
+    def predict_positive(self, X):
+        """
+        Probability of the positive class, shape (n_samples,)
+        """
+        activation = np.asarray(X, dtype=self.dtype)
+        last = len(self.coefs) - 1
+
+        for i, (coef, intercept) in enumerate(zip(self.coefs, self.intercepts)):
+            activation = activation @ coef
+            activation += intercept
+            if i != last:
+                self._hidden(activation)
+
+        _logistic(activation)
+        return activation.ravel()
+
+    def predict_proba(self, X):
+        p = self.predict_positive(X)
+        return np.vstack([1 - p, p]).T
+
+    def predict(self, X):
+        return (self.predict_positive(X) > 0.5).astype(int)
+
+
+# ======================================================
+# EXPORTER
+# ======================================================
+
+def file_sha256(path) -> str:
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
+def export_weights(model_path, weights_path):
+    """
+    Extract coefs_/intercepts_ from a pickled MLPClassifier into .npz,
+    tagged with the pickle's hash so stale exports can be detected
+    """
+    import joblib
+
+    engine = NumpyMLP.from_sklearn(joblib.load(model_path))
+    engine.source_sha256 = file_sha256(model_path)
+    engine.save(weights_path)
+    return engine
+
+
+if __name__ == "__main__":
+    model_dir = Path(__file__).resolve().parents[2] / "model"
+    model_path = Path(sys.argv[1]) if len(sys.argv) > 1 else model_dir / "ann_model.pkl"
+    weights_path = Path(sys.argv[2]) if len(sys.argv) > 2 else model_dir / "ann_weights.npz"
+
+    engine = export_weights(model_path, weights_path)
+    layers = " → ".join(str(c.shape[0]) for c in engine.coefs) + " → 1"
+    print(f"✅ Exported {layers} weights to {weights_path} ({weights_path.stat().st_size:,} bytes)")
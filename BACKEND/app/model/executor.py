@@ -0,0 +1,125 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+# ======================================================
+# BOUNDED INFERENCE EXECUTOR (ADMISSION CONTROL)
+# ======================================================
+
+
+class Overloaded(Exception):
+    """
+    Raised when the admission queue is full; routes answer 503 + Retry-After
+    """
+
+
+class InferenceExecutor:
+    """
+    Dedicated thread pool for model work with a bounded admission queue.
+
+    A request must be admitted before it may wait for inference: at most
+    `max_workers` run and `max_queue` wait, anything beyond that is
+    rejected at once with Overloaded instead of piling up in the event
+    loop or the shared anyio threadpool. Waiting time is therefore bounded
+    by roughly max_queue / max_workers model calls.
+
+    `initializer` runs once in every inference thread (e.g. BLAS limits).
+    """
+
+    def __init__(self, max_workers: int = 4, max_queue: int = 256, initializer=None):
+        if max_workers < 1:
+            raise ValueError("max_workers must be >= 1")
+        if max_queue < 0:
+            raise ValueError("max_queue must be >= 0")
+
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="inference", initializer=initializer
+        )
+        self._lock = threading.Lock()
+
+        self.pending = 0     # admitted, not yet answered
+        self.peak_pending = 0
+        self.admitted = 0
+        self.rejected = 0
+
+    @property
+    def limit(self) -> int:
+        return self.max_workers + self.max_queue
+
+    @property
+    def queue_depth(self) -> int:
+        """Admitted requests that are waiting for a worker"""
+        return max(0, self.pending - self.max_workers)
+
+    # --------------------------------------------------
+    # ADMISSION
+    # --------------------------------------------------
+
+    def try_admit(self):
+        with self._lock:
+            if self.pending >= self.limit:
+                self.rejected += 1
+                raise Overloaded(
+                    f"Inference queue full ({self.pending} pending, limit {self.limit})"
+                )
+            self.pending += 1
+            self.admitted += 1
+            self.peak_pending = max(self.peak_pending, self.pending)
+
+    def release(self):
+        with self._lock:
+            self.pending -= 1
+
+    def admit(self):
+        """
+        `with executor.admit(): ...` — raises Overloaded when full
+        """
+        return _Admission(self)
+
+    # --------------------------------------------------
+    # EXECUTION
+    # --------------------------------------------------
+
+    async def run(self, fn, *args, **kwargs):
+        """
+        Run fn in the inference pool without blocking the event loop
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._pool, partial(fn, *args, **kwargs))
+
+    @property
+    def pool(self) -> ThreadPoolExecutor:
+        return self._pool
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "pending": self.pending,
+                "queue_depth": max(0, self.pending - self.max_workers),
+                "peak_pending": self.peak_pending,
+                "admitted": self.admitted,
+                "rejected": self.rejected,
+            }
+
+    def shutdown(self, wait: bool = True):
+        self._pool.shutdown(wait=wait)
+
+
+class _Admission:
+    __slots__ = ("_executor",)
+
+    def __init__(self, executor):
+        self._executor = executor
+
+    def __enter__(self):
+        self._executor.try_admit()
+        return self._executor
+
+    def __exit__(self, *exc):
+        self._executor.release()
+        return False
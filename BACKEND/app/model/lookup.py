@@ -0,0 +1,177 @@
+"""
+Lookup-table scorer for the bounded PatientInput space.
+
+The first layer of the MLP is linear in the raw inputs once the scaler is
+folded into it:
+
+    ((x - mean) / scale) @ W + b  ==  x @ (W / scale) + (b - (mean / scale) @ W)
+
+so its pre-activation splits into
+
+- one row per categorical combination (gender × insulin × diabetesMed:
+  8 rows for the current model), which also carries the bias and the
+  scaler offset
+- one row per value of every numeric field, v * W[j] / scale[j], for the
+  integers 0..max of that field
+
+A single request is then a handful of table reads and additions plus the
+dense hidden layers (batches use one matmul with the folded weights);
+cleaning, one-hot encoding, scaling and the first matmul all disappear.
+Values outside a table (or non-integers) fall back to the same product
+computed on the fly.
+
+Enabled with LOOKUP_SCORING=1; tables are rebuilt with every model load.
+"""
+import itertools
+import math
+
+import numpy as np
+
+from app.api.columnar import field_rules
+from app.model.encoder import CATEGORICAL_FEATURES, clean_value
+from app.model.engine import ACTIVATIONS
+from app.schemas.patient import PatientInput
+
+# Upper table bound per numeric field: PatientInput's le= limit where it has
+# one, otherwise max_value (LOOKUP_MAX_VALUE; the count fields are unbounded)
+FIELD_MAX = {
+    name: rule[2]
+    for name, rule in field_rules(PatientInput).items()
+    if rule[0] == "int" and rule[2] is not None
+}
+
+
+class LookupScorer:
+    """
+    predict_positive for PatientInput dicts from precomputed first-layer rows
+    """
+
+    def __init__(self, model, preprocessor, max_value=255):
+        coefs = getattr(model, "coefs", None) or getattr(model, "coefs_", None)
+        intercepts = getattr(model, "intercepts", None) or getattr(model, "intercepts_", None)
+        if coefs is None:
+            raise ValueError("Lookup scoring needs the numpy or sklearn engine")
+        if len(coefs) < 2:
+            raise ValueError("Lookup scoring needs a model with at least one hidden layer")
+
+        dtype = getattr(model, "dtype", np.dtype("float64"))
+        encoder = preprocessor.encoder
+        names = encoder.feature_names
+        mean = np.asarray(preprocessor.scaler.mean_, dtype=np.float64)
+        scale = np.asarray(preprocessor.scaler.scale_, dtype=np.float64)
+
+        # Scaler folded into the first layer
+        W = np.asarray(coefs[0], dtype=np.float64) / scale[:, None]
+        bias = np.asarray(intercepts[0], dtype=np.float64) - (mean / scale) @ np.asarray(coefs[0], dtype=np.float64)
+
+        # Categorical combinations: option 0 of every field is "no one-hot column set"
+        self._options = []  # per field: {cleaned value: option index}
+        columns = []
+        for field in CATEGORICAL_FEATURES:
+            values = [n[len(field) + 1:] for n in names if n.startswith(field + "_")]
+            self._options.append({v: i + 1 for i, v in enumerate(values)})
+            columns.append([None] + [names.index(f"{field}_{v}") for v in values])
+        self._radix = [len(c) for c in columns]
+
+        combos = []
+        for choice in itertools.product(*columns):
+            row = bias.copy()
+            for idx in choice:
+                if idx is not None:
+                    row += W[idx]
+            combos.append(row)
+        self.combinations = np.asarray(combos, dtype=dtype)
+
+        # Numeric fields: rows v * W[j] for v = 0..max, stacked in one array
+        self.numeric_fields = encoder.numeric_fields
+        numeric_index = [names.index(f) for f in self.numeric_fields]
+        self._weights = np.ascontiguousarray(W[numeric_index], dtype=dtype)
+        self._max = np.array([FIELD_MAX.get(f, max_value) for f in self.numeric_fields])
+        self._offsets = np.concatenate([[0], np.cumsum(self._max + 1)[:-1]])
+        self.tables = np.concatenate([
+            np.arange(m + 1, dtype=np.float64)[:, None] * W[j]
+            for m, j in zip(self._max, numeric_index)
+        ]).astype(dtype)
+
+        self._slots = list(zip(self.numeric_fields, self._offsets.tolist(), self._max.tolist()))
+
+        # Remaining layers; the output layer's logistic is applied separately
+        self._hidden = ACTIVATIONS[getattr(model, "activation", "relu")]
+        self._layers = [
+            (np.ascontiguousarray(c, dtype=dtype), np.ascontiguousarray(b, dtype=dtype))
+            for c, b in zip(coefs[1:], intercepts[1:])
+        ]
+        self.dtype = dtype
+
+    @property
+    def nbytes(self) -> int:
+        return self.combinations.nbytes + self.tables.nbytes
+
+    # --------------------------------------------------
+    # INPUT → TABLE INDICES
+    # --------------------------------------------------
+
+    def _combination(self, record) -> int:
+        index = 0
+        for field, options, radix in zip(CATEGORICAL_FEATURES, self._options, self._radix):
+            index = index * radix + options.get(clean_value(record.get(field), None), 0)
+        return index
+
+    def _rows(self, record):
+        """
+        Table rows of the numeric fields, or None if a value is not a
+        table entry (non-integer or out of range)
+        """
+        rows = []
+        for field, offset, max_value in self._slots:
+            v = clean_value(record.get(field))
+            if v.__class__ is not int or not 0 <= v <= max_value:
+                return None
+            rows.append(offset + v)
+        return rows
+
+    def _numeric(self, record):
+        return np.array([float(clean_value(record.get(f))) for f in self.numeric_fields])
+
+    # --------------------------------------------------
+    # SCORING
+    # --------------------------------------------------
+
+    def _forward(self, z):
+        """
+        First-layer pre-activations → output logits
+        """
+        for coef, intercept in self._layers:
+            self._hidden(z)
+            z = z @ coef
+            z += intercept
+        return z
+
+    def predict_one(self, record) -> float:
+        """
+        Positive-class probability of one PatientInput dict
+        """
+        z = self.combinations[self._combination(record)].copy()
+        rows = self._rows(record)
+        if rows is None:
+            z += self._numeric(record) @ self._weights
+        else:
+            z += np.add.reduce(self.tables[rows])
+
+        logit = float(self._forward(z)[0])
+        return 1.0 / (1.0 + math.exp(-logit)) if logit > -700 else 0.0
+
+    def predict_positive(self, records) -> np.ndarray:
+        """
+        Positive-class probability per PatientInput dict, shape (n,).
+        For many rows one matmul with the folded weights beats gathering
+        and summing table rows, so only the categorical rows are looked up.
+        """
+        combination = np.array([self._combination(r) for r in records], dtype=np.intp)
+        values = np.array([[float(clean_value(r.get(f))) for f in self.numeric_fields] for r in records])
+
+        z = self.combinations[combination]
+        z += values.reshape(len(records), -1) @ self._weights
+
+        logits = self._forward(z).ravel()
+        return 1.0 / (1.0 + np.exp(-logits))
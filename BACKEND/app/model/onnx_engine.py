@@ -0,0 +1,189 @@
+"""
+ONNX export of the scaler + MLP pipeline and an onnxruntime inference engine.
+
+The graph takes the encoded, *unscaled* feature row (columns of
+feature_names.pkl) and does everything else itself:
+
+    features ─ Sub(mean) ─ Div(scale) ─ MatMul/Add/Relu ... ─ Sigmoid ─ probability
+
+It is written with onnx.helper directly (no skl2onnx needed) and carries
+the model version and feature names as metadata, so the file is a portable,
+self-describing artifact. INFERENCE_ENGINE=onnx serves it from one
+onnxruntime CPU session (ONNX_INTRA_OP_THREADS threads); the bundle's
+preprocessor then only encodes, without scaling.
+
+Both packages are optional:
+    pip install onnx          # export
+    pip install onnxruntime   # serving
+
+Export:
+    python -m app.model.onnx_engine [model_dir] [--dtype float32|float64]
+"""
+import json
+import logging
+from pathlib import Path
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+ONNX_FILE = "model.onnx"
+INPUT_NAME = "features"
+OUTPUT_NAME = "probability"
+OPSET = 13
+IR_VERSION = 8  # IR version of opset 13; newer onnx writes IRs older runtimes refuse
+
+ONNX_ACTIVATIONS = {"relu": "Relu", "tanh": "Tanh", "logistic": "Sigmoid", "identity": "Identity"}
+
+
+# ======================================================
+# EXPORT
+# ======================================================
+
+def build_onnx(model, scaler, feature_names, version="", dtype="float32") -> bytes:
+    """
+    Serialized ONNX model of scaler + MLPClassifier (or NumpyMLP)
+    """
+    import onnx
+    from onnx import TensorProto, helper, numpy_helper
+
+    np_dtype = np.dtype(dtype)
+    elem_type = {np.dtype("float32"): TensorProto.FLOAT, np.dtype("float64"): TensorProto.DOUBLE}[np_dtype]
+    coefs = getattr(model, "coefs_", None) or model.coefs
+    intercepts = getattr(model, "intercepts_", None) or model.intercepts
+    hidden = ONNX_ACTIVATIONS[model.activation]
+    n_features = len(feature_names)
+
+    def const(name, value):
+        return numpy_helper.from_array(np.asarray(value, dtype=np_dtype), name)
+
+    initializers = [const("scaler_mean", scaler.mean_), const("scaler_scale", scaler.scale_)]
+    nodes = [
+        helper.make_node("Sub", [INPUT_NAME, "scaler_mean"], ["centered"]),
+        helper.make_node("Div", ["centered", "scaler_scale"], ["layer_0"]),
+    ]
+
+    last = len(coefs) - 1
+    for i, (coef, intercept) in enumerate(zip(coefs, intercepts)):
+        initializers += [const(f"coef_{i}", coef), const(f"intercept_{i}", intercept)]
+        nodes += [
+            helper.make_node("MatMul", [f"layer_{i}", f"coef_{i}"], [f"matmul_{i}"]),
+            helper.make_node("Add", [f"matmul_{i}", f"intercept_{i}"], [f"logits_{i}"]),
+            helper.make_node(
+                "Sigmoid" if i == last else hidden,
+                [f"logits_{i}"],
+                [OUTPUT_NAME if i == last else f"layer_{i + 1}"],
+            ),
+        ]
+
+    graph = helper.make_graph(
+        nodes,
+        "dr_risk_mlp",
+        [helper.make_tensor_value_info(INPUT_NAME, elem_type, [None, n_features])],
+        [helper.make_tensor_value_info(OUTPUT_NAME, elem_type, [None, 1])],
+        initializer=initializers,
+    )
+    onnx_model = helper.make_model(
+        graph,
+        opset_imports=[helper.make_opsetid("", OPSET)],
+        ir_version=IR_VERSION,
+        producer_name="dr-risk-predictor",
+    )
+    helper.set_model_props(onnx_model, {
+        "version": version,
+        "feature_names": json.dumps([str(f) for f in feature_names]),
+    })
+    onnx.checker.check_model(onnx_model)
+    return onnx_model.SerializeToString()
+
+
+def _build_from_dir(model_dir, dtype="float32") -> bytes:
+    import joblib
+
+    from app.model.artifacts import artifact_version
+
+    model_dir = Path(model_dir)
+    return build_onnx(
+        joblib.load(model_dir / "ann_model.pkl"),
+        joblib.load(model_dir / "scaler.pkl"),
+        list(joblib.load(model_dir / "feature_names.pkl")),
+        version=artifact_version(model_dir),
+        dtype=dtype,
+    )
+
+
+def export_onnx(model_dir, out_path=None, dtype="float32") -> Path:
+    """
+    Write model_dir/model.onnx from the pickled model, scaler and feature names
+    """
+    out_path = Path(out_path) if out_path else Path(model_dir) / ONNX_FILE
+    out_path.write_bytes(_build_from_dir(model_dir, dtype))
+    return out_path
+
+
+# ======================================================
+# INFERENCE ENGINE
+# ======================================================
+
+class OnnxMLP:
+    """
+    onnxruntime CPU session with the predict_proba interface of NumpyMLP.
+    Input rows are encoded but not scaled (the graph scales them).
+    """
+
+    def __init__(self, model, intra_op_threads=1):
+        import onnxruntime as ort
+
+        options = ort.SessionOptions()
+        options.intra_op_num_threads = intra_op_threads
+        options.inter_op_num_threads = 1
+        options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+
+        self._session = ort.InferenceSession(model, sess_options=options, providers=["CPUExecutionProvider"])
+        metadata = self._session.get_modelmeta().custom_metadata_map
+        self.version = metadata.get("version", "")
+        self.feature_names = json.loads(metadata.get("feature_names", "[]"))
+
+        model_input = self._session.get_inputs()[0]
+        self.dtype = np.dtype("float64" if model_input.type == "tensor(double)" else "float32")
+        self.n_features_in_ = model_input.shape[1]
+        self.intra_op_threads = intra_op_threads
+        self.classes_ = np.array([0, 1])
+
+    def predict_positive(self, X):
+        features = np.ascontiguousarray(X, dtype=self.dtype)
+        return self._session.run([OUTPUT_NAME], {INPUT_NAME: features})[0].ravel()
+
+    def predict_proba(self, X):
+        p = self.predict_positive(X)
+        return np.vstack([1 - p, p]).T
+
+    def predict(self, X):
+        return (self.predict_positive(X) > 0.5).astype(int)
+
+
+def load_onnx(model_dir, version, intra_op_threads=1) -> OnnxMLP:
+    """
+    Session for model_dir/model.onnx; a missing or stale file is rebuilt in
+    memory from the pickles (needs the onnx package)
+    """
+    path = Path(model_dir) / ONNX_FILE
+    if path.exists():
+        engine = OnnxMLP(str(path), intra_op_threads)
+        if version is None or engine.version == version:
+            return engine
+        logger.warning("%s is stale, building the graph from ann_model.pkl", ONNX_FILE)
+    return OnnxMLP(_build_from_dir(model_dir), intra_op_threads)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Export scaler + MLP to ONNX")
+    parser.add_argument("model_dir", nargs="?", default=str(Path(__file__).resolve().parents[2] / "model"))
+    parser.add_argument("--dtype", choices=("float32", "float64"), default="float32")
+    args = parser.parse_args()
+
+    path = export_onnx(args.model_dir, dtype=args.dtype)
+    print(f"✅ Exported scaler + MLP ({args.dtype}) to {path} ({path.stat().st_size:,} bytes)")
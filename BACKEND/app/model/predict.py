@@ -1,37 +1,70 @@
-import joblib
-import pandas as pd
-from pathlib import Path
+from functools import partial
+
 import numpy as np
 
+from app.config import (
+    BLAS_THREADS,
+    INFERENCE_DTYPE,
+    INFERENCE_ENGINE,
+    INFERENCE_QUEUE_SIZE,
+    INFERENCE_WORKERS,
+    LOOKUP_MAX_VALUE,
+    LOOKUP_SCORING,
+    MODEL_DIR,
+    MODEL_RELOAD_INTERVAL,
+    ONNX_INTRA_OP_THREADS,
+    PREDICTION_CACHE_SIZE,
+    PREDICTION_CACHE_TTL,
+    WARMUP_ROWS,
+)
+from app.model.cache import PredictionCache, cache_key
+from app.model.executor import InferenceExecutor
+from app.model.registry import ModelRegistry
+from app.model.risk import RISK_BANDS
+from app.model.warmup import warm_up
+from app.utils.metrics import count_error, count_predictions, time_stage
+from app.utils.threads import limit_blas_threads
+
 # ======================================================
-# LOAD MODEL ARTIFACTS (ONCE AT STARTUP)
+# MODEL ARTIFACTS (LOADED ON FIRST USE, HOT-RELOADABLE)
 # ======================================================
 
-BASE_DIR = Path(__file__).resolve().parents[2]
-MODEL_DIR = BASE_DIR / "model"
+registry = ModelRegistry(
+    MODEL_DIR,
+    engine=INFERENCE_ENGINE,
+    dtype=INFERENCE_DTYPE,
+    reload_interval=MODEL_RELOAD_INTERVAL,
+    lookup=LOOKUP_SCORING,
+    lookup_max_value=LOOKUP_MAX_VALUE,
+    onnx_threads=ONNX_INTRA_OP_THREADS,
+    warmup=partial(warm_up, rows=WARMUP_ROWS) if WARMUP_ROWS > 0 else None,
+)
+
+# Repeat patients skip the encoder and the model entirely
+cache = PredictionCache(max_size=PREDICTION_CACHE_SIZE, ttl=PREDICTION_CACHE_TTL)
+registry.on_reload(cache.clear)
+
+# All model work from the API runs here, behind a bounded admission queue
+executor = InferenceExecutor(
+    max_workers=INFERENCE_WORKERS,
+    max_queue=INFERENCE_QUEUE_SIZE,
+    initializer=partial(limit_blas_threads, BLAS_THREADS),
+)
 
-model = joblib.load(MODEL_DIR / "ann_model.pkl")
-scaler = joblib.load(MODEL_DIR / "scaler.pkl")
-feature_names = joblib.load(MODEL_DIR / "feature_names.pkl")
 
-print("✅ Model, scaler, and feature names loaded")
+MODEL_NAME = "Deep Learning Neural Network (MLPClassifier)"
 
 
 # ======================================================
-# HELPER: CLEAN INPUT (FRONTEND MAY SEND JUNK)
+# RISK INTERPRETATION
 # ======================================================
 
-def clean_value(val, default=0):
+def interpret_probability(probability: float) -> dict:
     """
-    Convert junk frontend values to safe numeric values
+    Map a [0, 1] probability to percentage, risk level and recommendation
+    (bands from RISK_THRESHOLDS, see app/model/risk.py)
     """
-    if val is None:
-        return default
-    if isinstance(val, str):
-        val = val.strip()
-        if val in ["", "?", "NA", "None"]:
-            return default
-    return val
+    return RISK_BANDS.interpret(probability)
 
 
 # ======================================================
@@ -43,84 +76,111 @@ def predict_diabetic_retinopathy(patient_data: dict) -> dict:
     Predict diabetic retinopathy risk using trained ANN model
     """
 
+    bundle = None
     try:
-        # --------------------------------------------------
-        # 1. CLEAN INPUT DATA
-        # --------------------------------------------------
-        cleaned_data = {k: clean_value(v) for k, v in patient_data.items()}
-
-        # --------------------------------------------------
-        # 2. CONVERT JSON → DATAFRAME
-        # --------------------------------------------------
-        df = pd.DataFrame([cleaned_data])
-
-        # --------------------------------------------------
-        # 3. ONE-HOT ENCODE (MATCH TRAINING)
-        # Must use drop_first=True to match training pipeline
-        # --------------------------------------------------
-        df = pd.get_dummies(df, drop_first=True)
-
-        # --------------------------------------------------
-        # 4. ALIGN FEATURES WITH TRAINED MODEL
-        # --------------------------------------------------
-        df = df.reindex(columns=feature_names, fill_value=0)
-
-        # --------------------------------------------------
-        # 5. SCALE FEATURES
-        # --------------------------------------------------
-        X_scaled = scaler.transform(df)
-
-        # --------------------------------------------------
-        # 6. PREDICT PROBABILITY
-        # --------------------------------------------------
-        probability = float(model.predict_proba(X_scaled)[0][1])
+        # Hold one bundle for the whole request, even across a reload
+        bundle = registry.get()
+
+        with time_stage("cache_lookup"):
+            key = cache_key(patient_data, bundle.version)
+            cached = cache.get(key)
+        if cached is not None:
+            count_predictions("cache")
+            return {
+                "success": True,
+                **cached,
+                "model": MODEL_NAME,
+                "features_used": list(bundle.feature_names)
+            }
+
+        if bundle.lookup is not None:
+            # Precomputed first layer: no encoding/scaling step at all
+            with time_stage("inference"):
+                probability = bundle.lookup.predict_one(patient_data)
+        else:
+            # --------------------------------------------------
+            # 1-5. CLEAN, ONE-HOT ENCODE, ALIGN AND SCALE
+            # Same fitted preprocessor as training: columns of
+            # get_dummies(drop_first=True) + reindex + scaler
+            # (one fused pass, timed as a single stage)
+            # --------------------------------------------------
+            with time_stage("preprocess"):
+                X_scaled = bundle.preprocessor.transform_record(patient_data)
+
+            # --------------------------------------------------
+            # 6. PREDICT PROBABILITY
+            # --------------------------------------------------
+            with time_stage("inference"):
+                probability = float(bundle.model.predict_proba(X_scaled)[0][1])
 
         probability = max(0.0, min(1.0, probability))
 
         # --------------------------------------------------
         # 7. RISK INTERPRETATION
         # --------------------------------------------------
-        if probability >= 0.7:
-            risk_level = "HIGH RISK"
-            recommendation = (
-                "Immediate consultation with an ophthalmologist is recommended. "
-                "High probability of developing diabetic retinopathy."
-            )
-        elif probability >= 0.5:
-            risk_level = "MODERATE RISK"
-            recommendation = (
-                "Schedule a comprehensive eye examination within 1 month. "
-                "Regular monitoring is advised."
-            )
-        elif probability >= 0.3:
-            risk_level = "LOW RISK"
-            recommendation = (
-                "Annual retinal screening is recommended. "
-                "Continue good diabetes management."
-            )
-        else:
-            risk_level = "VERY LOW RISK"
-            recommendation = (
-                "Continue routine eye examinations and maintain healthy diabetes management."
-            )
+        with time_stage("interpret"):
+            result = interpret_probability(probability)
+        cache.put(key, result)
+        count_predictions("model")
 
         return {
             "success": True,
-            "probability": round(probability * 100, 2),
-            "risk_level": risk_level,
-            "recommendation": recommendation,
-            "model": "Deep Learning Neural Network (MLPClassifier)",
-            "features_used": list(feature_names)
+            **result,
+            "model": MODEL_NAME,
+            "features_used": list(bundle.feature_names)
         }
 
     except Exception as e:
+        count_error(e)
         return {
             "success": False,
             "error": str(e),
-            "required_features": list(feature_names)
+            "required_features": list(bundle.feature_names) if bundle else []
         }
 
 
+# ======================================================
+# BATCH PREDICTION (ONE FORWARD PASS FOR MANY PATIENTS)
+# ======================================================
+
+def predict_batch(records: list, bundle=None, use_cache: bool = True) -> list:
+    """
+    Score a list of validated patient dicts with a single predict_proba call.
+    Returns one interpretation dict per record, in input order.
+
+    Cached records are answered from the cache and only the misses are
+    encoded and scored; use_cache=False skips reading the cache (caller
+    already checked) but still stores the new results.
+    """
+    if not records:
+        return []
+
+    bundle = bundle or registry.get()
+    with time_stage("cache_lookup"):
+        keys = [cache_key(r, bundle.version) for r in records]
+        results = [cache.get(k) for k in keys] if use_cache else [None] * len(records)
+
+    misses = [i for i, result in enumerate(results) if result is None]
+    if misses:
+        if bundle.lookup is not None:
+            with time_stage("inference"):
+                probabilities = np.clip(bundle.lookup.predict_positive([records[i] for i in misses]), 0.0, 1.0)
+        else:
+            with time_stage("preprocess"):
+                X_scaled = bundle.preprocessor.transform_records([records[i] for i in misses])
+            with time_stage("inference"):
+                probabilities = np.clip(bundle.model.predict_proba(X_scaled)[:, 1], 0.0, 1.0)
+
+        with time_stage("interpret"):
+            for i, result in zip(misses, RISK_BANDS.interpret_many(probabilities)):
+                results[i] = result
+                cache.put(keys[i], result)
+
+    count_predictions("cache", len(records) - len(misses))
+    count_predictions("model", len(misses))
+    return results
+
+
 # ======================================================
 # LOCAL TEST
 # ======================================================
@@ -0,0 +1,234 @@
+"""
+float16 / int8 quantized weights for the NumPy engine.
+
+    float16 - every weight rounded to half precision (4x smaller than float64)
+    int8    - symmetric per-output-channel quantization: column j of a layer
+              is stored as round(W[:, j] / s_j) in [-127, 127] with
+              s_j = max|W[:, j]| / 127 (8x smaller)
+
+Biases stay float32 and the forward pass runs in float32: x @ q is computed
+from the compact weights and each output channel is multiplied by its s_j,
+so no dequantized copy of a layer is kept around. Selected with
+INFERENCE_DTYPE=float16 / int8; INFERENCE_DTYPE=float64 serves the exact model.
+
+Export (writes model/ann_weights_float16.npz and model/ann_weights_int8.npz
+and reports the accuracy / AUC change on data/X_test.csv):
+    python -m app.model.quantize [model_dir]
+"""
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+
+from app.model.engine import ACTIVATIONS, _logistic, file_sha256
+
+QUANTIZED_FORMATS = ("float16", "int8")
+INT8_MAX = 127
+
+
+def weights_file(fmt) -> str:
+    return f"ann_weights_{fmt}.npz"
+
+
+# ======================================================
+# QUANTIZATION
+# ======================================================
+
+def quantize_layer(coef, fmt):
+    """
+    (stored weights, per-channel scale or None) for one (n_in, n_out) layer
+    """
+    coef = np.asarray(coef, dtype=np.float64)
+    if fmt == "float16":
+        return coef.astype(np.float16), None
+    if fmt == "int8":
+        scale = np.abs(coef).max(axis=0) / INT8_MAX
+        scale[scale == 0] = 1.0
+        q = np.clip(np.rint(coef / scale), -INT8_MAX, INT8_MAX).astype(np.int8)
+        return q, scale.astype(np.float32)
+    raise ValueError(f"Unknown quantization format: {fmt!r} (expected one of {QUANTIZED_FORMATS})")
+
+
+class QuantizedMLP:
+    """
+    Binary MLP forward pass on float16 or int8 weights, with the
+    predict_proba interface of NumpyMLP
+    """
+
+    def __init__(self, weights, scales, intercepts, activation="relu", fmt="int8"):
+        if fmt not in QUANTIZED_FORMATS:
+            raise ValueError(f"Unknown quantization format: {fmt!r}")
+        if activation not in ACTIVATIONS:
+            raise ValueError(f"Unsupported hidden activation: {activation!r}")
+
+        self.format = fmt
+        self.activation = activation
+        self.dtype = np.dtype("float32")  # compute precision
+        self.weights = [np.ascontiguousarray(w) for w in weights]
+        self.scales = [None if s is None else np.asarray(s, dtype=np.float32) for s in scales]
+        self.intercepts = [np.asarray(b, dtype=np.float32) for b in intercepts]
+        self.n_features_in_ = self.weights[0].shape[0]
+        self.classes_ = np.array([0, 1])
+        self.source_sha256 = ""
+        self._hidden = ACTIVATIONS[activation]
+
+    @classmethod
+    def from_coefs(cls, coefs, intercepts, activation="relu", fmt="int8"):
+        weights, scales = zip(*(quantize_layer(c, fmt) for c in coefs))
+        return cls(weights, scales, intercepts, activation, fmt)
+
+    @classmethod
+    def from_sklearn(cls, model, fmt="int8"):
+        if getattr(model, "out_activation_", None) != "logistic":
+            raise ValueError("Only binary MLPClassifier models are supported")
+        return cls.from_coefs(model.coefs_, model.intercepts_, model.activation, fmt)
+
+    @property
+    def coefs(self):
+        """
+        Dequantized float32 weights (for tooling, not used by the forward pass)
+        """
+        return [
+            w.astype(np.float32) if s is None else w.astype(np.float32) * s
+            for w, s in zip(self.weights, self.scales)
+        ]
+
+    @property
+    def nbytes(self) -> int:
+        return sum(w.nbytes + (0 if s is None else s.nbytes) + b.nbytes
+                   for w, s, b in zip(self.weights, self.scales, self.intercepts))
+
+    # --------------------------------------------------
+    # PERSISTENCE
+    # --------------------------------------------------
+
+    def save(self, path):
+        arrays = {
+            "n_layers": np.array(len(self.weights)),
+            "activation": np.array(self.activation),
+            "format": np.array(self.format),
+            "source_sha256": np.array(self.source_sha256),
+        }
+        for i, (w, s, b) in enumerate(zip(self.weights, self.scales, self.intercepts)):
+            arrays[f"coef_{i}"] = w
+            arrays[f"intercept_{i}"] = b
+            if s is not None:
+                arrays[f"scale_{i}"] = s
+        np.savez(path, **arrays)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path, allow_pickle=False) as f:
+            n_layers = int(f["n_layers"])
+            engine = cls(
+                [f[f"coef_{i}"] for i in range(n_layers)],
+                [f[f"scale_{i}"] if f"scale_{i}" in f else None for i in range(n_layers)],
+                [f[f"intercept_{i}"] for i in range(n_layers)],
+                str(f["activation"]),
+                str(f["format"]),
+            )
+            engine.source_sha256 = str(f["source_sha256"])
+        return engine
+
+    # --------------------------------------------------
+    # FORWARD PASS
+    # --------------------------------------------------
+
+    def predict_positive(self, X):
+        activation = np.asarray(X, dtype=np.float32)
+        last = len(self.weights) - 1
+
+        for i, (w, s, b) in enumerate(zip(self.weights, self.scales, self.intercepts)):
+            activation = np.matmul(activation, w, dtype=np.float32)
+            if s is not None:
+                activation *= s
+            activation += b
+            if i != last:
+                self._hidden(activation)
+
+        _logistic(activation)
+        return activation.ravel()
+
+    def predict_proba(self, X):
+        p = self.predict_positive(X)
+        return np.vstack([1 - p, p]).T
+
+    def predict(self, X):
+        return (self.predict_positive(X) > 0.5).astype(int)
+
+
+# ======================================================
+# EXPORT + ACCURACY REPORT
+# ======================================================
+
+def export_quantized(model_path, out_path, fmt):
+    """
+    Quantize a pickled MLPClassifier into .npz, tagged with the pickle's hash
+    """
+    import joblib
+
+    engine = QuantizedMLP.from_sklearn(joblib.load(model_path), fmt)
+    engine.source_sha256 = file_sha256(model_path)
+    engine.save(out_path)
+    return engine
+
+
+def quantization_report(model_dir, split, formats=QUANTIZED_FORMATS) -> dict:
+    """
+    Accuracy / AUC of every format against the float64 model on a split
+    (see app.training.evaluate.load_split)
+    """
+    import joblib
+
+    from app.model.engine import NumpyMLP
+    from app.training.evaluate import load_split, roc_auc
+    from app.utils.dataset import ENCODED_FEATURES
+    from app.utils.preprocessing import PatientPreprocessor
+
+    model_dir = Path(model_dir)
+    model = joblib.load(model_dir / "ann_model.pkl")
+    preprocessor = PatientPreprocessor.from_artifacts(
+        joblib.load(model_dir / "feature_names.pkl"), joblib.load(model_dir / "scaler.pkl")
+    )
+    X, y = load_split(split)
+    X_scaled = preprocessor.transform_encoded(X, ENCODED_FEATURES)
+
+    exact = NumpyMLP.from_sklearn(model)
+    reference = exact.predict_positive(X_scaled)
+
+    def summary(p, nbytes):
+        return {
+            "weight_bytes": int(nbytes),
+            "accuracy": round(float(np.mean((p > 0.5) == y)), 5),
+            "auc": round(roc_auc(p, y), 5),
+        }
+
+    report = {"rows": int(len(y)), "float64": summary(
+        reference, sum(c.nbytes + b.nbytes for c, b in zip(exact.coefs, exact.intercepts))
+    )}
+    for fmt in formats:
+        engine = QuantizedMLP.from_sklearn(model, fmt)
+        p = engine.predict_positive(X_scaled).astype(np.float64)
+        entry = summary(p, engine.nbytes)
+        entry.update({
+            "accuracy_change": round(entry["accuracy"] - report["float64"]["accuracy"], 5),
+            "auc_change": round(entry["auc"] - report["float64"]["auc"], 5),
+            "max_abs_diff": float(np.max(np.abs(p - reference))),
+            "mean_abs_diff": float(np.mean(np.abs(p - reference))),
+            "flipped_predictions": int(np.sum((p > 0.5) != (reference > 0.5))),
+        })
+        report[fmt] = entry
+    return report
+
+
+if __name__ == "__main__":
+    model_dir = Path(sys.argv[1]) if len(sys.argv) > 1 else Path(__file__).resolve().parents[2] / "model"
+
+    for fmt in QUANTIZED_FORMATS:
+        path = model_dir / weights_file(fmt)
+        export_quantized(model_dir / "ann_model.pkl", path, fmt)
+        print(f"✅ {fmt}: {path} ({path.stat().st_size:,} bytes)")
+
+    report = quantization_report(model_dir, model_dir.parent / "data")
+    print(json.dumps(report, indent=2))
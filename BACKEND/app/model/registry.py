@@ -0,0 +1,356 @@
+"""
+Lazy, hot-swappable registry for the serving model artifacts.
+
+Artifacts are loaded on first use (not at import), validated together and
+published as one immutable ModelBundle. A reload builds a complete new
+bundle off to the side and swaps a single reference, so requests that
+already hold the old bundle finish on it while new requests see the new one.
+
+Every uvicorn worker polls the artifact files and reloads on its own when
+they change, which is what rolls a retrained model out across all workers.
+
+Only NumPy is imported here. joblib (and through the pickles, sklearn) is
+imported when a bundle actually has to be built from the pickles, so the
+default serving/ path never loads either.
+"""
+import logging
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+
+from app.model.artifacts import (
+    SERVING_DIR_NAME,
+    SOURCE_FILES,
+    ScalerParams,
+    artifact_version,
+    load_artifacts,
+    read_manifest,
+)
+from app.model.engine import NumpyMLP, file_sha256
+from app.model.lookup import LookupScorer
+from app.model.quantize import QUANTIZED_FORMATS, QuantizedMLP, weights_file
+from app.utils.preprocessing import PatientPreprocessor
+
+logger = logging.getLogger(__name__)
+
+ARTIFACT_FILES = SOURCE_FILES + (
+    "preprocessor.pkl", "ann_weights.npz", f"{SERVING_DIR_NAME}/manifest.json", "model.onnx"
+) + tuple(weights_file(fmt) for fmt in QUANTIZED_FORMATS)
+
+
+def _load_pickle(path):
+    import joblib
+
+    return joblib.load(path)
+
+
+# ======================================================
+# ONE CONSISTENT SET OF ARTIFACTS
+# ======================================================
+
+class ModelBundle:
+    """
+    Model and fitted preprocessor that belong together
+    """
+
+    def __init__(self, model, preprocessor, version, engine, source="pickle"):
+        self.model = model
+        self.preprocessor = preprocessor
+        self.feature_names = list(preprocessor.feature_names)
+        self.scaler = preprocessor.scaler
+        self.version = version
+        self.engine = engine
+        self.source = source  # "serving" (memory-mapped) or "pickle"
+        self.lookup = None    # LookupScorer when lookup scoring is enabled
+        self.load_ms = None   # artifact loading + validation time
+        self.warmup = None    # warm-up timings (app.model.warmup)
+        self.loaded_at = time.time()
+
+    def info(self) -> dict:
+        return {
+            "version": self.version,
+            "engine": self.engine,
+            "source": self.source,
+            "lookup": self.lookup is not None,
+            "n_features": len(self.feature_names),
+            "loaded_at": self.loaded_at,
+            "load_ms": self.load_ms,
+            "warmup": self.warmup,
+        }
+
+
+def load_model(model_dir: Path, engine: str = "numpy", dtype: str = "float64", onnx_threads: int = 1):
+    """
+    Load the inference backend selected by `engine`.
+
+    "numpy" serves from the exported ann_weights.npz; if it is missing or was
+    exported from a different ann_model.pkl, the weights are taken from the
+    pickle instead (run `python -m app.model.engine` to refresh the export).
+    dtype "float16" / "int8" does the same with ann_weights_<dtype>.npz
+    (`python -m app.model.quantize`). "onnx" runs model.onnx (scaler
+    included) in onnxruntime (`python -m app.model.onnx_engine`).
+    """
+    model_path = model_dir / "ann_model.pkl"
+
+    if engine == "sklearn":
+        return _load_pickle(model_path)
+    if engine == "onnx":
+        from app.model.onnx_engine import load_onnx
+
+        has_pickles = all((model_dir / name).exists() for name in SOURCE_FILES)
+        return load_onnx(model_dir, artifact_version(model_dir) if has_pickles else None, onnx_threads)
+    if engine != "numpy":
+        raise ValueError(f"Unknown INFERENCE_ENGINE: {engine!r}")
+
+    if dtype in QUANTIZED_FORMATS:
+        weights_path = model_dir / weights_file(dtype)
+        if weights_path.exists():
+            mlp = QuantizedMLP.load(weights_path)
+            if not model_path.exists() or mlp.source_sha256 == file_sha256(model_path):
+                return mlp
+            logger.warning("%s is stale, quantizing ann_model.pkl", weights_path.name)
+        return QuantizedMLP.from_sklearn(_load_pickle(model_path), dtype)
+
+    weights_path = model_dir / "ann_weights.npz"
+    if weights_path.exists():
+        mlp = NumpyMLP.load(weights_path, dtype=dtype)
+        if not model_path.exists() or mlp.source_sha256 == file_sha256(model_path):
+            return mlp
+        logger.warning("ann_weights.npz is stale, using weights from ann_model.pkl")
+
+    return NumpyMLP.from_sklearn(_load_pickle(model_path), dtype=dtype)
+
+
+def validate_bundle(bundle: ModelBundle):
+    """
+    Refuse artifacts that do not belong together before they go live
+    """
+    n_features = len(bundle.feature_names)
+
+    for name, obj in (("scaler", bundle.scaler), ("model", bundle.model)):
+        n_in = getattr(obj, "n_features_in_", n_features)
+        if n_in != n_features:
+            raise ValueError(
+                f"{name} expects {n_in} features, feature_names.pkl lists {n_features}"
+            )
+
+    scaler_names = getattr(bundle.scaler, "feature_names_in_", None)
+    if scaler_names is not None and list(scaler_names) != bundle.feature_names:
+        raise ValueError("scaler was fitted on different columns than feature_names.pkl")
+
+    probe = bundle.model.predict_proba(bundle.preprocessor.transform_record({}))[:, 1]
+    if not np.all(np.isfinite(probe)) or not 0.0 <= probe[0] <= 1.0:
+        raise ValueError("model produced an invalid probability on the probe input")
+
+
+def validate_lookup(bundle: ModelBundle):
+    """
+    The lookup tables must reproduce the full model on the probe input
+    """
+    expected = float(bundle.model.predict_proba(bundle.preprocessor.transform_record({}))[0, 1])
+    if abs(bundle.lookup.predict_one({}) - expected) > 1e-6:
+        raise ValueError("lookup tables disagree with the model on the probe input")
+
+
+# ======================================================
+# REGISTRY
+# ======================================================
+
+class ModelRegistry:
+    """
+    Holds the live ModelBundle and swaps it atomically on reload
+    """
+
+    def __init__(self, model_dir, engine="numpy", dtype="float64", reload_interval=0.0,
+                 lookup=False, lookup_max_value=255, onnx_threads=1, warmup=None):
+        self.model_dir = Path(model_dir)
+        self.engine = engine
+        self.dtype = dtype
+        self.onnx_threads = onnx_threads
+        self.lookup = lookup
+        self.lookup_max_value = lookup_max_value
+        self.reload_interval = reload_interval  # seconds between file checks, 0 = never
+        self.warmup = warmup  # warmup(bundle) -> timings, run before a bundle goes live
+
+        self._bundle = None
+        self._lock = threading.Lock()
+        self._fingerprint = None
+        self._pending = None
+        self._next_check = 0.0
+        self._reload_hooks = []
+
+    # --------------------------------------------------
+    # FILE FINGERPRINTS
+    # --------------------------------------------------
+
+    def _file_fingerprint(self):
+        stats = []
+        for name in ARTIFACT_FILES:
+            path = self.model_dir / name
+            try:
+                st = path.stat()
+                stats.append((name, st.st_mtime_ns, st.st_size))
+            except FileNotFoundError:
+                stats.append((name, None, None))
+        return tuple(stats)
+
+    # --------------------------------------------------
+    # LOADING
+    # --------------------------------------------------
+
+    def _load_serving(self, version):
+        """
+        Memory-mapped artifacts, if exported from the current pickles
+        """
+        serving_dir = self.model_dir / SERVING_DIR_NAME
+        manifest = read_manifest(serving_dir)
+        if manifest is None:
+            return None
+        if version is not None and manifest["version"] != version:
+            logger.warning("%s/ is stale, loading the pickles instead", SERVING_DIR_NAME)
+            return None
+
+        model, scaler, feature_names, manifest = load_artifacts(serving_dir, self.dtype)
+        preprocessor = PatientPreprocessor.from_artifacts(feature_names, scaler)
+        return ModelBundle(model, preprocessor, manifest["version"], self.engine, "serving")
+
+    def _load_preprocessor(self):
+        """
+        preprocessor.pkl saved by training, or one built from scaler.pkl +
+        feature_names.pkl for models trained before it existed
+        """
+        feature_names = _load_pickle(self.model_dir / "feature_names.pkl")
+        path = self.model_dir / "preprocessor.pkl"
+        if not path.exists():
+            return PatientPreprocessor.from_artifacts(
+                feature_names, _load_pickle(self.model_dir / "scaler.pkl")
+            )
+
+        preprocessor = PatientPreprocessor.load(path)
+        if preprocessor.feature_names != list(feature_names):
+            raise ValueError("preprocessor.pkl and feature_names.pkl list different columns")
+        return preprocessor
+
+    def _load_bundle(self) -> ModelBundle:
+        started = time.perf_counter()
+        has_pickles = all((self.model_dir / name).exists() for name in SOURCE_FILES)
+        version = artifact_version(self.model_dir) if has_pickles else None
+
+        serving = self.engine == "numpy" and self.dtype not in QUANTIZED_FORMATS
+        bundle = self._load_serving(version) if serving else None
+        if bundle is None:
+            preprocessor = self._load_preprocessor()
+            if self.engine == "onnx":
+                # The ONNX graph standardizes its input itself
+                n_features = len(preprocessor.feature_names)
+                preprocessor = PatientPreprocessor.from_artifacts(
+                    preprocessor.feature_names,
+                    ScalerParams(np.zeros(n_features), np.ones(n_features), preprocessor.feature_names),
+                )
+            bundle = ModelBundle(
+                model=load_model(self.model_dir, self.engine, self.dtype, self.onnx_threads),
+                preprocessor=preprocessor,
+                version=version,
+                engine=self.engine,
+            )
+
+        validate_bundle(bundle)
+        if self.lookup:
+            bundle.lookup = LookupScorer(bundle.model, bundle.preprocessor, self.lookup_max_value)
+            validate_lookup(bundle)
+        bundle.load_ms = round((time.perf_counter() - started) * 1000, 3)
+
+        if self.warmup is not None:
+            bundle.warmup = self.warmup(bundle)
+        return bundle
+
+    def _publish(self) -> ModelBundle:
+        # Caller holds self._lock
+        fingerprint = self._file_fingerprint()
+        bundle = self._load_bundle()
+
+        previous, self._bundle = self._bundle, bundle
+        self._fingerprint = self._pending = fingerprint
+        self._next_check = time.monotonic() + self.reload_interval
+
+        if previous is None:
+            logger.info("Model %s loaded (%s engine) in %.1f ms, warm-up: %s",
+                        bundle.version, bundle.engine, bundle.load_ms, bundle.warmup)
+        else:
+            logger.info("Model reloaded: %s -> %s", previous.version, bundle.version)
+            for hook in self._reload_hooks:
+                hook(bundle)
+        return bundle
+
+    def on_reload(self, hook):
+        """
+        Call hook(new_bundle) every time a reload publishes a new bundle
+        """
+        self._reload_hooks.append(hook)
+
+    def reload(self) -> ModelBundle:
+        """
+        Load, validate and publish a fresh bundle. On failure the
+        currently served bundle stays live and the error is raised.
+        """
+        with self._lock:
+            return self._publish()
+
+    def get(self) -> ModelBundle:
+        """
+        Current bundle; loads on first use and picks up changed artifacts
+        """
+        bundle = self._bundle
+        if bundle is None:
+            with self._lock:
+                return self._bundle if self._bundle is not None else self._publish()
+
+        if self.reload_interval and time.monotonic() >= self._next_check:
+            self._poll()
+            bundle = self._bundle
+        return bundle
+
+    def _poll(self):
+        if not self._lock.acquire(blocking=False):
+            return  # another thread is already checking / reloading
+        try:
+            self._next_check = time.monotonic() + self.reload_interval
+            fingerprint = self._file_fingerprint()
+            if fingerprint == self._fingerprint:
+                return
+            if fingerprint != self._pending:
+                # Files are still changing (e.g. a notebook mid-save):
+                # wait until they have been stable for one interval
+                self._pending = fingerprint
+                return
+        finally:
+            self._lock.release()
+
+        try:
+            self.reload()
+        except Exception:
+            logger.exception("Model reload failed, keeping version %s", self._bundle.version)
+            self._fingerprint = self._pending
+
+    @property
+    def loaded(self) -> bool:
+        return self._bundle is not None
+
+    @property
+    def current(self):
+        """
+        Live bundle (None before the first load). Never loads or checks
+        files, so it is the only call that is safe on the event loop.
+        """
+        return self._bundle
+
+    @property
+    def refresh_due(self) -> bool:
+        """
+        get() would load the model or check the artifact files
+        """
+        if self._bundle is None:
+            return True
+        return bool(self.reload_interval) and time.monotonic() >= self._next_check
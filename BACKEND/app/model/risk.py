@@ -0,0 +1,151 @@
+"""
+Risk bands shared by every output path: single and batch predictions,
+Arrow / Parquet batches, the offline scorer (score.py) and the helpers in
+app/api/routes.py.
+
+The band boundaries come from RISK_THRESHOLDS in app/config.py (lower
+probability bound of every band above "very_low"). A whole probability
+array is mapped to band codes with one np.searchsorted; the texts of a
+band are built once, interned, and only referenced by the outputs, so a
+batch never formats a string per row.
+"""
+import bisect
+import sys
+
+import numpy as np
+
+from app.config import RISK_THRESHOLDS
+
+
+class RiskBand:
+    """
+    Texts of one band (shared by every prediction that falls into it)
+    """
+
+    __slots__ = ("code", "name", "risk_level", "recommendation", "outlook", "next_steps")
+
+    def __init__(self, code, name, risk_level, recommendation, outlook, next_steps):
+        self.code = code
+        self.name = name
+        self.risk_level = sys.intern(risk_level)
+        self.recommendation = sys.intern(recommendation)
+        self.outlook = sys.intern(outlook)
+        self.next_steps = tuple(sys.intern(s) for s in next_steps)
+
+
+ROUTINE_STEPS = (
+    "Annual diabetic eye screening",
+    "Continue current management plan",
+    "Maintain healthy lifestyle",
+    "Regular follow-up with primary care",
+)
+
+BANDS = (
+    RiskBand(
+        0, "very_low", "VERY LOW RISK",
+        "Continue routine eye examinations and maintain healthy diabetes management.",
+        "Very low risk, continue preventive care",
+        ROUTINE_STEPS,
+    ),
+    RiskBand(
+        1, "low", "LOW RISK",
+        "Annual retinal screening is recommended. "
+        "Continue good diabetes management.",
+        "Low risk, regular monitoring recommended",
+        ROUTINE_STEPS,
+    ),
+    RiskBand(
+        2, "moderate", "MODERATE RISK",
+        "Schedule a comprehensive eye examination within 1 month. "
+        "Regular monitoring is advised.",
+        "Moderate risk, likely to develop within 3-5 years",
+        (
+            "Schedule comprehensive eye exam within 1 month",
+            "Annual retinal screening",
+            "Maintain HbA1c < 7.5",
+            "Increase physical activity",
+        ),
+    ),
+    RiskBand(
+        3, "high", "HIGH RISK",
+        "Immediate consultation with an ophthalmologist is recommended. "
+        "High probability of developing diabetic retinopathy.",
+        "High probability of developing diabetic retinopathy within 1-3 years",
+        (
+            "Schedule appointment with ophthalmologist within 2 weeks",
+            "Consider retinal photography or OCT scan",
+            "Tighten blood sugar control (target HbA1c < 7.0)",
+            "Monitor blood pressure regularly",
+        ),
+    ),
+)
+
+
+class RiskBanding:
+    """
+    Probability → band code, for one value or a whole array
+    """
+
+    def __init__(self, thresholds, bands=BANDS):
+        names = [b.name for b in bands[1:]]
+        if sorted(thresholds) != sorted(names):
+            raise ValueError(f"RISK_THRESHOLDS must define exactly {names}")
+
+        self.edges = [float(thresholds[name]) for name in names]
+        if not all(a < b for a, b in zip([0.0] + self.edges, self.edges + [1.0])):
+            raise ValueError(f"RISK_THRESHOLDS must increase strictly within (0, 1): {thresholds}")
+
+        self.bands = bands
+        self._edges = np.asarray(self.edges)
+        self._by_level = {b.risk_level: b for b in bands}
+
+        # Object arrays of the interned texts, indexed by band code
+        self.risk_levels = np.array([b.risk_level for b in bands], dtype=object)
+        self.recommendations = np.array([b.recommendation for b in bands], dtype=object)
+
+    def code(self, probability: float) -> int:
+        return bisect.bisect_right(self.edges, probability)
+
+    def codes(self, probabilities) -> np.ndarray:
+        """
+        Band code of every probability (int8 array)
+        """
+        return np.searchsorted(self._edges, probabilities, side="right").astype(np.int8)
+
+    def band(self, probability: float) -> RiskBand:
+        return self.bands[self.code(probability)]
+
+    def by_risk_level(self, risk_level: str) -> RiskBand:
+        """
+        Band of a risk_level string such as "HIGH RISK" (lowest band if unknown)
+        """
+        return self._by_level.get(risk_level, self.bands[0])
+
+    def interpret(self, probability: float) -> dict:
+        """
+        Percentage, risk level and recommendation of one probability
+        """
+        band = self.bands[self.code(probability)]
+        return {
+            "probability": round(probability * 100, 2),
+            "risk_level": band.risk_level,
+            "recommendation": band.recommendation,
+        }
+
+    def interpret_many(self, probabilities) -> list:
+        """
+        interpret() for an array: one searchsorted, the band texts are shared
+        """
+        probabilities = np.asarray(probabilities, dtype=np.float64)
+        percents = (probabilities * 100).tolist()
+        return [
+            {
+                "probability": round(percent, 2),
+                "risk_level": self.bands[c].risk_level,
+                "recommendation": self.bands[c].recommendation,
+            }
+            for percent, c in zip(percents, self.codes(probabilities).tolist())
+        ]
+
+
+RISK_BANDS = RiskBanding(RISK_THRESHOLDS)
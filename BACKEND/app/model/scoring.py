@@ -0,0 +1,161 @@
+"""
+Offline, vectorized batch scoring of patient registries.
+
+Input is streamed in fixed-size chunks, so memory stays bounded by the chunk
+size no matter how large the file is. Each chunk is cleaned the same way as
+the training notebook, encoded with column operations and scored with a
+single forward pass. Chunks can be fanned out over a process pool; results
+are always written in input order.
+"""
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from app.model.registry import ModelRegistry
+from app.model.risk import RISK_BANDS
+from app.utils.preprocessing import PATIENT_FEATURES
+
+SCORE_COLUMNS = ["probability", "risk_level", "recommendation"]
+
+
+# ======================================================
+# CHUNK SCORING
+# ======================================================
+
+def score_frame(df, bundle, keep_columns=None):
+    """
+    Append probability / risk_level / recommendation to a raw chunk
+    """
+    X_scaled = bundle.preprocessor.transform_frame(df)
+    probabilities = np.clip(bundle.model.predict_proba(X_scaled)[:, 1], 0.0, 1.0)
+    codes = RISK_BANDS.codes(probabilities)
+
+    out = df[keep_columns].copy() if keep_columns is not None else df.copy()
+    out["probability"] = probabilities
+    # Object columns referencing the shared band texts
+    out["risk_level"] = RISK_BANDS.risk_levels[codes]
+    out["recommendation"] = RISK_BANDS.recommendations[codes]
+    return out
+
+
+# One bundle per pool worker, loaded by the initializer
+_worker_bundle = None
+
+
+def _init_worker(model_dir, engine, dtype):
+    global _worker_bundle
+    _worker_bundle = ModelRegistry(model_dir, engine=engine, dtype=dtype).get()
+
+
+def _score_in_worker(df, keep_columns):
+    return score_frame(df, _worker_bundle, keep_columns)
+
+
+# ======================================================
+# STREAMING READERS / WRITERS
+# ======================================================
+
+def _is_parquet(path):
+    return Path(path).suffix.lower() in (".parquet", ".pq")
+
+
+def iter_chunks(path, chunk_size, columns=None):
+    """
+    Yield DataFrames of at most chunk_size rows from a CSV or Parquet file
+    """
+    if _is_parquet(path):
+        import pyarrow.parquet as pq
+
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_size, columns=columns):
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(path, chunksize=chunk_size, usecols=columns, low_memory=False)
+
+
+class ChunkWriter:
+    """
+    Append scored chunks to a CSV or Parquet file
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.parquet = _is_parquet(path)
+        self._writer = None
+        self._wrote_header = False
+
+    def write(self, df):
+        if self.parquet:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            if self._writer is None:
+                self._writer = pq.ParquetWriter(self.path, table.schema)
+            self._writer.write_table(table)
+        else:
+            df.to_csv(self.path, mode="a" if self._wrote_header else "w",
+                      header=not self._wrote_header, index=False)
+            self._wrote_header = True
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+
+
+# ======================================================
+# ENTRY POINT
+# ======================================================
+
+def score_file(input_path, output_path, model_dir, chunk_size=50000, workers=1,
+               keep_columns=None, engine="numpy", dtype="float64", progress=None):
+    """
+    Score every row of input_path into output_path; returns the row count.
+
+    keep_columns limits which input columns are copied to the output
+    (default: all of them). workers > 1 scores chunks in a process pool
+    with at most 2 * workers chunks in flight.
+    """
+    columns = None
+    if keep_columns is not None:
+        columns = list(dict.fromkeys(list(keep_columns) + PATIENT_FEATURES))
+
+    writer = ChunkWriter(output_path)
+    n_rows = 0
+
+    def emit(scored):
+        nonlocal n_rows
+        writer.write(scored)
+        n_rows += len(scored)
+        if progress:
+            progress(n_rows)
+
+    try:
+        if workers <= 1:
+            bundle = ModelRegistry(model_dir, engine=engine, dtype=dtype).get()
+            for chunk in iter_chunks(input_path, chunk_size, columns):
+                emit(score_frame(chunk, bundle, keep_columns))
+        else:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(str(model_dir), engine, dtype),
+            ) as pool:
+                pending = deque()
+                for chunk in iter_chunks(input_path, chunk_size, columns):
+                    pending.append(pool.submit(_score_in_worker, chunk, keep_columns))
+                    if len(pending) >= 2 * workers:
+                        emit(pending.popleft().result())
+                while pending:
+                    emit(pending.popleft().result())
+    finally:
+        writer.close()
+
+    return n_rows
+
+
+def default_workers():
+    return max(1, (os.cpu_count() or 1) - 1)
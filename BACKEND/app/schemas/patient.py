@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, validator
 from typing import Literal
 
 class PatientData(BaseModel):
@@ -30,3 +30,30 @@ class PatientData(BaseModel):
                 "family_history": 0
             }
         }
+
+
+# ===============================
+# INPUT SCHEMA (STRICT + SAFE)
+# ===============================
+class PatientInput(BaseModel):
+    age: int = Field(..., ge=1, le=120)
+    gender: Literal["Male", "Female"]
+
+    time_in_hospital: int = Field(..., ge=0, le=30)
+    num_lab_procedures: int = Field(..., ge=0)
+    num_medications: int = Field(..., ge=0)
+
+    number_outpatient: int = Field(..., ge=0)
+    number_emergency: int = Field(..., ge=0)
+    number_inpatient: int = Field(..., ge=0)
+
+    number_diagnoses: int = Field(..., ge=0)
+
+    insulin: Literal["Yes", "No"]
+    diabetesMed: Literal["Yes", "No"]
+
+    @validator("*", pre=True)
+    def no_null_values(cls, v):
+        if v is None:
+            raise ValueError("Field cannot be null")
+        return v
@@ -0,0 +1,296 @@
+"""
+Vectorized model evaluation.
+
+A split is scored once with the serving bundle and the probabilities are
+cached next to it (keyed on model version + split content). Every metric
+is then derived from that one vector with numpy:
+
+- ROC-AUC and average precision (ties handled like sklearn)
+- ROC / PR curves on a fixed threshold grid
+- calibration table, ECE and Brier score
+- confusion-matrix metrics at each risk threshold (RISK_THRESHOLDS + 0.5)
+- bootstrap confidence intervals: all resamples are evaluated as one
+  weight matrix (rows = resamples, columns = bootstrap counts per sample)
+
+The report is plain JSON so CI can gate on it (see compare_reports).
+"""
+import hashlib
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from app.config import MODEL_DIR, RISK_THRESHOLDS
+from app.utils.dataset import ENCODED_FEATURES, RANDOM_STATE, TEST_SIZE, encode_frame, load_dataset
+from app.utils.preprocessing import decode_dummies_frame
+
+# Risk band edges plus the 0.5 decision threshold of model.predict
+THRESHOLDS = tuple(sorted({*RISK_THRESHOLDS.values(), 0.5}))
+
+CACHE_DIR_NAME = ".cache"
+BOOTSTRAP_CHUNK = 100  # resamples per weight matrix
+
+# Metrics checked by compare_reports and whether higher is better
+GATED_METRICS = {"auc": True, "average_precision": True, "brier": False}
+
+
+# ======================================================
+# SPLITS + CACHED PROBABILITIES
+# ======================================================
+
+def load_split(path, test_split=False):
+    """
+    Encoded X, y of a split: a directory with X_test.csv / y_test.csv, or a
+    raw registry CSV (its stratified 20% test split with test_split=True)
+    """
+    path = Path(path)
+    if path.is_dir():
+        X = encode_frame(decode_dummies_frame(pd.read_csv(path / "X_test.csv")))
+        y = pd.read_csv(path / "y_test.csv")["target"].to_numpy()
+        return X, y
+
+    data = load_dataset(path)
+    X, y = np.asarray(data.X), np.asarray(data.y)
+    if test_split:
+        from sklearn.model_selection import train_test_split
+
+        _, X, _, y = train_test_split(X, y, test_size=TEST_SIZE, stratify=y, random_state=RANDOM_STATE)
+    return X, y
+
+
+def split_digest(path, test_split=False) -> str:
+    path = Path(path)
+    files = [path / "X_test.csv", path / "y_test.csv"] if path.is_dir() else [path]
+    digest = hashlib.sha256(b"test" if test_split else b"all")
+    for f in files:
+        digest.update(f.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def score_split(path, model_dir=MODEL_DIR, test_split=False, cache_dir=None, refresh=False):
+    """
+    (probabilities, y, model version) for a split, from the cache when
+    neither the model nor the split changed
+    """
+    from app.model.registry import ModelRegistry
+
+    bundle = ModelRegistry(Path(model_dir)).get()
+    path = Path(path)
+    cache_dir = Path(cache_dir) if cache_dir else (path if path.is_dir() else path.parent) / CACHE_DIR_NAME
+    cache_file = cache_dir / "eval" / f"{bundle.version}-{split_digest(path, test_split)}.npz"
+
+    if cache_file.exists() and not refresh:
+        cached = np.load(cache_file)
+        return cached["proba"], cached["y"], bundle.version
+
+    X, y = load_split(path, test_split)
+    X_scaled = bundle.preprocessor.transform_encoded(X, ENCODED_FEATURES)
+    proba = bundle.model.predict_proba(X_scaled)[:, 1]
+
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    np.savez(cache_file, proba=proba, y=np.asarray(y, dtype=np.int8))
+    return proba, np.asarray(y, dtype=np.int8), bundle.version
+
+
+# ======================================================
+# METRICS ON A WEIGHT MATRIX
+# Row r of W holds the weight of every sample in evaluation r: a single
+# row of ones is the plain metric, bootstrap rows hold resample counts.
+# ======================================================
+
+def _divide(a, b):
+    return np.divide(a, b, out=np.zeros(np.broadcast(a, b).shape), where=b > 0)
+
+
+class _Ranking:
+    """
+    Samples sorted by probability, grouped by tied value
+    """
+
+    def __init__(self, proba, y):
+        self.order = np.argsort(proba, kind="stable")
+        sorted_proba = proba[self.order]
+        self.starts = np.flatnonzero(np.r_[True, sorted_proba[1:] != sorted_proba[:-1]])
+        self.y = np.asarray(y, dtype=np.float64)[self.order]
+
+    def metrics(self, W):
+        """
+        ROC-AUC and average precision for every row of W
+        """
+        W = W[:, self.order]
+        pos = np.add.reduceat(W * self.y, self.starts, axis=1)
+        neg = np.add.reduceat(W * (1 - self.y), self.starts, axis=1)
+
+        # AUC: each positive beats the negatives below it, ties count half
+        below = np.cumsum(neg, axis=1) - neg
+        auc = _divide((pos * (below + 0.5 * neg)).sum(axis=1), pos.sum(axis=1) * neg.sum(axis=1))
+
+        # AP: precision at each threshold (high → low) weighted by recall gained
+        tp = np.cumsum(pos[:, ::-1], axis=1)
+        fp = np.cumsum(neg[:, ::-1], axis=1)
+        precision = _divide(tp, tp + fp)
+        ap = _divide((pos[:, ::-1] * precision).sum(axis=1), tp[:, -1])
+        return auc, ap
+
+
+def roc_auc(proba, y) -> float:
+    proba = np.asarray(proba, dtype=np.float64)
+    return float(_Ranking(proba, y).metrics(np.ones((1, len(proba))))[0][0])
+
+
+def _threshold_metrics(W, proba, y, thresholds):
+    """
+    Confusion-matrix metrics per row of W (axis 0) and threshold (axis 1)
+    """
+    predicted = proba[:, None] >= np.asarray(thresholds)[None, :]
+    positive = np.asarray(y, dtype=bool)
+
+    tp = W @ (predicted & positive[:, None])
+    fp = W @ (predicted & ~positive[:, None])
+    n_pos = (W @ positive)[:, None]
+    n_neg = (W.sum(axis=1) - W @ positive)[:, None]
+    fn, tn = n_pos - tp, n_neg - fp
+
+    precision = _divide(tp, tp + fp)
+    recall = _divide(tp, n_pos)
+    return {
+        "accuracy": (tp + tn) / (n_pos + n_neg),
+        "precision": precision,
+        "recall": recall,
+        "specificity": _divide(tn, n_neg),
+        "f1": _divide(2 * precision * recall, precision + recall),
+        "positive_rate": (tp + fp) / (n_pos + n_neg),
+    }
+
+
+def _brier(W, proba, y):
+    return (W @ (proba - y) ** 2) / W.sum(axis=1)
+
+
+def bootstrap_weights(n, n_resamples, rng):
+    """
+    (n_resamples, n) matrix of how often each sample was drawn
+    """
+    draws = rng.integers(0, n, size=(n_resamples, n))
+    draws += np.arange(n_resamples)[:, None] * n
+    return np.bincount(draws.ravel(), minlength=n_resamples * n).reshape(n_resamples, n).astype(np.float64)
+
+
+# ======================================================
+# CURVES + CALIBRATION (POINT ESTIMATES)
+# ======================================================
+
+def curves(proba, y, points=101) -> dict:
+    """
+    ROC and PR curve on an evenly spaced threshold grid
+    """
+    grid = np.linspace(0.0, 1.0, points)
+    pos = np.sort(proba[y == 1])
+    neg = np.sort(proba[y == 0])
+    tp = len(pos) - np.searchsorted(pos, grid, side="left")
+    fp = len(neg) - np.searchsorted(neg, grid, side="left")
+
+    return {
+        "thresholds": grid.round(4).tolist(),
+        "tpr": _divide(tp, len(pos)).round(5).tolist(),
+        "fpr": _divide(fp, len(neg)).round(5).tolist(),
+        "precision": _divide(tp, tp + fp).round(5).tolist(),
+    }
+
+
+def calibration(proba, y, n_bins=10) -> dict:
+    """
+    Mean prediction vs observed rate per probability bin, plus ECE
+    """
+    bins = np.minimum((proba * n_bins).astype(int), n_bins - 1)
+    count = np.bincount(bins, minlength=n_bins)
+    mean_pred = _divide(np.bincount(bins, weights=proba, minlength=n_bins), count)
+    observed = _divide(np.bincount(bins, weights=y, minlength=n_bins), count)
+    ece = float(np.sum(count / len(proba) * np.abs(mean_pred - observed)))
+
+    return {
+        "ece": round(ece, 5),
+        "bins": [
+            {"lower": i / n_bins, "upper": (i + 1) / n_bins, "count": int(c),
+             "mean_predicted": round(float(m), 5), "observed_rate": round(float(o), 5)}
+            for i, (c, m, o) in enumerate(zip(count, mean_pred, observed))
+        ],
+    }
+
+
+# ======================================================
+# REPORT
+# ======================================================
+
+def _flat_metrics(W, proba, y, ranking, thresholds) -> dict:
+    """
+    {metric name: value per row of W}
+    """
+    auc, ap = ranking.metrics(W)
+    out = {"auc": auc, "average_precision": ap, "brier": _brier(W, proba, y)}
+    for name, values in _threshold_metrics(W, proba, y, thresholds).items():
+        for j, t in enumerate(thresholds):
+            out[f"{name}@{t}"] = values[:, j]
+    return out
+
+
+def evaluate(proba, y, thresholds=THRESHOLDS, n_bootstrap=1000, confidence=0.95,
+             seed=RANDOM_STATE, curve_points=101, n_bins=10) -> dict:
+    """
+    Full evaluation report of one probability vector
+    """
+    proba = np.asarray(proba, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    ranking = _Ranking(proba, y)
+
+    point = _flat_metrics(np.ones((1, len(y))), proba, y, ranking, thresholds)
+    report = {
+        "rows": int(len(y)),
+        "positives": int(y.sum()),
+        "metrics": {k: round(float(v[0]), 5) for k, v in point.items()},
+    }
+
+    if n_bootstrap:
+        rng = np.random.default_rng(seed)
+        samples = {k: [] for k in point}
+        for start in range(0, n_bootstrap, BOOTSTRAP_CHUNK):
+            W = bootstrap_weights(len(y), min(BOOTSTRAP_CHUNK, n_bootstrap - start), rng)
+            for k, v in _flat_metrics(W, proba, y, ranking, thresholds).items():
+                samples[k].append(v)
+
+        tail = (1 - confidence) / 2 * 100
+        report["bootstrap"] = {"resamples": n_bootstrap, "confidence": confidence, "seed": seed}
+        report["confidence_intervals"] = {
+            k: np.percentile(np.concatenate(v), [tail, 100 - tail]).round(5).tolist()
+            for k, v in samples.items()
+        }
+
+    report["calibration"] = calibration(proba, y, n_bins)
+    report["curves"] = curves(proba, y, curve_points)
+    return report
+
+
+def compare_reports(report, baseline, max_drop=0.005) -> list:
+    """
+    Regressions of report against a baseline report (empty list = pass)
+    """
+    failures = []
+    for name, higher_is_better in GATED_METRICS.items():
+        if name not in baseline.get("metrics", {}):
+            continue
+        old, new = baseline["metrics"][name], report["metrics"][name]
+        drop = old - new if higher_is_better else new - old
+        if drop > max_drop:
+            failures.append(f"{name}: {old:.4f} → {new:.4f} (allowed change {max_drop})")
+    return failures
+
+
+def evaluate_split(path, model_dir=MODEL_DIR, test_split=False, refresh=False, **options) -> dict:
+    proba, y, version = score_split(path, model_dir, test_split=test_split, refresh=refresh)
+    report = evaluate(proba, y, **options)
+    return {"model_version": version, "split": str(path), "test_split": test_split, **report}
+
+
+def write_report(report, path):
+    Path(path).write_text(json.dumps(report, indent=2))
@@ -0,0 +1,196 @@
+"""
+Incremental (warm-start) retraining from newly labeled encounters.
+
+Instead of refitting on the full registry, the current model is updated
+with partial_fit on the new rows only:
+
+1. rows with encounter_id above the last trained watermark are selected
+2. the StandardScaler statistics are updated with partial_fit, and the
+   first layer is re-expressed for the new scaling so the network's
+   output is unchanged before training continues
+3. a few partial_fit epochs run on the new rows
+4. old and updated model are scored on the holdout set; the update is
+   only exported (and published) if AUC does not drop by more than the
+   tolerance
+
+The watermark, scaler sample count and update history are kept in
+model/training_state.json.
+"""
+import copy
+import json
+import tempfile
+import time
+from pathlib import Path
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from app.training.evaluate import load_split, roc_auc
+from app.training.publish import export_model, publish
+from app.utils.dataset import ENCODED_FEATURES, encode_raw, read_raw
+from app.utils.preprocessing import PatientPreprocessor
+
+STATE_FILE = "training_state.json"
+ID_COLUMN = "encounter_id"
+
+
+# ======================================================
+# STATE / DATA
+# ======================================================
+
+def load_state(model_dir) -> dict:
+    path = Path(model_dir) / STATE_FILE
+    return json.loads(path.read_text()) if path.exists() else {"history": []}
+
+
+def load_new_records(csv_path, since=None):
+    """
+    Encoded X, y and max encounter_id of the rows newer than `since`
+    (every row when the file has no encounter_id column or since is None)
+    """
+    header = pd.read_csv(csv_path, nrows=0).columns
+    has_ids = ID_COLUMN in header
+    df = read_raw(csv_path, extra_columns=[ID_COLUMN] if has_ids else [])
+
+    last_id = None
+    if has_ids:
+        if since is not None:
+            df = df[df[ID_COLUMN] > since]
+        if len(df):
+            last_id = int(df[ID_COLUMN].max())
+
+    X, y = encode_raw(df)
+    return X, y, last_id
+
+
+# ======================================================
+# WARM-START UPDATE
+# ======================================================
+
+def rescale_first_layer(model, old_scaler, new_scaler):
+    """
+    Fold a scaler change into the first layer so that
+    ((x - m_new) / s_new) @ W' + b' == ((x - m_old) / s_old) @ W + b
+    """
+    ratio = np.asarray(new_scaler.scale_) / np.asarray(old_scaler.scale_)
+    shift = (np.asarray(new_scaler.mean_) - np.asarray(old_scaler.mean_)) / np.asarray(old_scaler.scale_)
+
+    W, b = model.coefs_[0], model.intercepts_[0]
+    model.intercepts_[0] = b + shift @ W
+    model.coefs_[0] = W * ratio[:, None]
+
+
+def update_model(model, scaler, feature_names, X_new, y_new, epochs=5, learning_rate=None):
+    """
+    Return an updated copy of (model, preprocessor) trained on the new rows
+    """
+    X_new = np.asarray(X_new)[:, [ENCODED_FEATURES.index(f) for f in feature_names]]
+
+    new_scaler = copy.deepcopy(scaler)
+    new_scaler.partial_fit(pd.DataFrame(X_new, columns=list(feature_names)))
+
+    model = copy.deepcopy(model)
+    rescale_first_layer(model, scaler, new_scaler)
+
+    # partial_fit refuses early_stopping (and a model fitted with it has no
+    # best_loss_); a new learning rate needs a fresh optimizer
+    model.early_stopping = False
+    model.verbose = False
+    if getattr(model, "best_loss_", None) is None:
+        model.best_loss_ = np.inf
+    if learning_rate is not None:
+        model.learning_rate_init = learning_rate
+        if hasattr(model, "_optimizer"):
+            del model._optimizer
+
+    preprocessor = PatientPreprocessor.from_artifacts(feature_names, new_scaler)
+    X_scaled = preprocessor.transform_encoded(X_new, feature_names)
+    for _ in range(epochs):
+        model.partial_fit(X_scaled, y_new)
+
+    return model, preprocessor
+
+
+def holdout_auc(model, preprocessor, X, y):
+    X_scaled = preprocessor.transform_encoded(X, ENCODED_FEATURES)
+    return roc_auc(model.predict_proba(X_scaled)[:, 1], y)
+
+
+# ======================================================
+# ENTRY POINT
+# ======================================================
+
+def incremental_retrain(model_dir, new_csv, holdout, out_dir=None, epochs=5, tolerance=0.002,
+                        since=None, learning_rate=None, publish_model=False, log=print) -> dict:
+    """
+    Update the model in model_dir with the new rows of new_csv.
+    Returns a report; report["accepted"] says whether the update passed the
+    holdout check (and was exported to out_dir / published).
+    """
+    model_dir = Path(model_dir)
+    state = load_state(model_dir)
+    since = since if since is not None else state.get("last_encounter_id")
+
+    X_new, y_new, last_id = load_new_records(new_csv, since)
+    report = {"new_rows": int(len(y_new)), "since_encounter_id": since, "accepted": False}
+    if not len(y_new):
+        log("ℹ️  No new records since the last update")
+        return report
+    if len(np.unique(y_new)) < 2:
+        log("⚠️  New records contain a single class; need both labels to update")
+        report["reason"] = "single_class"
+        return report
+
+    model = joblib.load(model_dir / "ann_model.pkl")
+    scaler = joblib.load(model_dir / "scaler.pkl")
+    feature_names = list(joblib.load(model_dir / "feature_names.pkl"))
+    old_preprocessor = PatientPreprocessor.from_artifacts(feature_names, scaler)
+
+    started = time.perf_counter()
+    new_model, new_preprocessor = update_model(
+        model, scaler, feature_names, X_new, y_new, epochs=epochs, learning_rate=learning_rate
+    )
+    fit_seconds = time.perf_counter() - started
+
+    X_hold, y_hold = load_split(holdout)
+    before = holdout_auc(model, old_preprocessor, X_hold, y_hold)
+    after = holdout_auc(new_model, new_preprocessor, X_hold, y_hold)
+    accepted = after >= before - tolerance
+
+    report.update({
+        "last_encounter_id": last_id,
+        "fit_seconds": round(fit_seconds, 2),
+        "holdout_auc_before": round(before, 5),
+        "holdout_auc_after": round(after, 5),
+        "tolerance": tolerance,
+        "accepted": accepted,
+    })
+    log(f"📊 {len(y_new):,} new rows, {epochs} epochs in {fit_seconds:.1f}s: "
+        f"holdout AUC {before:.4f} → {after:.4f}")
+
+    if not accepted:
+        log(f"❌ Rejected: AUC dropped by more than {tolerance}")
+        return report
+
+    state = {
+        "last_encounter_id": last_id if last_id is not None else since,
+        "n_samples_seen": int(np.max(new_preprocessor.scaler.n_samples_seen_)),
+        "history": state.get("history", []) + [{
+            "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            **{k: report[k] for k in ("new_rows", "holdout_auc_before", "holdout_auc_after")},
+        }],
+    }
+
+    with tempfile.TemporaryDirectory(prefix="retrain-") as tmp:
+        target = Path(out_dir) if out_dir else Path(tmp)
+        export_model(new_model, new_preprocessor, target)
+        (target / STATE_FILE).write_text(json.dumps(state, indent=2))
+        report["output_dir"] = str(out_dir) if out_dir else None
+
+        if publish_model:
+            publish(target, model_dir, extra_files=(STATE_FILE,))
+            report["published"] = True
+            log(f"🚀 Published to {model_dir}")
+
+    return report
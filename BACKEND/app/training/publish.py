@@ -0,0 +1,65 @@
+"""
+Write trained models in the model/ layout and publish them to the live
+model directory (used by tune.py and retrain.py)
+"""
+import importlib.util
+import os
+import shutil
+from pathlib import Path
+
+import joblib
+
+from app.model.quantize import QUANTIZED_FORMATS, weights_file
+
+# Files a training run produces; serving/ is re-exported from them
+MODEL_FILES = (
+    "ann_model.pkl", "scaler.pkl", "feature_names.pkl", "preprocessor.pkl", "ann_weights.npz",
+) + tuple(weights_file(fmt) for fmt in QUANTIZED_FORMATS)
+
+# Written only when the optional onnx package is installed
+OPTIONAL_FILES = ("model.onnx",)
+
+
+def export_model(model, preprocessor, out_dir) -> Path:
+    """
+    Write the artifacts app/model/predict.py loads, plus the NumPy,
+    quantized and memory-mapped serving exports
+    """
+    from app.model.artifacts import export_artifacts
+    from app.model.engine import export_weights
+    from app.model.quantize import export_quantized
+
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    joblib.dump(model, out_dir / "ann_model.pkl")
+    joblib.dump(preprocessor.scaler, out_dir / "scaler.pkl")
+    joblib.dump(list(preprocessor.feature_names), out_dir / "feature_names.pkl")
+    preprocessor.save(out_dir / "preprocessor.pkl")
+
+    export_weights(out_dir / "ann_model.pkl", out_dir / "ann_weights.npz")
+    for fmt in QUANTIZED_FORMATS:
+        export_quantized(out_dir / "ann_model.pkl", out_dir / weights_file(fmt), fmt)
+    if importlib.util.find_spec("onnx") is not None:
+        from app.model.onnx_engine import export_onnx
+
+        export_onnx(out_dir)
+    export_artifacts(out_dir)
+    return out_dir
+
+
+def publish(candidate_dir, model_dir, extra_files=()):
+    """
+    Copy a candidate's artifacts into the live model directory, one atomic
+    rename per file (running servers pick them up on their next reload check)
+    """
+    from app.model.artifacts import export_artifacts
+
+    candidate_dir, model_dir = Path(candidate_dir), Path(model_dir)
+    optional = [name for name in OPTIONAL_FILES if (candidate_dir / name).exists()]
+    for name in MODEL_FILES + tuple(optional) + tuple(extra_files):
+        tmp = model_dir / f".{name}.tmp-{os.getpid()}"
+        shutil.copy2(candidate_dir / name, tmp)
+        os.replace(tmp, model_dir / name)
+
+    export_artifacts(model_dir)
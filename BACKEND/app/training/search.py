@@ -0,0 +1,244 @@
+"""
+Parallel hyperparameter search for the MLP.
+
+The cached training matrix (app.utils.dataset) is split and scaled once,
+written as .npy files and memory-mapped by every worker, so N processes
+share one copy of the data. Each trial trains epoch by epoch with
+partial_fit, scores validation AUC after every epoch and stops on its own
+when it stops improving — or early, when it is clearly behind the best
+trial seen so far by any worker.
+
+The best trial is evaluated on the held-out test split and exported in
+the model/ layout the API loads (ann_model.pkl, scaler.pkl,
+feature_names.pkl, preprocessor.pkl, ann_weights.npz, serving/).
+"""
+import itertools
+import json
+import multiprocessing
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+import numpy as np
+
+from app.training.publish import export_model
+from app.utils.dataset import RANDOM_STATE, TEST_SIZE, load_dataset
+from app.utils.preprocessing import PatientPreprocessor
+
+# Values tried per hyperparameter (grid: every combination, random: a sample)
+DEFAULT_SPACE = {
+    "hidden_layer_sizes": [(64,), (128, 64), (128, 64, 32), (64, 128, 64)],
+    "alpha": [1e-4, 1e-3, 1e-2],
+    "batch_size": [64, 200, 512],
+    "learning_rate_init": [1e-3, 3e-3],
+}
+
+# Share of the training split held out for early stopping
+VALIDATION_SIZE = 0.1
+
+
+# ======================================================
+# SEARCH SPACE
+# ======================================================
+
+def load_space(path=None) -> dict:
+    """
+    DEFAULT_SPACE, or a JSON file of {param: [values...]}
+    """
+    if path is None:
+        return DEFAULT_SPACE
+    space = json.loads(Path(path).read_text())
+    if "hidden_layer_sizes" in space:
+        space["hidden_layer_sizes"] = [tuple(h) for h in space["hidden_layer_sizes"]]
+    return space
+
+
+def make_trials(space, mode="grid", n_trials=None, seed=RANDOM_STATE) -> list:
+    """
+    List of parameter dicts: the full grid, or n_trials distinct random picks
+    """
+    names = list(space)
+    grid = [dict(zip(names, values)) for values in itertools.product(*space.values())]
+    if mode == "grid":
+        return grid[:n_trials] if n_trials else grid
+    if mode == "random":
+        rng = np.random.default_rng(seed)
+        n = min(n_trials or 20, len(grid))
+        return [grid[i] for i in rng.choice(len(grid), size=n, replace=False)]
+    raise ValueError(f"Unknown search mode: {mode}")
+
+
+# ======================================================
+# SHARED DATA
+# ======================================================
+
+def prepare_data(csv_path, work_dir):
+    """
+    Split + scale the cached dataset once and write the arrays the workers
+    memory-map. Returns (preprocessor, X_test, y_test).
+    """
+    from sklearn.model_selection import train_test_split
+
+    data = load_dataset(csv_path)
+    index = np.arange(len(data))
+    train_idx, test_idx = train_test_split(
+        index, test_size=TEST_SIZE, stratify=data.y, random_state=RANDOM_STATE
+    )
+    fit_idx, val_idx = train_test_split(
+        train_idx, test_size=VALIDATION_SIZE, stratify=data.y[train_idx], random_state=RANDOM_STATE
+    )
+
+    preprocessor = PatientPreprocessor().fit_encoded(data.X[train_idx], data.feature_names)
+
+    def scaled(idx):
+        return preprocessor.transform_encoded(data.X[idx], data.feature_names)
+
+    work_dir = Path(work_dir)
+    np.save(work_dir / "X_fit.npy", scaled(fit_idx))
+    np.save(work_dir / "y_fit.npy", np.asarray(data.y[fit_idx]))
+    np.save(work_dir / "X_val.npy", scaled(val_idx))
+    np.save(work_dir / "y_val.npy", np.asarray(data.y[val_idx]))
+
+    return preprocessor, scaled(test_idx), np.asarray(data.y[test_idx])
+
+
+# ======================================================
+# TRIALS (RUN IN WORKER PROCESSES)
+# ======================================================
+
+_arrays = None
+_best_auc = None
+
+
+def _init_worker(work_dir, best_auc):
+    global _arrays, _best_auc
+    from threadpoolctl import threadpool_limits
+
+    # One BLAS thread per process: the pool already uses every core
+    threadpool_limits(1)
+    work_dir = Path(work_dir)
+    _arrays = {
+        name: np.load(work_dir / f"{name}.npy", mmap_mode="r")
+        for name in ("X_fit", "y_fit", "X_val", "y_val")
+    }
+    _best_auc = best_auc
+
+
+def run_trial(params, max_epochs=200, patience=10, grace_epochs=5, abort_margin=0.02, seed=RANDOM_STATE):
+    """
+    Train one configuration; returns a result dict (with the fitted model
+    unless the trial was aborted)
+    """
+    import warnings
+
+    from sklearn.exceptions import ConvergenceWarning
+    from sklearn.metrics import roc_auc_score
+    from sklearn.neural_network import MLPClassifier
+
+    X_fit, y_fit = _arrays["X_fit"], _arrays["y_fit"]
+    X_val, y_val = _arrays["X_val"], _arrays["y_val"]
+    classes = np.unique(y_fit)
+
+    model = MLPClassifier(activation="relu", solver="adam", random_state=seed, **params)
+    best_auc, best_epoch, best_state = -np.inf, 0, None
+    status = "completed"
+    started = time.perf_counter()
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", ConvergenceWarning)
+        for epoch in range(1, max_epochs + 1):
+            model.partial_fit(X_fit, y_fit, classes=classes)
+            auc = roc_auc_score(y_val, model.predict_proba(X_val)[:, 1])
+
+            if auc > best_auc:
+                best_auc, best_epoch = auc, epoch
+                best_state = ([c.copy() for c in model.coefs_], [b.copy() for b in model.intercepts_])
+                with _best_auc.get_lock():
+                    _best_auc.value = max(_best_auc.value, auc)
+            elif epoch - best_epoch >= patience:
+                status = "early_stopped"
+                break
+
+            if epoch >= grace_epochs and best_auc < _best_auc.value - abort_margin:
+                status = "aborted"
+                break
+
+    result = {
+        "params": {k: list(v) if isinstance(v, tuple) else v for k, v in params.items()},
+        "val_auc": round(float(best_auc), 5),
+        "best_epoch": best_epoch,
+        "epochs": epoch,
+        "fit_seconds": round(time.perf_counter() - started, 2),
+        "status": status,
+    }
+    if status != "aborted":
+        model.coefs_, model.intercepts_ = best_state
+        result["model"] = model
+    return result
+
+
+# ======================================================
+# ENTRY POINT
+# ======================================================
+
+def search(csv_path, out_dir, space=None, mode="grid", n_trials=None, workers=None,
+           max_epochs=200, patience=10, grace_epochs=5, abort_margin=0.02, log=print):
+    """
+    Run the search and export the best model to out_dir.
+    Returns the summary that is also written to out_dir/search_results.json.
+    """
+    from sklearn.metrics import accuracy_score, roc_auc_score
+
+    trials = make_trials(space or DEFAULT_SPACE, mode, n_trials)
+    if not trials:
+        raise ValueError("The search space yields no trials")
+    workers = workers or os.cpu_count() or 1
+    best_auc = multiprocessing.Value("d", 0.0)
+    results = []
+
+    with tempfile.TemporaryDirectory(prefix="mlp-search-") as work_dir:
+        preprocessor, X_test, y_test = prepare_data(csv_path, work_dir)
+        log(f"🔍 {len(trials)} trials ({mode}) on {workers} worker(s)")
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(work_dir, best_auc),
+        ) as pool:
+            futures = {
+                pool.submit(run_trial, params, max_epochs, patience, grace_epochs, abort_margin): params
+                for params in trials
+            }
+            for n, future in enumerate(as_completed(futures), start=1):
+                result = future.result()
+                results.append(result)
+                icon = "✂️ " if result["status"] == "aborted" else "✅"
+                log(f"  {icon} [{n}/{len(trials)}] {result['params']} "
+                    f"AUC {result['val_auc']:.4f} in {result['fit_seconds']:.1f}s "
+                    f"({result['epochs']} epochs, {result['status']})")
+
+    finished = [r for r in results if "model" in r]
+    if not finished:
+        raise RuntimeError(f"No trial finished: all {len(results)} were aborted")
+    best = max(finished, key=lambda r: r["val_auc"])
+    model = best.pop("model")
+    for r in finished:
+        r.pop("model", None)
+
+    y_proba = model.predict_proba(X_test)[:, 1]
+    summary = {
+        "best": {
+            **best,
+            "test_auc": round(float(roc_auc_score(y_test, y_proba)), 5),
+            "test_accuracy": round(float(accuracy_score(y_test, (y_proba >= 0.5).astype(int))), 5),
+        },
+        "mode": mode,
+        "workers": workers,
+        "trials": sorted(results, key=lambda r: -r["val_auc"]),
+    }
+
+    export_model(model, preprocessor, out_dir)
+    (Path(out_dir) / "search_results.json").write_text(json.dumps(summary, indent=2))
+    return summary
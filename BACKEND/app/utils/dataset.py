@@ -0,0 +1,179 @@
+"""
+Fast loader for the training registry (data/diabetic_data.csv).
+
+Only the columns the model needs are parsed, with compact dtypes. The
+cleaned, one-hot encoded matrix and the high_risk target are cached as
+.npy files keyed on the CSV's content hash, so repeat training and
+verification runs memory-map them instead of parsing the CSV again:
+
+    data/.cache/<sha256[:16]>/
+    ├── meta.json   ← source file, row count, feature names
+    ├── X.npy       ← (n, 11) int16, columns of get_dummies(drop_first=True)
+    └── y.npy       ← (n,) int8 high_risk target
+
+Usage:
+    from app.utils.dataset import load_dataset
+    data = load_dataset("data/diabetic_data.csv")
+    data.X, data.y, data.feature_names
+"""
+import json
+import os
+import shutil
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from app.model.engine import file_sha256
+from app.utils.preprocessing import PATIENT_FEATURES, clean_patient_frame, make_target
+
+CACHE_DIR_NAME = ".cache"
+CACHE_FORMAT = 1
+
+# Held-out test split used by the search and the evaluation report
+# (same as the retraining notebook and verify_accuracy.py)
+TEST_SIZE = 0.2
+RANDOM_STATE = 42
+
+# Registry columns read from the CSV (features + what make_target needs)
+RAW_COLUMNS = PATIENT_FEATURES + ["A1Cresult", "max_glu_serum"]
+
+RAW_DTYPES = {
+    "age": "category",
+    "gender": "category",
+    "insulin": "category",
+    "diabetesMed": "category",
+    "A1Cresult": "category",
+    "max_glu_serum": "category",
+    "time_in_hospital": "int8",
+    "number_inpatient": "int8",
+    "number_diagnoses": "int8",
+    "num_lab_procedures": "int16",
+    "num_medications": "int16",
+    "number_outpatient": "int16",
+    "number_emergency": "int16",
+}
+
+# Value that becomes the 1 of each drop_first=True dummy after cleaning
+DUMMY_VALUES = {"gender": "Male", "insulin": "Yes", "diabetesMed": "Yes"}
+
+NUMERIC_FEATURES = [f for f in PATIENT_FEATURES if f not in DUMMY_VALUES]
+
+# Column order of get_dummies(drop_first=True) on the cleaned frame
+ENCODED_FEATURES = NUMERIC_FEATURES + [f"{f}_{v}" for f, v in DUMMY_VALUES.items()]
+
+
+class Dataset:
+    """
+    Encoded feature matrix + target of one source file
+    """
+
+    def __init__(self, X, y, feature_names, digest, from_cache=False):
+        self.X = X
+        self.y = y
+        self.feature_names = list(feature_names)
+        self.digest = digest
+        self.from_cache = from_cache
+
+    def __len__(self):
+        return len(self.y)
+
+
+# ======================================================
+# CSV → ENCODED MATRIX
+# ======================================================
+
+def read_raw(path, extra_columns=()):
+    """
+    Read only RAW_COLUMNS (+ extra_columns) with compact dtypes ("?" becomes
+    missing). Falls back to float numerics if a count column has missing values.
+    """
+    columns = RAW_COLUMNS + list(extra_columns)
+    try:
+        return pd.read_csv(path, usecols=columns, dtype=RAW_DTYPES, na_values=["?"])
+    except ValueError:
+        dtypes = {c: ("float32" if t.startswith("int") else t) for c, t in RAW_DTYPES.items()}
+        return pd.read_csv(path, usecols=columns, dtype=dtypes, na_values=["?"])
+
+
+def encode_frame(X):
+    """
+    Cleaned PatientInput frame → (n, 11) int16 matrix in ENCODED_FEATURES
+    order; missing numerics become 0 like reindex(fill_value=0)
+    """
+    out = np.empty((len(X), len(ENCODED_FEATURES)), dtype=np.int16)
+    for i, name in enumerate(NUMERIC_FEATURES):
+        out[:, i] = X[name].to_numpy(dtype=np.float64, na_value=0.0)
+    for i, (name, value) in enumerate(DUMMY_VALUES.items(), start=len(NUMERIC_FEATURES)):
+        out[:, i] = (X[name] == value).to_numpy(dtype=bool, na_value=False)
+    return out
+
+
+def encode_raw(df):
+    """
+    Raw registry frame → (encoded int16 X, int8 high_risk y)
+    """
+    return encode_frame(clean_patient_frame(df)), make_target(df).to_numpy(dtype=np.int8)
+
+
+# ======================================================
+# CACHED LOAD
+# ======================================================
+
+def cache_path(csv_path, digest, cache_dir=None) -> Path:
+    cache_dir = Path(cache_dir) if cache_dir else Path(csv_path).parent / CACHE_DIR_NAME
+    return cache_dir / digest[:16]
+
+
+def _read_cache(path, digest):
+    meta_path = path / "meta.json"
+    if not meta_path.exists():
+        return None
+    meta = json.loads(meta_path.read_text())
+    if meta.get("format") != CACHE_FORMAT or meta.get("sha256") != digest:
+        return None
+    X = np.load(path / "X.npy", mmap_mode="r")
+    y = np.load(path / "y.npy", mmap_mode="r")
+    return Dataset(X, y, meta["feature_names"], digest, from_cache=True)
+
+
+def _write_cache(path, dataset, source):
+    tmp = path.with_name(f"{path.name}.tmp-{os.getpid()}")
+    shutil.rmtree(tmp, ignore_errors=True)
+    tmp.mkdir(parents=True)
+
+    np.save(tmp / "X.npy", dataset.X)
+    np.save(tmp / "y.npy", dataset.y)
+    meta = {
+        "format": CACHE_FORMAT,
+        "sha256": dataset.digest,
+        "source": str(source),
+        "rows": len(dataset),
+        "feature_names": dataset.feature_names,
+    }
+    (tmp / "meta.json").write_text(json.dumps(meta, indent=2))
+
+    shutil.rmtree(path, ignore_errors=True)
+    tmp.rename(path)
+
+
+def load_dataset(csv_path, cache_dir=None, refresh=False, cache=True) -> Dataset:
+    """
+    Encoded X + target for csv_path, from the cache when the file is
+    unchanged. refresh=True rebuilds the cache; cache=False never touches it.
+    """
+    csv_path = Path(csv_path)
+    digest = file_sha256(csv_path)
+    path = cache_path(csv_path, digest, cache_dir)
+
+    if cache and not refresh:
+        dataset = _read_cache(path, digest)
+        if dataset is not None:
+            return dataset
+
+    X, y = encode_raw(read_raw(csv_path))
+    dataset = Dataset(X, y, ENCODED_FEATURES, digest)
+
+    if cache:
+        _write_cache(path, dataset, csv_path)
+    return dataset
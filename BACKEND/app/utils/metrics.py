@@ -0,0 +1,262 @@
+"""
+In-process metrics in Prometheus text format (no client library needed).
+
+Counters and histograms are plain dicts behind a lock, so an observation
+costs two perf_counter calls, a bisect and a dict update — cheap enough to
+leave on under full load. With METRICS_ENABLED=0 every timer is a shared
+no-op and nothing is recorded.
+"""
+import bisect
+import threading
+import time
+
+from app.config import METRICS_ENABLED
+
+# Upper bounds (seconds) of the latency histogram buckets
+LATENCY_BUCKETS = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005,
+    0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5,
+)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _format_labels(names, values, extra=None):
+    pairs = list(zip(names, values)) + (extra or [])
+    if not pairs:
+        return ""
+    escaped = (
+        k + '="' + str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") + '"'
+        for k, v in pairs
+    )
+    return "{" + ",".join(escaped) + "}"
+
+
+def _format_value(value):
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+# ======================================================
+# METRIC TYPES
+# ======================================================
+
+class Counter:
+    type = "counter"
+
+    def __init__(self, name, documentation, labels=()):
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *label_values, amount=1):
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def value(self, *label_values):
+        return self._values.get(label_values, 0)
+
+    def lines(self):
+        with self._lock:
+            values = sorted(self._values.items())
+        for label_values, value in values:
+            yield f"{self.name}{_format_labels(self.labels, label_values)} {_format_value(value)}"
+
+
+class Histogram:
+    type = "histogram"
+
+    def __init__(self, name, documentation, labels=(), buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self.buckets = tuple(buckets)
+        self._series = {}  # label values -> [bucket counts..., +Inf count, sum]
+        self._lock = threading.Lock()
+
+    def observe(self, value, *label_values):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(label_values)
+            if series is None:
+                series = self._series[label_values] = [0] * (len(self.buckets) + 1) + [0.0]
+            series[index] += 1
+            series[-1] += value
+
+    def count(self, *label_values):
+        series = self._series.get(label_values)
+        return sum(series[:-1]) if series else 0
+
+    def lines(self):
+        with self._lock:
+            series = sorted((k, list(v)) for k, v in self._series.items())
+        for label_values, counts in series:
+            cumulative = 0
+            for bound, n in zip(self.buckets + (float("inf"),), counts[:-1]):
+                cumulative += n
+                le = [("le", _format_value(float(bound)))]
+                yield f"{self.name}_bucket{_format_labels(self.labels, label_values, le)} {cumulative}"
+            labels = _format_labels(self.labels, label_values)
+            yield f"{self.name}_sum{labels} {_format_value(counts[-1])}"
+            yield f"{self.name}_count{labels} {cumulative}"
+
+
+class _StageTimer:
+    __slots__ = ("_histogram", "_stage", "_start")
+
+    def __init__(self, histogram, stage):
+        self._histogram = histogram
+        self._stage = stage
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self._histogram.observe(time.perf_counter() - self._start, self._stage)
+        return False
+
+
+class _NullTimer:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+# ======================================================
+# REGISTRY
+# ======================================================
+
+class MetricsRegistry:
+    """
+    Owns the metrics and renders them. Other components (cache, batcher,
+    model registry) add their own numbers at scrape time via collectors.
+    """
+
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self._metrics = []
+        self._collectors = []
+
+    def counter(self, name, documentation, labels=()):
+        metric = Counter(name, documentation, labels)
+        self._metrics.append(metric)
+        return metric
+
+    def histogram(self, name, documentation, labels=(), buckets=LATENCY_BUCKETS):
+        metric = Histogram(name, documentation, labels, buckets)
+        self._metrics.append(metric)
+        return metric
+
+    def collector(self, fn):
+        """
+        Register fn() -> [(name, type, help, [(labels_dict, value), ...]), ...]
+        """
+        self._collectors.append(fn)
+        return fn
+
+    def render(self) -> str:
+        out = []
+        for metric in self._metrics:
+            out.append(f"# HELP {metric.name} {metric.documentation}")
+            out.append(f"# TYPE {metric.name} {metric.type}")
+            out.extend(metric.lines())
+
+        for collect in self._collectors:
+            for name, metric_type, documentation, samples in collect():
+                out.append(f"# HELP {name} {documentation}")
+                out.append(f"# TYPE {name} {metric_type}")
+                for labels, value in samples:
+                    names, values = zip(*labels.items()) if labels else ((), ())
+                    out.append(f"{name}{_format_labels(names, values)} {_format_value(value)}")
+
+        return "\n".join(out) + "\n"
+
+
+metrics = MetricsRegistry(enabled=METRICS_ENABLED)
+
+HTTP_REQUESTS = metrics.counter(
+    "http_requests_total", "HTTP requests by method, route and status code",
+    ("method", "route", "status"),
+)
+HTTP_LATENCY = metrics.histogram(
+    "http_request_duration_seconds", "HTTP request latency by method and route",
+    ("method", "route"),
+)
+PREDICTIONS = metrics.counter(
+    "predictions_total", "Patient records answered, by source (model or cache)",
+    ("source",),
+)
+PREDICTION_ERRORS = metrics.counter(
+    "prediction_errors_total", "Failed predictions by exception type",
+    ("type",),
+)
+STAGE_LATENCY = metrics.histogram(
+    "prediction_stage_duration_seconds", "Time spent in each prediction stage",
+    ("stage",),
+)
+
+
+def time_stage(stage):
+    """
+    `with time_stage("inference"): ...` — records into STAGE_LATENCY
+    """
+    if not metrics.enabled:
+        return _NULL_TIMER
+    return _StageTimer(STAGE_LATENCY, stage)
+
+
+def count_error(error):
+    if metrics.enabled:
+        PREDICTION_ERRORS.inc(type(error).__name__)
+
+
+def count_predictions(source, n=1):
+    if metrics.enabled and n:
+        PREDICTIONS.inc(source, amount=n)
+
+
+# ======================================================
+# ASGI MIDDLEWARE
+# ======================================================
+
+class MetricsMiddleware:
+    """
+    Count and time every HTTP request. Requests are labelled with the route
+    template (e.g. /api/predict), never the raw path, to keep cardinality low.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not metrics.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status = 500
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            route = getattr(scope.get("route"), "path", "unmatched")
+            method = scope["method"]
+            HTTP_LATENCY.observe(time.perf_counter() - start, method, route)
+            HTTP_REQUESTS.inc(method, route, str(status))
@@ -1,58 +1,237 @@
 """
-Utility functions for data preprocessing
+Shared preprocessing pipeline for training, verification and serving
+
+One fitted PatientPreprocessor (saved as model/preprocessor.pkl next to the
+model) owns the whole raw-data → model-matrix path, so the notebook,
+verify_accuracy.py, score.py and the API cannot drift apart.
+
+pandas, joblib and sklearn are imported inside the functions that need them:
+the serving path (transform_record / transform_records) is NumPy only and
+must not pull them into the API's import graph.
 """
-import pandas as pd
 import numpy as np
-from sklearn.preprocessing import StandardScaler
-
-def load_and_preprocess_data(filepath):
-    """
-    Load and preprocess diabetic retinopathy dataset
-    
-    Args:
-        filepath (str): Path to CSV file
-    
-    Returns:
-        tuple: (X_scaled, y, scaler, feature_names)
-    """
-    # Load data
-    df = pd.read_csv(filepath)
-    
-    # Separate features and target
-    X = df.drop('diagnosis', axis=1)
-    y = df['diagnosis']
-    
-    # Get feature names
-    feature_names = X.columns.tolist()
-    
-    # Scale features
-    scaler = StandardScaler()
-    X_scaled = scaler.fit_transform(X)
-    
-    return X_scaled, y, scaler, feature_names
-
-def prepare_single_sample(patient_data, scaler, feature_names):
-    """
-    Prepare a single patient sample for prediction
-    
-    Args:
-        patient_data (dict): Patient features
-        scaler (StandardScaler): Fitted scaler
-        feature_names (list): Expected feature names
-    
-    Returns:
-        np.array: Scaled features for prediction
-    """
-    # Create array in correct order
-    features = []
-    for feature in feature_names:
-        if feature in patient_data:
-            features.append(float(patient_data[feature]))
-        else:
-            raise ValueError(f"Missing feature: {feature}")
-    
-    # Convert to array and scale
-    features_array = np.array([features])
-    features_scaled = scaler.transform(features_array)
-    
-    return features_scaled
\ No newline at end of file
+
+from app.model.encoder import FeatureEncoder
+
+# ======================================================
+# RAW REGISTRY DATA → FRONTEND SCHEMA
+# Same cleaning as notebooks/06_retrain_model_for_frontend.ipynb
+# ======================================================
+
+# Inputs the model is trained on (the PatientInput fields)
+PATIENT_FEATURES = [
+    "age", "gender", "time_in_hospital",
+    "num_lab_procedures", "num_medications",
+    "number_outpatient", "number_emergency",
+    "number_inpatient", "number_diagnoses",
+    "insulin", "diabetesMed"
+]
+
+AGE_MAP = {
+    '[0-10)': 5, '[10-20)': 15, '[20-30)': 25,
+    '[30-40)': 35, '[40-50)': 45, '[50-60)': 55,
+    '[60-70)': 65, '[70-80)': 75, '[80-90)': 85,
+    '[90-100)': 95
+}
+
+# Raw registry values → "Male"/"Female" and "Yes"/"No" (frontend values map to themselves)
+GENDER_MAP = {'Male': 'Male', 'Female': 'Female', 'Unknown/Invalid': 'Male'}
+INSULIN_MAP = {'Up': 'Yes', 'Down': 'Yes', 'Steady': 'Yes', 'No': 'No', 'Yes': 'Yes'}
+DIABETES_MED_MAP = {'Yes': 'Yes', 'No': 'No', 'Ch': 'Yes'}
+
+
+def clean_patient_frame(df):
+    """
+    Reduce a raw diabetic_data.csv-style frame to the cleaned PatientInput
+    columns: "?" → missing, age brackets → midpoints, categorical values
+    normalized to what the frontend sends.
+
+    Already-clean frames (integer ages, Yes/No values) pass through unchanged.
+    """
+    import pandas as pd
+
+    X = df[PATIENT_FEATURES].replace("?", np.nan)
+
+    if not pd.api.types.is_numeric_dtype(X["age"]):
+        bracket = X["age"].map(AGE_MAP)
+        X["age"] = bracket.fillna(pd.to_numeric(X["age"], errors="coerce"))
+
+    X["gender"] = X["gender"].map(GENDER_MAP).fillna("Male")
+    X["insulin"] = X["insulin"].map(INSULIN_MAP).fillna("No")
+    X["diabetesMed"] = X["diabetesMed"].map(DIABETES_MED_MAP).fillna("No")
+
+    return X
+
+
+def make_target(df):
+    """
+    high_risk label: A1C > 7/8, glucose > 300 or 7+ diagnoses
+    """
+    import pandas as pd
+
+    return pd.Series(
+        np.where(
+            (df["A1Cresult"].isin([">8", ">7"])) |
+            (df["max_glu_serum"] == ">300") |
+            (pd.to_numeric(df["number_diagnoses"], errors="coerce") >= 7),
+            1, 0
+        ),
+        index=df.index,
+        name="high_risk",
+    )
+
+
+def decode_dummies_frame(X):
+    """
+    Rebuild cleaned PatientInput columns from a frame of raw get_dummies
+    columns, as stored in data/X_test.csv (gender incl. Unknown/Invalid,
+    insulin Down/No/Steady/Up), normalized like clean_patient_frame.
+    """
+    numeric = [f for f in PATIENT_FEATURES if f not in ("gender", "insulin", "diabetesMed")]
+    out = X[numeric].astype(int)
+
+    male = X["gender_Male"].astype(bool)
+    if "gender_Unknown/Invalid" in X:
+        male |= X["gender_Unknown/Invalid"].astype(bool)
+
+    out.insert(1, "gender", np.where(male, "Male", "Female"))
+    out["insulin"] = np.where(X["insulin_No"].astype(bool), "No", "Yes")
+    out["diabetesMed"] = np.where(X["diabetesMed_Yes"].astype(bool), "Yes", "No")
+    return out
+
+
+# ======================================================
+# FITTED PREPROCESSOR
+# ======================================================
+
+class PatientPreprocessor:
+    """
+    Cleaning + one-hot encoding + standardization fitted on training data.
+
+    transform_frame  - bulk path, pure column operations
+    transform_encoded - cached training matrix (app.utils.dataset)
+    transform_columns - column arrays of Arrow / Parquet batch requests
+    transform_record - serving path, one PatientInput dict → one row
+    """
+
+    def __init__(self):
+        self.feature_names = None
+        self.scaler = None
+        self.encoder = None
+
+    # --------------------------------------------------
+    # FIT / BUILD
+    # --------------------------------------------------
+
+    def fit(self, X):
+        """
+        Fit on cleaned training rows (see clean_patient_frame).
+        Columns follow get_dummies(drop_first=True), as in training.
+        """
+        import pandas as pd
+        from sklearn.preprocessing import StandardScaler
+
+        encoded = pd.get_dummies(X[PATIENT_FEATURES], drop_first=True)
+        self.feature_names = list(encoded.columns)
+        self.scaler = StandardScaler().fit(encoded)
+        self.encoder = FeatureEncoder(self.feature_names, self.scaler)
+        return self
+
+    def fit_encoded(self, X, feature_names):
+        """
+        Fit on an already encoded matrix whose columns are feature_names
+        (e.g. the cached matrix from app.utils.dataset.load_dataset)
+        """
+        import pandas as pd
+        from sklearn.preprocessing import StandardScaler
+
+        self.feature_names = list(feature_names)
+        self.scaler = StandardScaler().fit(pd.DataFrame(np.asarray(X), columns=self.feature_names))
+        self.encoder = FeatureEncoder(self.feature_names, self.scaler)
+        return self
+
+    @classmethod
+    def from_artifacts(cls, feature_names, scaler):
+        """
+        Build from feature_names.pkl + a fitted scaler (or ScalerParams)
+        """
+        pre = cls()
+        pre.feature_names = list(feature_names)
+        pre.scaler = scaler
+        pre.encoder = FeatureEncoder(pre.feature_names, scaler)
+        return pre
+
+    # --------------------------------------------------
+    # TRANSFORM
+    # --------------------------------------------------
+
+    def _check_fitted(self):
+        if self.encoder is None:
+            raise ValueError("PatientPreprocessor is not fitted")
+
+    def transform_frame(self, df, clean=True):
+        """
+        Raw (or already cleaned) DataFrame → scaled (n, n_features) matrix
+        """
+        self._check_fitted()
+        return self.encoder.transform_frame(clean_patient_frame(df) if clean else df)
+
+    def transform_encoded(self, X, feature_names):
+        """
+        Encoded (n, k) matrix with columns feature_names → scaled (n, n_features)
+        """
+        self._check_fitted()
+        columns = {name: i for i, name in enumerate(feature_names)}
+        missing = [f for f in self.feature_names if f not in columns]
+        if missing:
+            raise ValueError(f"Encoded matrix is missing features: {missing}")
+
+        X = np.asarray(X)[:, [columns[f] for f in self.feature_names]].astype(np.float64)
+        X -= np.asarray(self.scaler.mean_, dtype=np.float64)
+        X /= np.asarray(self.scaler.scale_, dtype=np.float64)
+        return X
+
+    def transform_columns(self, columns, n_rows):
+        """
+        Validated PatientInput columns ({field: ndarray}) → scaled (n_rows, n_features)
+        """
+        self._check_fitted()
+        return self.encoder.transform_columns(columns, n_rows)
+
+    def transform_record(self, record):
+        """
+        Validated PatientInput dict → scaled (1, n_features) row
+        """
+        self._check_fitted()
+        return self.encoder.transform(record)
+
+    def transform_records(self, records):
+        """
+        List of PatientInput dicts → scaled (n, n_features) matrix
+        """
+        self._check_fitted()
+        return self.encoder.transform_many(records)
+
+    # --------------------------------------------------
+    # PERSISTENCE
+    # --------------------------------------------------
+
+    def __getstate__(self):
+        # The compiled encoder is rebuilt on load
+        return {"feature_names": self.feature_names, "scaler": self.scaler}
+
+    def __setstate__(self, state):
+        self.feature_names = state["feature_names"]
+        self.scaler = state["scaler"]
+        self.encoder = FeatureEncoder(self.feature_names, self.scaler) if self.scaler is not None else None
+
+    def save(self, path):
+        import joblib
+
+        joblib.dump(self, path)
+
+    @staticmethod
+    def load(path):
+        import joblib
+
+        return joblib.load(path)
@@ -0,0 +1,75 @@
+"""
+Thread budget of one serving node.
+
+Every uvicorn worker runs INFERENCE_WORKERS inference threads, and every
+model call may fan out to BLAS_THREADS OpenBLAS / MKL / OpenMP threads, so
+a node runs up to
+
+    WEB_WORKERS × INFERENCE_WORKERS × BLAS_THREADS
+
+compute threads. Above the core count they only preempt each other. The
+MLP's matrices are small enough that one BLAS thread per call is usually
+fastest; benchmarks/bench_threads.py measures every split for a node.
+
+BLAS limits are applied twice: as environment variables before NumPy is
+imported (run.py, inherited by every worker process) and with threadpoolctl
+at startup and in every inference thread (OpenMP limits are per thread).
+threadpoolctl is optional; without it only the environment variables apply.
+"""
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+BLAS_ENV_VARS = (
+    "OMP_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "BLIS_NUM_THREADS",
+    "VECLIB_MAXIMUM_THREADS",
+)
+
+
+def available_cores() -> int:
+    """
+    Cores this process may run on (CPU affinity / cpuset aware where supported)
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def set_thread_env(blas_threads: int):
+    """
+    BLAS thread environment variables for NumPy imported after this call
+    (variables that are already set win)
+    """
+    for name in BLAS_ENV_VARS:
+        os.environ.setdefault(name, str(blas_threads))
+
+
+def limit_blas_threads(blas_threads: int) -> list:
+    """
+    Limit the already loaded BLAS / OpenMP libraries to blas_threads.
+    Returns [(library, num_threads)] after the change.
+    """
+    try:
+        from threadpoolctl import threadpool_info, threadpool_limits
+    except ImportError:
+        logger.debug("threadpoolctl is not installed, BLAS limits come from the environment only")
+        return []
+
+    threadpool_limits(limits=blas_threads)
+    return [(lib["internal_api"], lib["num_threads"]) for lib in threadpool_info()]
+
+
+def thread_plan(cores, web_workers, inference_workers, blas_threads) -> dict:
+    compute_threads = web_workers * inference_workers * blas_threads
+    return {
+        "cores": cores,
+        "web_workers": web_workers,
+        "inference_workers": inference_workers,
+        "blas_threads": blas_threads,
+        "compute_threads": compute_threads,
+        "oversubscribed": compute_threads > cores,
+    }
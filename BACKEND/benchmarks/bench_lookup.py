@@ -0,0 +1,101 @@
+"""
+Lookup-table scorer (app/model/lookup.py) vs the full model path.
+
+    scoring    - transform_record + predict_proba  vs  LookupScorer.predict_one
+    end_to_end - predict_diabetic_retinopathy with and without lookup tables
+    batch      - transform_records + predict_proba vs  LookupScorer.predict_positive
+
+Rows are sampled from data/X_test.csv; the prediction cache is disabled.
+
+    python benchmarks/bench_lookup.py
+    python benchmarks/bench_lookup.py --iterations 20000 --batch-sizes 16 1024
+"""
+import argparse
+import time
+import warnings
+
+import numpy as np
+
+from common import load_sample_records, print_table, summarize, write_results
+
+from app.config import LOOKUP_MAX_VALUE
+from app.model import predict as predict_module
+from app.model.lookup import LookupScorer
+from app.model.predict import predict_diabetic_retinopathy
+
+WARMUP = 200
+
+
+def timed(fn, calls, rows_per_call=1):
+    for args in calls[:WARMUP]:
+        fn(*args)
+    samples = []
+    for args in calls:
+        start = time.perf_counter_ns()
+        fn(*args)
+        samples.append(time.perf_counter_ns() - start)
+    return summarize(samples, rows_per_call)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark lookup-table scoring")
+    parser.add_argument("--iterations", type=int, default=5000)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[16, 256, 4096])
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="result file (default: benchmarks/results/lookup-<commit>.json)")
+    args = parser.parse_args()
+
+    warnings.filterwarnings("ignore")
+    predict_module.cache.max_size = 0
+
+    bundle = predict_module.registry.get()
+    started = time.perf_counter()
+    scorer = LookupScorer(bundle.model, bundle.preprocessor, LOOKUP_MAX_VALUE)
+    build_ms = (time.perf_counter() - started) * 1000
+    records = load_sample_records(max(args.iterations, max(args.batch_sizes)), seed=args.seed)
+
+    full = bundle.model.predict_proba(bundle.preprocessor.transform_records(records))[:, 1]
+    max_diff = float(np.max(np.abs(scorer.predict_positive(records) - full)))
+    print(f"🚀 Model {bundle.version}: tables {scorer.nbytes / 1024:.0f} KiB built in {build_ms:.1f} ms, "
+          f"max |Δp| vs full model {max_diff:.1e}")
+
+    calls = [(r,) for r in records[:args.iterations]]
+
+    def full_one(r):
+        return float(bundle.model.predict_proba(bundle.preprocessor.transform_record(r))[0][1])
+
+    scoring = {"full": timed(full_one, calls), "lookup": timed(scorer.predict_one, calls)}
+    print_table("🔹 scoring (one record)", scoring)
+
+    bundle.lookup = None
+    end_to_end = {"full": timed(predict_diabetic_retinopathy, calls)}
+    bundle.lookup = scorer
+    end_to_end["lookup"] = timed(predict_diabetic_retinopathy, calls)
+    bundle.lookup = None
+    print_table("🔹 predict_diabetic_retinopathy", end_to_end)
+
+    batch = {}
+    for size in args.batch_sizes:
+        n_calls = max(10, min(args.iterations, 200_000 // size))
+        offsets = np.arange(n_calls) * size % (len(records) - size + 1)
+        batch_calls = [(records[o:o + size],) for o in offsets]
+        batch[str(size)] = {
+            "full": timed(lambda b: bundle.model.predict_proba(bundle.preprocessor.transform_records(b)),
+                          batch_calls, size),
+            "lookup": timed(scorer.predict_positive, batch_calls, size),
+        }
+        print_table(f"🔹 batch of {size}", batch[str(size)])
+
+    results = {
+        "config": {"model_version": bundle.version, "iterations": args.iterations, "seed": args.seed,
+                   "table_bytes": scorer.nbytes, "build_ms": round(build_ms, 2), "max_abs_diff": max_diff},
+        "scoring": scoring,
+        "end_to_end": end_to_end,
+        "batch": batch,
+    }
+    path = write_results("lookup", results, args.output)
+    print(f"\n✅ Results written to {path}")
+
+
+if __name__ == "__main__":
+    main()
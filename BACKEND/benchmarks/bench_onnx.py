@@ -0,0 +1,94 @@
+"""
+onnxruntime engine vs the sklearn and NumPy paths.
+
+    sklearn - scaler.transform + MLPClassifier.predict_proba (pickles)
+    numpy   - scaled rows → NumpyMLP (the default INFERENCE_ENGINE)
+    onnx    - encoded rows → model.onnx session (scaler inside the graph),
+              once per --threads value
+
+Rows are sampled from data/X_test.csv and encoded once; only the model
+call (plus scaling where it is separate) is timed. Needs the optional
+onnx and onnxruntime packages.
+
+    python benchmarks/bench_onnx.py
+    python benchmarks/bench_onnx.py --batch-sizes 1 256 --threads 1 2 4
+"""
+import argparse
+import importlib.util
+import sys
+import time
+import warnings
+
+import joblib
+import numpy as np
+
+from common import MODEL_DIR, load_sample_records, print_table, summarize, write_results
+
+from app.model.engine import NumpyMLP
+from app.model.registry import ModelRegistry
+
+WARMUP = 200
+
+
+def timed(fn, X, size, iterations):
+    n_calls = max(10, min(iterations, 400_000 // size))
+    offsets = np.arange(n_calls) * size % (len(X) - size + 1)
+    for o in offsets[:WARMUP]:
+        fn(X[o:o + size])
+    samples = []
+    for o in offsets:
+        batch = X[o:o + size]
+        start = time.perf_counter_ns()
+        fn(batch)
+        samples.append(time.perf_counter_ns() - start)
+    return summarize(samples, size)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the onnxruntime engine")
+    parser.add_argument("--iterations", type=int, default=5000)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 16, 256, 4096])
+    parser.add_argument("--threads", type=int, nargs="+", default=[1], help="intra-op thread counts to try")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="result file (default: benchmarks/results/onnx-<commit>.json)")
+    args = parser.parse_args()
+
+    if importlib.util.find_spec("onnxruntime") is None or importlib.util.find_spec("onnx") is None:
+        sys.exit("❌ onnx and onnxruntime are required: pip install onnx onnxruntime")
+
+    from app.model.onnx_engine import OnnxMLP, build_onnx
+
+    warnings.filterwarnings("ignore")
+    model = joblib.load(MODEL_DIR / "ann_model.pkl")
+    scaler = joblib.load(MODEL_DIR / "scaler.pkl")
+    bundle = ModelRegistry(MODEL_DIR).get()
+
+    records = load_sample_records(max(args.batch_sizes) * 4, seed=args.seed)
+    X_scaled = bundle.preprocessor.transform_records(records)
+    X_raw = X_scaled * np.asarray(scaler.scale_) + np.asarray(scaler.mean_)
+
+    graph = build_onnx(model, scaler, bundle.feature_names, version=bundle.version)
+    numpy_engine = NumpyMLP.from_sklearn(model)
+    onnx_engines = {n: OnnxMLP(graph, intra_op_threads=n) for n in args.threads}
+
+    max_diff = float(np.max(np.abs(onnx_engines[args.threads[0]].predict_positive(X_raw)
+                                   - model.predict_proba(X_scaled)[:, 1])))
+    print(f"🚀 Model {bundle.version}: max |Δp| onnx (float32) vs sklearn {max_diff:.1e}")
+
+    results = {"config": {"model_version": bundle.version, "threads": args.threads, "max_abs_diff": max_diff}}
+    for size in args.batch_sizes:
+        entry = {
+            "sklearn": timed(lambda X: model.predict_proba(scaler.transform(X)), X_raw, size, args.iterations),
+            "numpy": timed(numpy_engine.predict_proba, X_scaled, size, args.iterations),
+        }
+        for n, engine in onnx_engines.items():
+            entry[f"onnx_{n}t"] = timed(engine.predict_proba, X_raw, size, args.iterations)
+        results[str(size)] = entry
+        print_table(f"🔹 batch of {size}", entry)
+
+    path = write_results("onnx", results, args.output)
+    print(f"\n✅ Results written to {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,275 @@
+"""
+Latency benchmark for the prediction hot path.
+
+Times every stage separately on the real model/ artifacts and rows sampled
+from data/X_test.csv:
+
+    legacy   - the original pandas path: cleaning → DataFrame build →
+               get_dummies → reindex → scaler → predict_proba → response
+    current  - the serving path: encode → predict_proba → response
+
+in three modes:
+
+    single   - one record per call
+    batch    - one call per batch (see --batch-sizes)
+    asgi     - requests through the FastAPI app in-process (httpx ASGITransport)
+
+Reports p50 / p95 / p99 latency and throughput, and writes a JSON file
+(benchmarks/results/predict-<commit>.json by default) so runs on different
+commits can be compared:
+
+    python benchmarks/bench_predict.py
+    python benchmarks/bench_predict.py --modes single batch --iterations 5000
+    python benchmarks/bench_predict.py --compare results/predict-a.json results/predict-b.json
+
+The prediction cache is disabled for the run so every call does the work.
+"""
+import argparse
+import asyncio
+import logging
+import time
+import warnings
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from common import (
+    MODEL_DIR,
+    StageTimer,
+    compare,
+    load_sample_records,
+    print_table,
+    summarize,
+    write_results,
+)
+
+from app.config import INFERENCE_DTYPE, INFERENCE_ENGINE, MICRO_BATCHING
+from app.model import predict as predict_module
+from app.model.encoder import clean_value
+from app.model.predict import (
+    MODEL_NAME,
+    interpret_probability,
+    predict_batch,
+    predict_diabetic_retinopathy,
+)
+
+MODES = ("single", "batch", "asgi")
+DEFAULT_BATCH_SIZES = (1, 16, 256, 4096)
+WARMUP = 50
+
+
+def build_response(probability, feature_names):
+    return {
+        "success": True,
+        **interpret_probability(probability),
+        "model": MODEL_NAME,
+        "features_used": list(feature_names),
+    }
+
+
+# ======================================================
+# PIPELINES (ONE CALL, TIMED STAGE BY STAGE)
+# ======================================================
+
+def legacy_single(t, record, model, scaler, feature_names):
+    cleaned = t("cleaning", lambda: {k: clean_value(v) for k, v in record.items()})
+    df = t("dataframe", pd.DataFrame, [cleaned])
+    df = t("get_dummies", pd.get_dummies, df, drop_first=True)
+    df = t("reindex", df.reindex, columns=feature_names, fill_value=0)
+    X_scaled = t("scaler", scaler.transform, df)
+    proba = t("predict_proba", model.predict_proba, X_scaled)
+    return t("response", lambda: build_response(max(0.0, min(1.0, float(proba[0][1]))), feature_names))
+
+
+def current_single(t, record, bundle):
+    X_scaled = t("encode", bundle.preprocessor.transform_record, record)
+    proba = t("predict_proba", bundle.model.predict_proba, X_scaled)
+    return t("response", lambda: build_response(max(0.0, min(1.0, float(proba[0][1]))), bundle.feature_names))
+
+
+def legacy_batch(t, records, model, scaler, feature_names):
+    cleaned = t("cleaning", lambda: [{k: clean_value(v) for k, v in r.items()} for r in records])
+    df = t("dataframe", pd.DataFrame, cleaned)
+    df = t("get_dummies", pd.get_dummies, df, drop_first=True)
+    df = t("reindex", df.reindex, columns=feature_names, fill_value=0)
+    X_scaled = t("scaler", scaler.transform, df)
+    proba = t("predict_proba", model.predict_proba, X_scaled)
+    return t("response", lambda: [interpret_probability(float(p)) for p in np.clip(proba[:, 1], 0.0, 1.0)])
+
+
+def current_batch(t, records, bundle):
+    X_scaled = t("encode", bundle.preprocessor.transform_records, records)
+    proba = t("predict_proba", bundle.model.predict_proba, X_scaled)
+    return t("response", lambda: [interpret_probability(float(p)) for p in np.clip(proba[:, 1], 0.0, 1.0)])
+
+
+def run_timed(fn, calls, rows_per_call=1):
+    """
+    Warm up, then time each call end to end plus its stages
+    """
+    for args in calls[:WARMUP]:
+        fn(StageTimer(), *args)
+
+    t = StageTimer()
+    for args in calls:
+        start = time.perf_counter_ns()
+        fn(t, *args)
+        t.add("total", time.perf_counter_ns() - start)
+    return t.summary(rows_per_call)
+
+
+def run_end_to_end(fn, calls, rows_per_call=1):
+    for args in calls[:WARMUP]:
+        fn(*args)
+
+    samples = []
+    for args in calls:
+        start = time.perf_counter_ns()
+        fn(*args)
+        samples.append(time.perf_counter_ns() - start)
+    return summarize(samples, rows_per_call)
+
+
+# ======================================================
+# MODES
+# ======================================================
+
+def bench_single(records, legacy_artifacts, bundle):
+    calls = [(r,) for r in records]
+    results = {
+        "legacy": run_timed(lambda t, r: legacy_single(t, r, *legacy_artifacts), calls),
+        "current": run_timed(lambda t, r: current_single(t, r, bundle), calls),
+    }
+    results["current"]["predict_diabetic_retinopathy"] = run_end_to_end(predict_diabetic_retinopathy, calls)
+
+    print_table("🔹 single / legacy", results["legacy"])
+    print_table("🔹 single / current", results["current"])
+    return results
+
+
+def bench_batch(records, legacy_artifacts, bundle, batch_sizes, iterations):
+    results = {}
+    for size in batch_sizes:
+        # Keep the total number of scored rows roughly constant
+        n_calls = max(10, min(iterations, 200_000 // size))
+        offsets = np.arange(n_calls) * size % (len(records) - size + 1)
+        calls = [(records[o:o + size],) for o in offsets]
+
+        entry = {
+            "legacy": run_timed(lambda t, b: legacy_batch(t, b, *legacy_artifacts), calls, size),
+            "current": run_timed(lambda t, b: current_batch(t, b, bundle), calls, size),
+        }
+        entry["current"]["predict_batch"] = run_end_to_end(
+            lambda b: predict_batch(b, bundle, use_cache=False), calls, size
+        )
+        results[f"size_{size}"] = entry
+
+        print_table(f"🔹 batch {size} / legacy", entry["legacy"])
+        print_table(f"🔹 batch {size} / current", entry["current"])
+    return results
+
+
+async def _bench_asgi(records, iterations, concurrency, batch_size):
+    import httpx
+
+    from app.main import app
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+
+        async def post(path, payload):
+            start = time.perf_counter_ns()
+            response = await client.post(path, json=payload)
+            response.raise_for_status()
+            return time.perf_counter_ns() - start
+
+        for record in records[:WARMUP]:
+            await post("/api/predict", record)
+
+        sequential = [await post("/api/predict", r) for r in records[:iterations]]
+
+        concurrent, wall_start = [], time.perf_counter()
+        for i in range(0, iterations, concurrency):
+            chunk = records[i:i + concurrency]
+            concurrent += await asyncio.gather(*(post("/api/predict", r) for r in chunk))
+        wall = time.perf_counter() - wall_start
+
+        n_batches = max(10, iterations // max(1, batch_size // 16))
+        batches = [records[:batch_size] for _ in range(n_batches)]
+        batch = [await post("/api/predict/batch", b) for b in batches]
+
+    results = {
+        "predict_sequential": summarize(sequential),
+        f"predict_concurrency_{concurrency}": summarize(concurrent),
+        f"predict_batch_{batch_size}": summarize(batch, batch_size),
+    }
+    # Concurrent latencies overlap; report throughput from wall-clock time
+    results[f"predict_concurrency_{concurrency}"]["rows_per_s"] = round(len(concurrent) / wall, 1)
+    return results
+
+
+def bench_asgi(records, iterations, concurrency, batch_size):
+    results = asyncio.run(_bench_asgi(records, iterations, concurrency, batch_size))
+    print_table(f"🔹 asgi (micro-batching={'on' if MICRO_BATCHING else 'off'})", results)
+    return results
+
+
+# ======================================================
+# ENTRY POINT
+# ======================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the prediction hot path")
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+    parser.add_argument("--iterations", type=int, default=2000, help="calls per single-record run")
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=list(DEFAULT_BATCH_SIZES))
+    parser.add_argument("--concurrency", type=int, default=32, help="in-flight requests in asgi mode")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="result file (default: benchmarks/results/predict-<commit>.json)")
+    parser.add_argument("--compare", nargs=2, metavar=("BASELINE", "CANDIDATE"),
+                        help="compare two result files instead of running")
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    warnings.filterwarnings("ignore")  # sklearn version / feature-name warnings
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    predict_module.cache.max_size = 0
+
+    legacy_artifacts = (
+        joblib.load(MODEL_DIR / "ann_model.pkl"),
+        joblib.load(MODEL_DIR / "scaler.pkl"),
+        joblib.load(MODEL_DIR / "feature_names.pkl"),
+    )
+    bundle = predict_module.registry.get()
+    records = load_sample_records(max(args.iterations, max(args.batch_sizes)), seed=args.seed)
+
+    print(f"🚀 Benchmarking model {bundle.version} ({bundle.engine}, {bundle.source}) "
+          f"on {len(records):,} sampled rows")
+
+    results = {
+        "config": {
+            "engine": INFERENCE_ENGINE,
+            "dtype": INFERENCE_DTYPE,
+            "micro_batching": MICRO_BATCHING,
+            "model_version": bundle.version,
+            "iterations": args.iterations,
+            "seed": args.seed,
+        }
+    }
+    if "single" in args.modes:
+        results["single"] = bench_single(records[:args.iterations], legacy_artifacts, bundle)
+    if "batch" in args.modes:
+        results["batch"] = bench_batch(records, legacy_artifacts, bundle, args.batch_sizes, args.iterations)
+    if "asgi" in args.modes:
+        results["asgi"] = bench_asgi(records, args.iterations, args.concurrency, max(args.batch_sizes))
+
+    path = write_results("predict", results, args.output)
+    print(f"\n✅ Results written to {path}")
+
+
+if __name__ == "__main__":
+    main()
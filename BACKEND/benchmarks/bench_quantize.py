@@ -0,0 +1,80 @@
+"""
+Forward-pass latency and weight size per INFERENCE_DTYPE.
+
+    float64 / float32 - NumpyMLP (exact / half precision)
+    float16 / int8    - QuantizedMLP (app/model/quantize.py)
+
+Rows are sampled from data/X_test.csv and encoded once; only the model
+call is timed.
+
+    python benchmarks/bench_quantize.py
+    python benchmarks/bench_quantize.py --batch-sizes 1 64 --iterations 20000
+"""
+import argparse
+import time
+import warnings
+
+import joblib
+import numpy as np
+
+from common import MODEL_DIR, load_sample_records, print_table, summarize, write_results
+
+from app.model.engine import NumpyMLP
+from app.model.quantize import QUANTIZED_FORMATS, QuantizedMLP
+from app.model.registry import ModelRegistry
+
+WARMUP = 200
+
+
+def engines(model):
+    out = {dtype: NumpyMLP.from_sklearn(model, dtype=dtype) for dtype in ("float64", "float32")}
+    out.update({fmt: QuantizedMLP.from_sklearn(model, fmt) for fmt in QUANTIZED_FORMATS})
+    return out
+
+
+def weight_bytes(engine):
+    if isinstance(engine, QuantizedMLP):
+        return engine.nbytes
+    return sum(c.nbytes + b.nbytes for c, b in zip(engine.coefs, engine.intercepts))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark quantized inference engines")
+    parser.add_argument("--iterations", type=int, default=5000)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 16, 256, 4096])
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="result file (default: benchmarks/results/quantize-<commit>.json)")
+    args = parser.parse_args()
+
+    warnings.filterwarnings("ignore")
+    model = joblib.load(MODEL_DIR / "ann_model.pkl")
+    bundle = ModelRegistry(MODEL_DIR).get()
+    X = bundle.preprocessor.transform_records(load_sample_records(max(args.batch_sizes) * 4, seed=args.seed))
+
+    by_engine = engines(model)
+    results = {"weight_bytes": {name: weight_bytes(e) for name, e in by_engine.items()}}
+    print("🚀 Weight bytes: " + ", ".join(f"{k} {v:,}" for k, v in results["weight_bytes"].items()))
+
+    for size in args.batch_sizes:
+        n_calls = max(10, min(args.iterations, 400_000 // size))
+        offsets = np.arange(n_calls) * size % (len(X) - size + 1)
+        entry = {}
+        for name, engine in by_engine.items():
+            for o in offsets[:WARMUP]:
+                engine.predict_proba(X[o:o + size])
+            samples = []
+            for o in offsets:
+                batch = X[o:o + size]
+                start = time.perf_counter_ns()
+                engine.predict_proba(batch)
+                samples.append(time.perf_counter_ns() - start)
+            entry[name] = summarize(samples, size)
+        results[str(size)] = entry
+        print_table(f"🔹 batch of {size}", entry)
+
+    path = write_results("quantize", results, args.output)
+    print(f"\n✅ Results written to {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+Best split of a node's cores between web workers, inference threads and
+BLAS threads (WEB_WORKERS / INFERENCE_WORKERS / BLAS_THREADS in app/config.py).
+
+Every combination with workers × threads × blas <= cores × --oversubscribe
+is run for --duration seconds: `workers` processes, each with `threads`
+threads that keep scoring a batch of --batch records through the serving
+path (encode → scale → predict_proba) with BLAS limited to `blas` threads.
+Throughput is counted over the wall clock of the whole node; latency is
+per model call.
+
+    python benchmarks/bench_threads.py
+    python benchmarks/bench_threads.py --cores 8 --batch 1 --duration 5
+"""
+import argparse
+import itertools
+import multiprocessing as mp
+import threading
+import time
+import warnings
+
+from common import MODEL_DIR, load_sample_records, summarize, write_results
+
+from app.model.registry import ModelRegistry
+from app.model.warmup import warm_up
+from app.utils.threads import available_cores, limit_blas_threads, thread_plan
+
+
+def _worker(threads, blas, records, duration, start_at, queue):
+    warnings.filterwarnings("ignore")
+    bundle = ModelRegistry(MODEL_DIR, warmup=warm_up).get()
+    samples = [[] for _ in range(threads)]
+
+    def run(out):
+        limit_blas_threads(blas)
+        while time.time() < start_at:
+            time.sleep(0.001)
+        deadline = start_at + duration
+        while True:
+            start = time.perf_counter_ns()
+            bundle.model.predict_proba(bundle.preprocessor.transform_records(records))
+            out.append(time.perf_counter_ns() - start)
+            if time.time() >= deadline:
+                break
+
+    pool = [threading.Thread(target=run, args=(s,)) for s in samples]
+    for t in pool:
+        t.start()
+    for t in pool:
+        t.join()
+    queue.put([ns for s in samples for ns in s])
+
+
+def run_combination(workers, threads, blas, records, duration):
+    ctx = mp.get_context("spawn")
+    queue = ctx.Queue()
+    start_at = time.time() + 2.0 + 0.5 * workers  # all processes loaded before the clock starts
+    procs = [
+        ctx.Process(target=_worker, args=(threads, blas, records, duration, start_at, queue))
+        for _ in range(workers)
+    ]
+    for p in procs:
+        p.start()
+    samples = [ns for _ in procs for ns in queue.get()]
+    for p in procs:
+        p.join()
+
+    stats = summarize(samples, len(records))
+    stats["rows_per_s"] = round(len(samples) * len(records) / duration, 1)
+    return stats
+
+
+def combinations(cores, oversubscribe, workers=None, threads=None, blas=None):
+    budget = cores * oversubscribe
+    workers = workers or range(1, budget + 1)
+    threads = threads or range(1, budget + 1)
+    blas = blas or [b for b in (1, 2, 4, 8, 16) if b <= budget]
+    return [c for c in itertools.product(workers, threads, blas) if c[0] * c[1] * c[2] <= budget]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Find the best workers × threads × BLAS split")
+    parser.add_argument("--cores", type=int, default=available_cores())
+    parser.add_argument("--oversubscribe", type=int, default=2,
+                        help="also try up to this many compute threads per core")
+    parser.add_argument("--workers", type=int, nargs="+", help="web worker counts to try")
+    parser.add_argument("--threads", type=int, nargs="+", help="inference threads per worker to try")
+    parser.add_argument("--blas", type=int, nargs="+", help="BLAS threads per call to try")
+    parser.add_argument("--batch", type=int, default=32, help="records per model call")
+    parser.add_argument("--duration", type=float, default=3.0, help="seconds per combination")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="result file (default: benchmarks/results/threads-<commit>.json)")
+    args = parser.parse_args()
+
+    records = load_sample_records(args.batch, seed=args.seed)
+    combos = combinations(args.cores, args.oversubscribe, args.workers, args.threads, args.blas)
+    print(f"🚀 {len(combos)} combinations on {args.cores} cores, batch of {args.batch}, {args.duration}s each")
+    print(f"\n{'workers':>8}{'threads':>9}{'blas':>6}{'p50 µs':>10}{'p99 µs':>10}{'rows/s':>14}")
+
+    results = {}
+    for workers, threads, blas in combos:
+        stats = run_combination(workers, threads, blas, records, args.duration)
+        stats.update(thread_plan(args.cores, workers, threads, blas))
+        results[f"{workers}x{threads}x{blas}"] = stats
+        print(f"{workers:>8}{threads:>9}{blas:>6}{stats['p50_us']:>10}{stats['p99_us']:>10}{stats['rows_per_s']:>14,.0f}")
+
+    best = max(results, key=lambda k: results[k]["rows_per_s"])
+    fastest = min(results, key=lambda k: results[k]["p99_us"])
+    for label, key in (("throughput", best), ("p99 latency", fastest)):
+        s = results[key]
+        print(f"\n🏆 Best {label}: WEB_WORKERS={s['web_workers']} INFERENCE_WORKERS={s['inference_workers']} "
+              f"BLAS_THREADS={s['blas_threads']} ({s['rows_per_s']:,.0f} rows/s, p99 {s['p99_us']} µs)")
+
+    path = write_results("threads", {"cores": args.cores, "batch": args.batch, "best": best,
+                                     "best_p99": fastest, "combinations": results}, args.output)
+    print(f"\n✅ Results written to {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""
+Shared helpers for the benchmark scripts: sample data, timing statistics
+and JSON result files that can be compared across commits.
+"""
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+from app.utils.preprocessing import decode_dummies_frame  # noqa: E402
+
+MODEL_DIR = BACKEND_DIR / "model"
+DATA_DIR = BACKEND_DIR / "data"
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+PERCENTILES = (50, 95, 99)
+
+
+# ======================================================
+# SAMPLE DATA
+# ======================================================
+
+def load_sample_records(n, seed=42):
+    """
+    n PatientInput dicts sampled (with replacement) from data/X_test.csv
+    """
+    X = pd.read_csv(DATA_DIR / "X_test.csv")
+    records = decode_dummies_frame(X).to_dict(orient="records")
+    rng = np.random.default_rng(seed)
+    return [records[i] for i in rng.integers(0, len(records), size=n)]
+
+
+# ======================================================
+# TIMING
+# ======================================================
+
+class StageTimer:
+    """
+    Collect per-stage durations (nanoseconds) over many iterations
+    """
+
+    def __init__(self):
+        self.samples = {}
+
+    def __call__(self, stage, fn, *args, **kwargs):
+        start = time.perf_counter_ns()
+        out = fn(*args, **kwargs)
+        self.samples.setdefault(stage, []).append(time.perf_counter_ns() - start)
+        return out
+
+    def add(self, stage, elapsed_ns):
+        self.samples.setdefault(stage, []).append(elapsed_ns)
+
+    def summary(self, rows_per_iteration=1):
+        return {
+            stage: summarize(values, rows_per_iteration)
+            for stage, values in self.samples.items()
+        }
+
+
+def summarize(samples_ns, rows_per_iteration=1):
+    """
+    p50/p95/p99/mean latency in microseconds plus rows per second
+    """
+    values = np.asarray(samples_ns, dtype=np.float64) / 1e3
+    total_s = values.sum() / 1e6
+    stats = {f"p{p}_us": round(float(np.percentile(values, p)), 2) for p in PERCENTILES}
+    stats["mean_us"] = round(float(values.mean()), 2)
+    stats["iterations"] = int(len(values))
+    stats["rows_per_s"] = round(len(values) * rows_per_iteration / total_s, 1) if total_s else 0.0
+    return stats
+
+
+# ======================================================
+# RESULT FILES
+# ======================================================
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=BACKEND_DIR, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def environment():
+    import sklearn
+
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "sklearn": sklearn.__version__,
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def write_results(name, results, output=None):
+    """
+    Save results as JSON; the default file name carries the commit hash
+    """
+    commit = git_commit()
+    payload = {
+        "benchmark": name,
+        "commit": commit,
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "environment": environment(),
+        "results": results,
+    }
+    if output is None:
+        RESULTS_DIR.mkdir(exist_ok=True)
+        output = RESULTS_DIR / f"{name}-{commit}.json"
+    Path(output).write_text(json.dumps(payload, indent=2))
+    return Path(output)
+
+
+def _flatten(results, prefix=""):
+    for key, value in results.items():
+        if isinstance(value, dict) and "p50_us" not in value:
+            yield from _flatten(value, f"{prefix}{key}/")
+        elif isinstance(value, dict):
+            yield f"{prefix}{key}", value
+
+
+def compare(baseline_path, candidate_path):
+    """
+    Print p50/p99 change per stage between two result files
+    """
+    base = json.loads(Path(baseline_path).read_text())
+    cand = json.loads(Path(candidate_path).read_text())
+    base_stats = dict(_flatten(base["results"]))
+
+    print(f"📊 {base['commit']} → {cand['commit']}")
+    print(f"{'stage':<48}{'p50 µs':>28}{'p99 µs':>28}")
+    for stage, stats in _flatten(cand["results"]):
+        old = base_stats.get(stage)
+        if old is None:
+            print(f"{stage:<48}{stats['p50_us']:>28}{stats['p99_us']:>28}")
+            continue
+        cols = []
+        for key in ("p50_us", "p99_us"):
+            change = (stats[key] - old[key]) / old[key] * 100 if old[key] else 0.0
+            cols.append(f"{old[key]}→{stats[key]} ({change:+.0f}%)")
+        print(f"{stage:<48}{cols[0]:>28}{cols[1]:>28}")
+
+
+def print_table(title, summary):
+    print(f"\n{title}")
+    print(f"{'stage':<22}{'p50 µs':>10}{'p95 µs':>10}{'p99 µs':>10}{'rows/s':>14}")
+    for stage, s in summary.items():
+        print(f"{stage:<22}{s['p50_us']:>10}{s['p95_us']:>10}{s['p99_us']:>10}{s['rows_per_s']:>14,.0f}")
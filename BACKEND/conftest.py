@@ -0,0 +1,89 @@
+"""
+Shared pytest fixtures: real model artifacts and held-out test rows
+"""
+import sys
+import warnings
+from pathlib import Path
+
+import joblib
+import numpy as np
+import pandas as pd
+import pytest
+
+BACKEND_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+from app.utils.preprocessing import AGE_MAP, decode_dummies_frame  # noqa: E402
+
+MODEL_DIR = BACKEND_DIR / "model"
+DATA_DIR = BACKEND_DIR / "data"
+
+
+def _load(name):
+    with warnings.catch_warnings():
+        # Artifacts may have been pickled by a neighbouring sklearn release
+        warnings.simplefilter("ignore")
+        return joblib.load(MODEL_DIR / name)
+
+
+@pytest.fixture(scope="session")
+def model_dir():
+    return MODEL_DIR
+
+
+@pytest.fixture(scope="session")
+def model():
+    return _load("ann_model.pkl")
+
+
+@pytest.fixture(scope="session")
+def scaler():
+    return _load("scaler.pkl")
+
+
+@pytest.fixture(scope="session")
+def feature_names():
+    return _load("feature_names.pkl")
+
+
+@pytest.fixture(scope="session")
+def test_records():
+    """
+    data/X_test.csv decoded back into PatientInput dicts
+    """
+    X = pd.read_csv(DATA_DIR / "X_test.csv")
+    return decode_dummies_frame(X).to_dict(orient="records")
+
+
+@pytest.fixture(scope="session")
+def y_test():
+    return pd.read_csv(DATA_DIR / "y_test.csv")["target"].to_numpy()
+
+
+@pytest.fixture
+def raw_csv(tmp_path):
+    """
+    Small diabetic_data.csv-style registry file (raw values, "?" included)
+    """
+    rng = np.random.default_rng(0)
+    n = 500
+    df = pd.DataFrame({
+        "encounter_id": np.arange(n),
+        "race": rng.choice(["Caucasian", "?"], n),
+        "age": rng.choice(list(AGE_MAP), n),
+        "gender": rng.choice(["Male", "Female", "Unknown/Invalid"], n),
+        "time_in_hospital": rng.integers(1, 15, n),
+        "num_lab_procedures": rng.integers(1, 130, n),
+        "num_medications": rng.integers(1, 80, n),
+        "number_outpatient": rng.integers(0, 40, n),
+        "number_emergency": rng.integers(0, 70, n),
+        "number_inpatient": rng.integers(0, 20, n),
+        "number_diagnoses": rng.integers(1, 16, n),
+        "max_glu_serum": rng.choice(["None", ">200", ">300", "Norm"], n),
+        "A1Cresult": rng.choice(["None", ">7", ">8", "Norm"], n),
+        "insulin": rng.choice(["No", "Up", "Down", "Steady", "?"], n),
+        "diabetesMed": rng.choice(["Yes", "No"], n),
+    })
+    path = tmp_path / "diabetic_data.csv"
+    df.to_csv(path, index=False)
+    return path
@@ -0,0 +1,61 @@
+"""
+Incremental (warm-start) retraining from newly labeled encounters
+
+Usage:
+    python retrain.py data/new_encounters.csv
+    python retrain.py data/new_encounters.csv --epochs 10 --publish
+    python retrain.py data/new_encounters.csv --since 443000000 --holdout data/
+
+Only rows with an encounter_id above the last trained one (model/training_state.json,
+or --since) are used. The updated model is kept only if holdout AUC does not drop
+by more than --tolerance; it is written to --output (default
+model_retrain/<timestamp>/) and --publish also copies it into MODEL_DIR.
+"""
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from app.config import BASE_DIR, MODEL_DIR
+from app.training.incremental import incremental_retrain
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Warm-start the MLP on newly labeled records")
+    parser.add_argument("data", help="CSV in the diabetic_data.csv format (with encounter_id)")
+    parser.add_argument("--model-dir", default=str(MODEL_DIR), help="model to update")
+    parser.add_argument("--holdout", default=str(BASE_DIR / "data"),
+                        help="directory with X_test.csv/y_test.csv, or a raw registry CSV")
+    parser.add_argument("--since", type=int, default=None, help="only use encounter_id > SINCE")
+    parser.add_argument("--epochs", type=int, default=5, help="partial_fit passes over the new rows")
+    parser.add_argument("--learning-rate", type=float, default=None,
+                        help="restart the optimizer with this learning rate")
+    parser.add_argument("--tolerance", type=float, default=0.002, help="allowed holdout AUC drop")
+    parser.add_argument("--output", default=None, help="directory for the updated artifacts")
+    parser.add_argument("--publish", action="store_true", help="copy the accepted model into --model-dir")
+    args = parser.parse_args()
+
+    out_dir = Path(args.output or Path(__file__).parent / "model_retrain" / time.strftime("%Y%m%d-%H%M%S"))
+
+    print("=" * 60)
+    print("🔁 INCREMENTAL RETRAINING")
+    print("=" * 60)
+
+    report = incremental_retrain(
+        args.model_dir, args.data, args.holdout, out_dir=out_dir, epochs=args.epochs,
+        tolerance=args.tolerance, since=args.since, learning_rate=args.learning_rate,
+        publish_model=args.publish,
+    )
+
+    print("\n" + json.dumps(report, indent=2))
+    if report["accepted"]:
+        print(f"✅ Artifacts written to {out_dir}")
+    else:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -8,13 +8,20 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 try:
+    # BLAS thread limits must be in the environment before NumPy is imported
+    # (inherited by every uvicorn worker process)
+    from app.config import BLAS_THREADS, WEB_WORKERS
+    from app.utils.threads import set_thread_env
+
+    set_thread_env(BLAS_THREADS)
+
     from app.main import app
     print("=" * 60)
     print("🚀 Starting Diabetic Retinopathy Prediction API")
     print("=" * 60)
     print(f"📁 Working directory: {os.getcwd()}")
     print(f"🔗 API Documentation: http://localhost:8000/docs")
-    print(f"🔗 Health Check:       http://localhost:8000/health")
+    print(f"🔗 Health Check:       http://localhost:8000/health (/health/live, /health/ready)")
     print("=" * 60)
     
     if __name__ == "__main__":
@@ -23,7 +30,8 @@ try:
             "app.main:app",
             host="0.0.0.0",
             port=8000,
-            reload=True,
+            reload=WEB_WORKERS == 1,  # auto-reload only works with a single worker
+            workers=WEB_WORKERS,
             log_level="info"
         )
         
@@ -0,0 +1,55 @@
+"""
+Score a whole patient registry offline
+
+Usage:
+    python score.py data/diabetic_data.csv scores.csv
+    python score.py registry.parquet scores.parquet --workers 4 --keep encounter_id,patient_nbr
+
+Input rows may be raw diabetic_data.csv records or already in the API's
+PatientInput format. Output = input columns (or --keep subset) +
+probability, risk_level, recommendation. Parquet needs pyarrow.
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from app.config import INFERENCE_DTYPE, INFERENCE_ENGINE, MODEL_DIR
+from app.model.scoring import default_workers, score_file
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batch-score patients for diabetic retinopathy risk")
+    parser.add_argument("input", help="CSV or Parquet file with patient records")
+    parser.add_argument("output", help="CSV or Parquet file to write (by extension)")
+    parser.add_argument("--chunk-size", type=int, default=50000, help="rows per chunk (bounds memory)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help=f"scoring processes (0 = one per core, {default_workers()} here)")
+    parser.add_argument("--keep", default=None, help="comma-separated input columns to copy to the output")
+    parser.add_argument("--model-dir", default=str(MODEL_DIR))
+    args = parser.parse_args()
+
+    workers = args.workers or default_workers()
+    keep = args.keep.split(",") if args.keep else None
+
+    print("=" * 60)
+    print(f"📂 Scoring {args.input} → {args.output}")
+    print(f"   chunk size {args.chunk_size:,}, {workers} worker(s)")
+    print("=" * 60)
+
+    started = time.perf_counter()
+    n_rows = score_file(
+        args.input, args.output, Path(args.model_dir),
+        chunk_size=args.chunk_size, workers=workers, keep_columns=keep,
+        engine=INFERENCE_ENGINE, dtype=INFERENCE_DTYPE,
+        progress=lambda n: print(f"  ✅ {n:,} rows scored", flush=True),
+    )
+    elapsed = time.perf_counter() - started
+
+    print(f"\n🎉 {n_rows:,} rows in {elapsed:.2f}s ({n_rows / max(elapsed, 1e-9):,.0f} rows/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+"""
+Tests for the admin model endpoints
+"""
+from fastapi.testclient import TestClient
+
+from app.api import admin
+from app.main import app
+
+client = TestClient(app)
+
+
+def test_reload_is_refused_without_a_configured_token(monkeypatch):
+    def explode():
+        raise AssertionError("model reloaded without a token")
+
+    monkeypatch.setattr(admin, "ADMIN_TOKEN", "")
+    monkeypatch.setattr(admin.registry, "reload", explode)
+
+    for headers in ({}, {"X-Admin-Token": ""}, {"X-Admin-Token": "anything"}):
+        response = client.post("/api/admin/model/reload", headers=headers)
+        assert response.status_code == 403
+        assert "disabled" in response.json()["detail"]
+
+
+def test_reload_requires_the_configured_token(monkeypatch):
+    monkeypatch.setattr(admin, "ADMIN_TOKEN", "s3cret")
+
+    assert client.post("/api/admin/model/reload", headers={"X-Admin-Token": "wrong"}).status_code == 403
+    response = client.post("/api/admin/model/reload", headers={"X-Admin-Token": "s3cret"})
+    assert response.status_code == 200
+    assert response.json()["version"] == admin.registry.get().version
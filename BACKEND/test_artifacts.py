@@ -0,0 +1,45 @@
+"""
+Tests for the memory-mapped serving artifact format
+"""
+import numpy as np
+
+from app.model.artifacts import artifact_version, export_artifacts, load_artifacts
+from app.model.encoder import FeatureEncoder
+from app.model.registry import ModelRegistry
+
+
+def test_export_round_trip_matches_pickles(tmp_path, model_dir, model, scaler, feature_names, test_records):
+    serving_dir = export_artifacts(model_dir, tmp_path / "serving")
+    mm_model, mm_scaler, mm_names, manifest = load_artifacts(serving_dir)
+
+    assert mm_names == list(feature_names)
+    assert manifest["version"] == artifact_version(model_dir)
+
+    X = FeatureEncoder(feature_names, scaler).transform_many(test_records)
+    X_mm = FeatureEncoder(mm_names, mm_scaler).transform_many(test_records)
+    assert np.array_equal(X, X_mm)
+    np.testing.assert_allclose(mm_model.predict_proba(X_mm), model.predict_proba(X), rtol=1e-12)
+
+
+def test_weights_stay_memory_mapped(tmp_path, model_dir):
+    serving_dir = export_artifacts(model_dir, tmp_path / "serving")
+    mm_model, mm_scaler, _, _ = load_artifacts(serving_dir)
+
+    for arr in mm_model.coefs + [mm_scaler.mean_]:
+        assert isinstance(arr, np.memmap) or isinstance(arr.base, np.memmap)
+
+
+def test_registry_prefers_fresh_serving_artifacts(tmp_path, model_dir):
+    import shutil
+
+    for name in ("ann_model.pkl", "scaler.pkl", "feature_names.pkl"):
+        shutil.copy(model_dir / name, tmp_path / name)
+
+    assert ModelRegistry(tmp_path).get().source == "pickle"
+
+    export_artifacts(tmp_path)
+    assert ModelRegistry(tmp_path).get().source == "serving"
+
+    # Pickles retrained after the export: never serve the stale arrays
+    (tmp_path / "feature_names.pkl").write_bytes((model_dir / "feature_names.pkl").read_bytes() + b"\n")
+    assert ModelRegistry(tmp_path).get().source == "pickle"
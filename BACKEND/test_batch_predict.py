@@ -0,0 +1,49 @@
+"""
+Tests for POST /api/predict/batch
+"""
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+client = TestClient(app)
+
+
+def test_batch_matches_single_predictions(test_records):
+    records = test_records[:50]
+
+    response = client.post("/api/predict/batch", json=records)
+    assert response.status_code == 200
+    body = response.json()
+    assert body["count"] == body["succeeded"] == 50
+
+    for i, (record, result) in enumerate(zip(records, body["results"])):
+        single = client.post("/api/predict", json=record).json()
+        assert result["index"] == i
+        assert result["probability"] == single["probability"]
+        assert result["risk_level"] == single["risk_level"]
+
+
+def test_invalid_records_do_not_fail_the_batch(test_records):
+    good = test_records[0]
+    records = [good, {**good, "age": 500}, {**good, "gender": None}, good]
+
+    body = client.post("/api/predict/batch", json=records).json()
+    assert [r["success"] for r in body["results"]] == [True, False, False, True]
+    assert body["results"][1]["errors"][0]["loc"] == ["age"]
+    assert body["results"][0]["probability"] == body["results"][3]["probability"]
+    assert body["failed"] == 2
+
+
+def test_non_object_items_fail_in_place(test_records):
+    good = test_records[0]
+    body = client.post("/api/predict/batch", json=[good, 42, [good], good]).json()
+    assert [r["success"] for r in body["results"]] == [True, False, False, True]
+    assert body["results"][1]["errors"] == [{"loc": [], "msg": "Expected a JSON object"}]
+    assert body["succeeded"] == 2 and body["failed"] == 2
+
+    assert client.post("/api/predict/batch", json={"records": [good]}).status_code == 422
+
+
+def test_empty_batch():
+    body = client.post("/api/predict/batch", json=[]).json()
+    assert body["count"] == 0 and body["results"] == []
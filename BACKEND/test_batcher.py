@@ -0,0 +1,127 @@
+"""
+Tests for the asyncio MicroBatcher
+"""
+import asyncio
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api import predict as predict_api
+from app.main import app
+from app.model.batcher import MicroBatcher
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_concurrent_requests_share_a_forward_pass():
+    batch_sizes = []
+
+    def predict_fn(records):
+        batch_sizes.append(len(records))
+        return [r["x"] * 2 for r in records]
+
+    async def main():
+        batcher = MicroBatcher(predict_fn, max_batch_size=64, window_ms=20)
+        results = await asyncio.gather(*(batcher.submit({"x": i}) for i in range(10)))
+        await batcher.close()
+        return batcher, results
+
+    batcher, results = run(main())
+
+    assert results == [i * 2 for i in range(10)]
+    assert batch_sizes == [10]
+    stats = batcher.stats.snapshot()
+    assert stats["batches"] == 1 and stats["requests"] == 10
+    assert stats["largest_batch"] == 10
+
+
+def test_batches_never_exceed_max_size():
+    batch_sizes = []
+
+    def predict_fn(records):
+        batch_sizes.append(len(records))
+        return records
+
+    async def main():
+        batcher = MicroBatcher(predict_fn, max_batch_size=4, window_ms=20)
+        results = await asyncio.gather(*(batcher.submit(i) for i in range(10)))
+        await batcher.close()
+        return results
+
+    assert run(main()) == list(range(10))
+    assert max(batch_sizes) <= 4 and sum(batch_sizes) == 10
+
+
+def test_lone_request_does_not_wait_for_the_window():
+    async def main():
+        batcher = MicroBatcher(lambda records: records, window_ms=1000)
+        start = time.perf_counter()
+        result = await batcher.submit("x")
+        elapsed = time.perf_counter() - start
+        await batcher.close()
+        return result, elapsed
+
+    result, elapsed = run(main())
+    assert result == "x" and elapsed < 0.5
+
+
+def test_failures_reach_every_waiting_caller():
+    def predict_fn(records):
+        raise RuntimeError("model exploded")
+
+    async def main():
+        batcher = MicroBatcher(predict_fn, window_ms=5)
+        outcomes = await asyncio.gather(
+            *(batcher.submit(i) for i in range(3)), return_exceptions=True
+        )
+        ok = await asyncio.gather(batcher.submit(0), return_exceptions=True)
+        await batcher.close()
+        return batcher, outcomes + ok
+
+    batcher, outcomes = run(main())
+    assert all(isinstance(o, RuntimeError) for o in outcomes)
+    assert batcher.stats.snapshot()["failed_batches"] == 2
+
+
+def test_failing_batch_is_retried_one_record_at_a_time():
+    calls = []
+
+    def predict_fn(records):
+        calls.append(len(records))
+        if "bad" in records:
+            raise ValueError("bad record")
+        return [r.upper() for r in records]
+
+    async def main():
+        batcher = MicroBatcher(predict_fn, window_ms=20)
+        outcomes = await asyncio.gather(
+            *(batcher.submit(r) for r in ("a", "bad", "c")), return_exceptions=True
+        )
+        await batcher.close()
+        return batcher, outcomes
+
+    batcher, outcomes = run(main())
+    assert outcomes[0] == "A" and outcomes[2] == "C"
+    assert isinstance(outcomes[1], ValueError)
+    assert calls == [3, 1, 1, 1]
+    assert batcher.stats.snapshot()["failed_batches"] == 1
+
+
+def test_invalid_max_batch_size():
+    with pytest.raises(ValueError):
+        MicroBatcher(lambda records: records, max_batch_size=0)
+
+
+def test_rejected_prediction_hides_the_internal_message(monkeypatch, test_records):
+    def predict_fn(records):
+        raise ValueError("matrix has 12 columns, expected 11")
+
+    monkeypatch.setattr(predict_api.batcher, "_predict_fn", predict_fn)
+    record = {**test_records[0], "num_lab_procedures": 987654}  # not cached
+
+    response = TestClient(app).post("/api/predict", json=record)
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid input for prediction"
@@ -0,0 +1,71 @@
+"""
+Tests for the LRU/TTL PredictionCache and its use on the prediction path
+"""
+import time
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.model.cache import PredictionCache, cache_key
+from app.model.predict import cache, registry
+
+client = TestClient(app)
+
+
+def test_key_ignores_field_order_but_not_version():
+    a = {"age": 60, "gender": "Male"}
+    b = {"gender": "Male", "age": 60}
+    assert cache_key(a, "v1") == cache_key(b, "v1")
+    assert cache_key(a, "v1") != cache_key(a, "v2")
+
+
+def test_lru_eviction():
+    lru = PredictionCache(max_size=2, ttl=60)
+    lru.put("a", 1)
+    lru.put("b", 2)
+    assert lru.get("a") == 1      # "b" is now least recently used
+    lru.put("c", 3)
+
+    assert lru.get("b") is None
+    assert lru.get("a") == 1 and lru.get("c") == 3
+    assert lru.stats()["evictions"] == 1
+
+
+def test_ttl_expiry():
+    lru = PredictionCache(max_size=10, ttl=0.01)
+    lru.put("a", 1)
+    time.sleep(0.02)
+    assert lru.get("a") is None
+    assert lru.stats()["expirations"] == 1
+
+
+def test_disabled_cache_stores_nothing():
+    lru = PredictionCache(max_size=0)
+    lru.put("a", 1)
+    assert lru.get("a") is None and lru.stats()["size"] == 0
+
+
+def test_repeat_request_is_served_from_cache(test_records, monkeypatch):
+    record = {**test_records[0], "number_diagnoses": 42}
+    first = client.post("/api/predict", json=record).json()
+
+    def explode(*args, **kwargs):
+        raise AssertionError("model touched on a cache hit")
+
+    bundle = registry.get()
+    monkeypatch.setattr(bundle.preprocessor, "transform_records", explode)
+    monkeypatch.setattr(bundle.preprocessor, "transform_record", explode)
+
+    hits = cache.stats()["hits"]
+    assert client.post("/api/predict", json=record).json() == first
+    batch = client.post("/api/predict/batch", json=[record]).json()
+    assert batch["results"][0]["probability"] == first["probability"]
+    assert cache.stats()["hits"] == hits + 2
+
+
+def test_reload_invalidates_cache(test_records):
+    client.post("/api/predict", json=test_records[1])
+    assert cache.stats()["size"] > 0
+
+    registry.reload()
+    assert cache.stats()["size"] == 0
@@ -0,0 +1,149 @@
+"""
+Tests for Arrow / Parquet batch bodies and the vectorized validation
+"""
+import copy
+import importlib.util
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+from pydantic import ValidationError
+
+from app.api import columnar
+from app.api.predict import PATIENT_RULES, PatientInput, version_headers
+from app.main import app
+from app.model.predict import registry
+
+client = TestClient(app)
+
+
+def as_columns(records):
+    fields = list(PATIENT_RULES)
+    columns = {f: np.array([r[f] for r in records], dtype=object if PATIENT_RULES[f][0] == "choice" else None)
+               for f in fields}
+    nulls = {f: np.zeros(len(records), dtype=bool) for f in fields}
+    return columns, nulls
+
+
+def test_rules_follow_the_pydantic_model():
+    assert PATIENT_RULES["age"] == ("int", 1, 120)
+    assert PATIENT_RULES["time_in_hospital"] == ("int", 0, 30)
+    assert PATIENT_RULES["num_medications"] == ("int", 0, None)
+    assert PATIENT_RULES["gender"] == ("choice", ("Male", "Female"))
+
+
+def test_vectorized_validation_matches_pydantic(test_records):
+    good = {k: int(v) if isinstance(v, (int, np.integer)) else v for k, v in test_records[0].items()}
+    records = [good, {**good, "age": 0}, {**good, "time_in_hospital": 31},
+               {**good, "gender": "X"}, {**good, "number_emergency": -1}, good]
+    columns, nulls = as_columns(records)
+    nulls["insulin"][5] = True
+
+    valid, errors = columnar.validate_columns(columns, nulls, len(records), PATIENT_RULES)
+    assert valid.tolist() == [True, False, False, False, False, False]
+
+    for record, error in zip(records[1:5], errors[1:5]):
+        with pytest.raises(ValidationError) as e:
+            PatientInput(**record)
+        expected = e.value.errors()[0]
+        assert error == f"{expected['loc'][0]}: {expected['msg']}"
+    assert errors[5] == f"insulin: {columnar.NULL_ERROR}"
+
+
+def test_fractional_values_are_rejected(test_records):
+    columns, nulls = as_columns(test_records[:3])
+    columns["age"] = np.array([60.0, 60.5, np.nan])
+    valid, errors = columnar.validate_columns(columns, nulls, 3, PATIENT_RULES)
+    assert valid.tolist() == [True, False, False]
+    assert errors[1].startswith("age: Input should be a valid integer")
+
+
+def test_strings_and_bools_are_coerced_like_pydantic(test_records):
+    records = test_records[:8]
+    columns, nulls = as_columns(records)
+    ages = ["60", " 61 ", "62.0", "+63", "6e1", "60.5", "abc", "500"]
+    columns["age"] = np.array(ages, dtype=object)
+    columns["number_emergency"] = np.array([True, False] * 4)
+
+    valid, errors = columnar.validate_columns(columns, nulls, len(records), PATIENT_RULES)
+    for i, age in enumerate(ages):
+        try:
+            patient = PatientInput(**{**records[i], "age": age, "number_emergency": columns["number_emergency"][i]})
+        except ValidationError as e:
+            expected = e.errors()[0]
+            assert not valid[i] and errors[i] == f"{expected['loc'][0]}: {expected['msg']}"
+        else:
+            assert valid[i]
+            assert columns["age"][i] == patient.age
+            assert columns["number_emergency"][i] == patient.number_emergency
+    assert valid.tolist() == [True] * 4 + [False] * 4
+
+
+def test_missing_columns_fail_the_request(test_records):
+    columns, nulls = as_columns(test_records[:3])
+    del columns["age"]
+    with pytest.raises(columnar.ColumnarError, match="age"):
+        columnar.validate_columns(columns, nulls, 3, PATIENT_RULES)
+
+
+def test_column_encoding_matches_record_encoding(test_records):
+    records = test_records[:200]
+    columns, _ = as_columns(records)
+    preprocessor = registry.get().preprocessor
+    np.testing.assert_array_equal(
+        preprocessor.transform_columns(columns, len(records)),
+        preprocessor.transform_records(records),
+    )
+
+
+def test_accept_header_selects_the_response_format():
+    assert columnar.response_media_type("*/*", columnar.ARROW_STREAM) == columnar.ARROW_STREAM
+    assert columnar.response_media_type(
+        "application/json, application/vnd.apache.parquet", columnar.ARROW_STREAM
+    ) == columnar.PARQUET
+
+
+@pytest.mark.skipif(importlib.util.find_spec("pyarrow") is not None, reason="pyarrow is installed")
+def test_columnar_bodies_need_pyarrow():
+    response = client.post("/api/predict/batch", content=b"PAR1",
+                           headers={"content-type": columnar.PARQUET})
+    assert response.status_code == 415
+
+
+@pytest.mark.parametrize("content_type", [columnar.ARROW_STREAM, columnar.PARQUET])
+def test_columnar_batch_matches_json_batch(test_records, content_type):
+    pa = pytest.importorskip("pyarrow")
+
+    records = test_records[:100] + [{**test_records[0], "age": 500}]
+    table = pa.Table.from_pylist(records)
+    request_body = columnar.write_table(table, content_type)
+
+    response = client.post("/api/predict/batch", content=request_body,
+                           headers={"content-type": content_type})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith(content_type)
+    result = columnar.read_table(response.content, content_type).to_pylist()
+
+    expected = client.post("/api/predict/batch", json=records).json()["results"]
+    for row, json_row in zip(result, expected):
+        assert row["success"] == json_row["success"]
+        if row["success"]:
+            assert row["probability"] == pytest.approx(json_row["probability"], abs=0.01)
+            assert row["risk_level"] == json_row["risk_level"]
+        else:
+            assert row["error"].startswith("age: Input should be less than or equal to 120")
+
+
+def test_unversioned_model_omits_the_version_header(monkeypatch, test_records):
+    assert version_headers(None) == {}
+    pa = pytest.importorskip("pyarrow")
+
+    bundle = copy.copy(registry.get())
+    bundle.version = None
+    monkeypatch.setattr(registry, "get", lambda: bundle)
+
+    body = columnar.write_table(pa.Table.from_pylist(test_records[:5]), columnar.ARROW_STREAM)
+    response = client.post("/api/predict/batch", content=body,
+                           headers={"content-type": columnar.ARROW_STREAM})
+    assert response.status_code == 200
+    assert "x-model-version" not in response.headers
@@ -0,0 +1,52 @@
+"""
+Tests for the cached training data loader (app/utils/dataset.py)
+"""
+import numpy as np
+import pandas as pd
+
+from app.utils.dataset import ENCODED_FEATURES, RAW_COLUMNS, load_dataset
+from app.utils.preprocessing import PatientPreprocessor, clean_patient_frame, make_target
+
+
+def test_matches_the_dataframe_pipeline(raw_csv):
+    data = load_dataset(raw_csv)
+    df = pd.read_csv(raw_csv)
+    X = clean_patient_frame(df)
+
+    assert data.feature_names == ENCODED_FEATURES
+    assert data.X.dtype == np.int16 and data.y.dtype == np.int8
+    np.testing.assert_array_equal(data.y, make_target(df).to_numpy())
+
+    # Same feature names, scaler and scaled matrix as fitting on the frame
+    from_frame = PatientPreprocessor().fit(X)
+    from_cache = PatientPreprocessor().fit_encoded(data.X, data.feature_names)
+    assert from_cache.feature_names == from_frame.feature_names
+    np.testing.assert_array_equal(
+        from_cache.transform_encoded(data.X, data.feature_names),
+        from_frame.transform_frame(X, clean=False),
+    )
+
+
+def test_second_load_is_memory_mapped_from_cache(raw_csv):
+    first = load_dataset(raw_csv)
+    second = load_dataset(raw_csv)
+
+    assert not first.from_cache and second.from_cache
+    assert isinstance(second.X, np.memmap)
+    np.testing.assert_array_equal(first.X, second.X)
+
+
+def test_changed_source_invalidates_cache(raw_csv):
+    first = load_dataset(raw_csv)
+
+    df = pd.read_csv(raw_csv)
+    df.loc[0, "num_medications"] = 79 if df.loc[0, "num_medications"] != 79 else 78
+    df.to_csv(raw_csv, index=False)
+
+    second = load_dataset(raw_csv)
+    assert not second.from_cache and second.digest != first.digest
+    assert second.X[0, ENCODED_FEATURES.index("num_medications")] == df.loc[0, "num_medications"]
+
+
+def test_only_needed_columns_are_read():
+    assert "encounter_id" not in RAW_COLUMNS and "A1Cresult" in RAW_COLUMNS
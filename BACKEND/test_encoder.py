@@ -0,0 +1,44 @@
+"""
+Parity tests: precompiled FeatureEncoder vs. the pandas encoding pipeline
+"""
+import numpy as np
+import pandas as pd
+
+from app.model.encoder import FeatureEncoder
+
+
+def pandas_encode(records, feature_names, scaler):
+    """Reference path: DataFrame -> get_dummies -> reindex -> scaler"""
+    df = pd.get_dummies(pd.DataFrame(records), drop_first=True)
+    df = df.reindex(columns=feature_names, fill_value=0)
+    return scaler.transform(df)
+
+
+def test_transform_many_matches_pandas_bit_for_bit(test_records, feature_names, scaler):
+    encoder = FeatureEncoder(feature_names, scaler)
+
+    expected = pandas_encode(test_records, feature_names, scaler)
+    actual = encoder.transform_many(test_records)
+
+    assert actual.dtype == np.float64
+    assert actual.shape == expected.shape
+    assert np.array_equal(actual, expected)
+
+
+def test_transform_matches_pandas_per_record(test_records, feature_names, scaler):
+    encoder = FeatureEncoder(feature_names, scaler)
+    expected = pandas_encode(test_records, feature_names, scaler)
+
+    for i in range(0, len(test_records), 97):
+        row = encoder.transform(test_records[i])
+        assert row.shape == (1, len(feature_names))
+        assert np.array_equal(row[0], expected[i])
+
+
+def test_junk_and_missing_values_fall_back_to_zero(feature_names, scaler):
+    encoder = FeatureEncoder(feature_names, scaler)
+
+    junk = {"age": "?", "gender": None, "time_in_hospital": ""}
+    zeros = pd.DataFrame([[0] * len(feature_names)], columns=feature_names)
+
+    assert np.array_equal(encoder.transform(junk), scaler.transform(zeros))
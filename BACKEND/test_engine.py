@@ -0,0 +1,51 @@
+"""
+Parity tests: pure-NumPy NumpyMLP vs. sklearn MLPClassifier.predict_proba
+"""
+import numpy as np
+import pytest
+
+from app.model.encoder import FeatureEncoder
+from app.model.engine import NumpyMLP, export_weights
+
+
+@pytest.fixture(scope="module")
+def X_test_scaled(test_records, feature_names, scaler):
+    return FeatureEncoder(feature_names, scaler).transform_many(test_records)
+
+
+def test_float64_matches_sklearn(model, X_test_scaled):
+    engine = NumpyMLP.from_sklearn(model)
+
+    expected = model.predict_proba(X_test_scaled)
+    actual = engine.predict_proba(X_test_scaled)
+
+    assert actual.shape == expected.shape
+    np.testing.assert_allclose(actual, expected, rtol=1e-12, atol=1e-15)
+    assert np.array_equal(engine.predict(X_test_scaled), model.predict(X_test_scaled))
+
+
+def test_float32_mode_stays_close(model, X_test_scaled):
+    engine = NumpyMLP.from_sklearn(model, dtype="float32")
+
+    expected = model.predict_proba(X_test_scaled)[:, 1]
+    actual = engine.predict_positive(X_test_scaled)
+
+    assert actual.dtype == np.float32
+    np.testing.assert_allclose(actual, expected, atol=1e-5)
+
+
+def test_exported_weights_round_trip(tmp_path, model_dir, model, X_test_scaled):
+    weights_path = tmp_path / "ann_weights.npz"
+    exported = export_weights(model_dir / "ann_model.pkl", weights_path)
+    loaded = NumpyMLP.load(weights_path)
+
+    assert loaded.source_sha256 == exported.source_sha256 != ""
+    assert np.array_equal(loaded.predict_proba(X_test_scaled), exported.predict_proba(X_test_scaled))
+    np.testing.assert_allclose(
+        loaded.predict_proba(X_test_scaled), model.predict_proba(X_test_scaled), rtol=1e-12
+    )
+
+
+def test_rejects_unknown_dtype(model):
+    with pytest.raises(ValueError):
+        NumpyMLP.from_sklearn(model, dtype="int8")
@@ -0,0 +1,54 @@
+"""
+Tests for the vectorized evaluation module (app/training/evaluate.py)
+"""
+import numpy as np
+import pytest
+from sklearn.metrics import average_precision_score, brier_score_loss, f1_score, roc_auc_score
+
+import app.training.evaluate as evaluate_module
+from app.training.evaluate import THRESHOLDS, compare_reports, evaluate, score_split
+
+
+def sample(n=2000, seed=0):
+    rng = np.random.default_rng(seed)
+    proba = np.round(rng.random(n), 2)  # plenty of ties
+    y = (rng.random(n) < proba).astype(int)
+    return proba, y
+
+
+def test_metrics_match_sklearn():
+    proba, y = sample()
+    metrics = evaluate(proba, y, n_bootstrap=0)["metrics"]
+
+    assert metrics["auc"] == pytest.approx(roc_auc_score(y, proba), abs=1e-5)
+    assert metrics["average_precision"] == pytest.approx(average_precision_score(y, proba), abs=1e-5)
+    assert metrics["brier"] == pytest.approx(brier_score_loss(y, proba), abs=1e-5)
+    for t in THRESHOLDS:
+        assert metrics[f"f1@{t}"] == pytest.approx(f1_score(y, proba >= t), abs=1e-5)
+
+
+def test_bootstrap_intervals():
+    proba, y = sample()
+    report = evaluate(proba, y, n_bootstrap=300)
+
+    for name, (lo, hi) in report["confidence_intervals"].items():
+        assert lo <= report["metrics"][name] <= hi, name
+    assert evaluate(proba, y, n_bootstrap=300)["confidence_intervals"] == report["confidence_intervals"]
+    assert sum(b["count"] for b in report["calibration"]["bins"]) == len(y)
+
+
+def test_compare_reports_flags_regressions():
+    baseline = {"metrics": {"auc": 0.80, "average_precision": 0.50, "brier": 0.10}}
+    assert compare_reports({"metrics": {"auc": 0.799, "average_precision": 0.5, "brier": 0.101}}, baseline) == []
+
+    failures = compare_reports({"metrics": {"auc": 0.78, "average_precision": 0.5, "brier": 0.12}}, baseline)
+    assert [f.split(":")[0] for f in failures] == ["auc", "brier"]
+
+
+def test_probabilities_are_cached(tmp_path, monkeypatch):
+    proba, y, version = score_split("data", cache_dir=tmp_path)
+    assert len(proba) == len(y) and list(tmp_path.glob(f"eval/{version}-*.npz"))
+
+    monkeypatch.setattr(evaluate_module, "load_split", lambda *a: pytest.fail("split re-scored"))
+    cached, _, _ = score_split("data", cache_dir=tmp_path)
+    np.testing.assert_array_equal(cached, proba)
@@ -0,0 +1,60 @@
+"""
+Tests for the bounded inference executor and 503 backpressure
+"""
+import asyncio
+import threading
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.model.executor import InferenceExecutor, Overloaded
+from app.model.predict import executor
+
+client = TestClient(app)
+
+
+def test_admission_is_bounded_and_released():
+    pool = InferenceExecutor(max_workers=1, max_queue=1)
+    release = threading.Event()
+
+    async def call():
+        with pool.admit():
+            return await pool.run(release.wait, 5)
+
+    async def scenario():
+        first = asyncio.ensure_future(call())
+        second = asyncio.ensure_future(call())
+        await asyncio.sleep(0.01)
+
+        assert pool.stats()["pending"] == 2 and pool.queue_depth == 1
+        with pytest.raises(Overloaded):
+            await call()
+
+        release.set()
+        await asyncio.gather(first, second)
+
+    asyncio.run(scenario())
+    stats = pool.stats()
+    assert stats["pending"] == 0
+    assert stats["admitted"] == 2 and stats["rejected"] == 1
+    pool.shutdown()
+
+
+def test_full_queue_returns_503_with_retry_after(monkeypatch, test_records):
+    record = {**test_records[0], "age": 33, "number_diagnoses": 3}  # not cached
+    monkeypatch.setattr(executor, "pending", executor.limit)
+
+    for path, payload in (("/api/predict", record), ("/api/predict/batch", [record])):
+        response = client.post(path, json=payload)
+        assert response.status_code == 503
+        assert response.headers["retry-after"].isdigit()
+
+    assert client.get("/api/predict/queue").json()["rejected"] >= 2
+
+
+def test_admitted_requests_release_their_slot(test_records):
+    before = executor.stats()["pending"]
+    client.post("/api/predict/batch", json=test_records[200:210])
+    client.post("/api/predict", json=test_records[210])
+    assert executor.stats()["pending"] == before
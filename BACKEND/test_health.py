@@ -0,0 +1,106 @@
+"""
+Tests for the liveness / readiness endpoints and the model warm-up pass
+"""
+import asyncio
+import shutil
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api import health
+from app.api import predict as predict_api
+from app.main import app
+from app.model import predict as predict_module
+from app.model.artifacts import SOURCE_FILES
+from app.model.registry import ModelRegistry
+from app.model.warmup import CATEGORICAL_VALUES, synthetic_records, warm_up
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def artifact_dir(tmp_path, model_dir):
+    for name in SOURCE_FILES:
+        shutil.copy(model_dir / name, tmp_path / name)
+    shutil.copytree(model_dir / "serving", tmp_path / "serving")
+    return tmp_path
+
+
+def test_live_does_not_load_the_model(monkeypatch, tmp_path):
+    registry = ModelRegistry(tmp_path)
+    monkeypatch.setattr(health, "registry", registry)
+
+    response = client.get("/health/live")
+    assert response.status_code == 200
+    assert response.json() == {"status": "alive"}
+    assert not registry.loaded
+
+
+def test_ready_loads_and_reports_warmup(monkeypatch, artifact_dir):
+    registry = ModelRegistry(artifact_dir, warmup=warm_up)
+    monkeypatch.setattr(health, "registry", registry)
+
+    response = client.get("/health/ready")
+    assert response.status_code == 200
+    body = response.json()
+    assert body["status"] == "ready"
+    assert body["version"] == registry.get().version
+    assert body["warmup"]["rows"] == 64
+    assert body["warmup"]["total_ms"] >= body["warmup"]["batch_ms"] > 0
+    assert body["load_ms"] > 0
+    assert client.get("/health").json() == body
+
+
+def test_ready_is_503_without_a_model(monkeypatch, tmp_path):
+    monkeypatch.setattr(health, "registry", ModelRegistry(tmp_path))
+
+    response = client.get("/health/ready")
+    assert response.status_code == 503
+    assert "Retry-After" in response.headers
+
+
+def test_failed_warmup_keeps_the_live_bundle(artifact_dir):
+    calls = []
+
+    def warmup(bundle):
+        calls.append(bundle)
+        if len(calls) > 1:
+            raise ValueError("warm-up failed")
+        return warm_up(bundle, rows=8)
+
+    registry = ModelRegistry(artifact_dir, warmup=warmup)
+    live = registry.get()
+    assert live.warmup["rows"] == 8
+
+    with pytest.raises(ValueError):
+        registry.reload()
+    assert registry.get() is live
+
+
+def test_synthetic_records_cover_every_combination():
+    records = synthetic_records(16)
+    combinations = {tuple(r[f] for f in CATEGORICAL_VALUES) for r in records}
+    assert len(combinations) == 2 ** len(CATEGORICAL_VALUES)
+    assert all(1 <= r["age"] <= 120 and 0 <= r["time_in_hospital"] <= 30 for r in records)
+
+
+def test_model_loads_off_the_event_loop(monkeypatch, artifact_dir, test_records):
+    on_loop = []
+
+    def warmup(bundle):
+        try:
+            asyncio.get_running_loop()
+            on_loop.append(True)
+        except RuntimeError:
+            on_loop.append(False)
+        return warm_up(bundle, rows=8)
+
+    registry = ModelRegistry(artifact_dir, warmup=warmup)
+    monkeypatch.setattr(predict_api, "registry", registry)
+    monkeypatch.setattr(predict_module, "registry", registry)
+    assert registry.current is None and registry.refresh_due
+
+    response = client.post("/api/predict", json=test_records[0])
+    assert response.status_code == 200
+    assert on_loop == [False]
+    assert registry.current is not None and not registry.refresh_due
@@ -0,0 +1,77 @@
+"""
+Tests for incremental warm-start retraining (app/training/incremental.py)
+"""
+import json
+import shutil
+from pathlib import Path
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from app.model.registry import ModelRegistry
+from app.training.incremental import STATE_FILE, incremental_retrain, load_new_records, rescale_first_layer
+
+MODEL_DIR = Path(__file__).parent / "model"
+QUIET = dict(log=lambda _: None)
+
+
+def copy_model(tmp_path):
+    model_dir = tmp_path / "model"
+    model_dir.mkdir()
+    for name in ("ann_model.pkl", "scaler.pkl", "feature_names.pkl"):
+        shutil.copy(MODEL_DIR / name, model_dir / name)
+    return model_dir
+
+
+def test_rescale_first_layer_keeps_predictions(raw_csv):
+    model = joblib.load(MODEL_DIR / "ann_model.pkl")
+    scaler = joblib.load(MODEL_DIR / "scaler.pkl")
+    feature_names = list(joblib.load(MODEL_DIR / "feature_names.pkl"))
+
+    X, _, _ = load_new_records(raw_csv)
+    X = pd.DataFrame(X.astype(float), columns=feature_names)
+    before = model.predict_proba(scaler.transform(X))[:, 1]
+
+    new_scaler = joblib.load(MODEL_DIR / "scaler.pkl").partial_fit(X)
+    rescale_first_layer(model, scaler, new_scaler)
+    after = model.predict_proba(new_scaler.transform(X))[:, 1]
+
+    assert not np.allclose(new_scaler.mean_, scaler.mean_)
+    np.testing.assert_allclose(after, before, rtol=1e-9, atol=1e-12)
+
+
+def test_only_new_encounters_are_used(raw_csv):
+    X, y, last_id = load_new_records(raw_csv, since=399)
+    assert len(X) == len(y) == 100 and last_id == 499
+
+    X, y, last_id = load_new_records(raw_csv, since=499)
+    assert len(y) == 0 and last_id is None
+
+
+def test_update_is_published_and_watermarked(raw_csv, tmp_path):
+    model_dir = copy_model(tmp_path)
+
+    report = incremental_retrain(model_dir, raw_csv, raw_csv, since=249, epochs=2,
+                                 tolerance=1.0, publish_model=True, **QUIET)
+    assert report["accepted"] and report["new_rows"] == 250
+
+    state = json.loads((model_dir / STATE_FILE).read_text())
+    assert state["last_encounter_id"] == 499 and len(state["history"]) == 1
+    assert ModelRegistry(model_dir).get().source == "serving"
+
+    # Nothing new after the watermark
+    assert incremental_retrain(model_dir, raw_csv, raw_csv, **QUIET)["new_rows"] == 0
+
+
+def test_regression_is_rejected(raw_csv, tmp_path):
+    model_dir = copy_model(tmp_path)
+    original = (model_dir / "ann_model.pkl").read_bytes()
+
+    # tolerance=-1 demands an AUC gain of 1.0, which no update can reach
+    report = incremental_retrain(model_dir, raw_csv, raw_csv, epochs=1, learning_rate=10.0,
+                                 tolerance=-1.0, publish_model=True, **QUIET)
+
+    assert not report["accepted"]
+    assert (model_dir / "ann_model.pkl").read_bytes() == original
+    assert not (model_dir / STATE_FILE).exists()
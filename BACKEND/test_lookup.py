@@ -0,0 +1,64 @@
+"""
+Parity tests: lookup-table scorer vs. the full encode + predict_proba path
+"""
+import numpy as np
+import pytest
+
+from app.model.lookup import FIELD_MAX, LookupScorer
+from app.model.registry import ModelRegistry
+
+
+@pytest.fixture(scope="module")
+def bundle(model_dir):
+    return ModelRegistry(model_dir).get()
+
+
+@pytest.fixture(scope="module")
+def scorer(bundle):
+    return LookupScorer(bundle.model, bundle.preprocessor)
+
+
+def full_model(bundle, records):
+    return bundle.model.predict_proba(bundle.preprocessor.transform_records(records))[:, 1]
+
+
+def test_tables_cover_every_category_combination(scorer):
+    assert scorer.combinations.shape[0] == 8
+    assert scorer.tables.shape[1] == scorer.combinations.shape[1]
+
+
+def test_table_bounds_follow_the_schema(scorer):
+    assert FIELD_MAX == {"age": 120, "time_in_hospital": 30}
+    bounds = dict(zip(scorer.numeric_fields, scorer._max.tolist()))
+    assert bounds["age"] == 120 and bounds["num_medications"] == 255
+
+
+def test_matches_full_model(bundle, scorer, test_records):
+    expected = full_model(bundle, test_records)
+
+    np.testing.assert_allclose(scorer.predict_positive(test_records), expected, rtol=0, atol=1e-12)
+    single = [scorer.predict_one(r) for r in test_records[:500]]
+    np.testing.assert_allclose(single, expected[:500], rtol=0, atol=1e-12)
+
+
+@pytest.mark.parametrize("change", [
+    {"number_emergency": 10_000},              # beyond the table
+    {"num_medications": 12.5},                 # not an integer
+    {"insulin": "?", "gender": None},          # junk → no one-hot column
+    {"age": "NA", "diabetesMed": "Unknown"},
+])
+def test_values_outside_the_tables(bundle, scorer, test_records, change):
+    record = {**test_records[0], **change}
+    expected = full_model(bundle, [record])[0]
+    assert scorer.predict_one(record) == pytest.approx(expected, abs=1e-12)
+
+
+def test_registry_serves_lookup_scores(model_dir, bundle, test_records):
+    from app.model import predict as predict_module
+
+    lookup_bundle = ModelRegistry(model_dir, lookup=True).get()
+    assert lookup_bundle.lookup is not None and lookup_bundle.info()["lookup"]
+
+    plain = predict_module.predict_batch(test_records[:50], bundle, use_cache=False)
+    fast = predict_module.predict_batch(test_records[:50], lookup_bundle, use_cache=False)
+    assert fast == plain
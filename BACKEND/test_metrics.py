@@ -0,0 +1,53 @@
+"""
+Tests for the Prometheus metrics registry and GET /metrics
+"""
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.utils import metrics as metrics_module
+from app.utils.metrics import STAGE_LATENCY, MetricsRegistry, time_stage
+
+client = TestClient(app)
+
+
+def test_histogram_buckets_are_cumulative():
+    registry = MetricsRegistry()
+    histogram = registry.histogram("latency_seconds", "test", ("stage",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 5.0):
+        histogram.observe(value, "encode")
+
+    lines = registry.render().splitlines()
+    assert 'latency_seconds_bucket{stage="encode",le="0.1"} 2' in lines
+    assert 'latency_seconds_bucket{stage="encode",le="1.0"} 3' in lines
+    assert 'latency_seconds_bucket{stage="encode",le="+Inf"} 4' in lines
+    assert 'latency_seconds_count{stage="encode"} 4' in lines
+
+
+def test_label_values_are_escaped():
+    registry = MetricsRegistry()
+    registry.counter("errors_total", "test", ("type",)).inc('bad "value"\n')
+    assert 'errors_total{type="bad \\"value\\"\\n"} 1' in registry.render()
+
+
+def test_disabled_timers_record_nothing(monkeypatch):
+    monkeypatch.setattr(metrics_module.metrics, "enabled", False)
+    before = STAGE_LATENCY.count("preprocess")
+    with time_stage("preprocess"):
+        pass
+    assert STAGE_LATENCY.count("preprocess") == before
+
+
+def test_metrics_endpoint_counts_requests_and_stages(test_records):
+    client.post("/api/predict/batch", json=test_records[100:110])
+    client.post("/api/predict", json={})
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+
+    text = response.text
+    assert 'http_requests_total{method="POST",route="/api/predict/batch",status="200"}' in text
+    assert 'http_requests_total{method="POST",route="/api/predict",status="422"}' in text
+    for stage in ("preprocess", "inference", "interpret"):
+        assert f'prediction_stage_duration_seconds_count{{stage="{stage}"}}' in text
+    assert 'model_info{version="' in text
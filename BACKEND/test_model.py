@@ -4,13 +4,13 @@ Test script to verify the retrained model works correctly
 import sys
 from pathlib import Path
 import joblib
-import pandas as pd
 import numpy as np
 
 # Add app to path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from app.model.predict import predict_diabetic_retinopathy
+from app.utils.preprocessing import PatientPreprocessor
 
 print("="*60)
 print("🧪 TESTING RETRAINED MODEL")
@@ -146,16 +146,23 @@ try:
         "diabetesMed": "Yes"
     }
     
-    # Convert to DataFrame and encode (same as prediction function)
-    df = pd.DataFrame([test_data])
-    df_encoded = pd.get_dummies(df, drop_first=True)
-    df_aligned = df_encoded.reindex(columns=feature_names, fill_value=0)
+    # Encode with the same preprocessor the prediction function uses
+    scaler = joblib.load(model_dir / "scaler.pkl")
+    preprocessor = PatientPreprocessor.from_artifacts(feature_names, scaler)
+    row = preprocessor.transform_record(test_data)
     
     print(f"  ✅ Input features: {len(test_data)}")
-    print(f"  ✅ Encoded features: {df_encoded.shape[1]}")
-    print(f"  ✅ Aligned features: {df_aligned.shape[1]} (matches model: {len(feature_names)})")
+    print(f"  ✅ Encoded features: {row.shape[1]} (matches model: {len(feature_names)})")
     
-    if df_aligned.shape[1] != len(feature_names):
+    # One-hot slots must be set for Male / Yes / Yes, not left at 0
+    hot = [f for f in feature_names if "_" in f and f.split("_")[0] in ("gender", "insulin", "diabetesMed")]
+    zero_row = preprocessor.transform_record({})
+    unset = [f for f in hot if row[0, feature_names.index(f)] == zero_row[0, feature_names.index(f)]]
+    if unset:
+        print(f"  ❌ ERROR: One-hot features not encoded: {unset}")
+        all_passed = False
+    
+    if row.shape[1] != len(feature_names):
         print(f"  ❌ ERROR: Feature count mismatch!")
         all_passed = False
     else:
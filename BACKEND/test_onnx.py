@@ -0,0 +1,73 @@
+"""
+Parity tests: ONNX graph (scaler + MLP) in onnxruntime vs. the sklearn path.
+Skipped when the optional onnx / onnxruntime packages are not installed.
+"""
+import shutil
+
+import numpy as np
+import pytest
+
+pytest.importorskip("onnx")
+pytest.importorskip("onnxruntime")
+
+from app.model.encoder import FeatureEncoder  # noqa: E402
+from app.model.onnx_engine import IR_VERSION, ONNX_FILE, OPSET, OnnxMLP, build_onnx, export_onnx  # noqa: E402
+from app.model.registry import ModelRegistry  # noqa: E402
+from app.utils.dataset import ENCODED_FEATURES, encode_frame  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def X_encoded(test_records, feature_names):
+    import pandas as pd
+
+    X = encode_frame(pd.DataFrame(test_records))
+    return X[:, [ENCODED_FEATURES.index(f) for f in feature_names]].astype(np.float64)
+
+
+@pytest.fixture(scope="module")
+def expected(model, scaler, feature_names, test_records):
+    X_scaled = FeatureEncoder(feature_names, scaler).transform_many(test_records)
+    return model.predict_proba(X_scaled)[:, 1]
+
+
+@pytest.mark.parametrize("dtype, atol", [("float64", 1e-12), ("float32", 1e-5)])
+def test_graph_matches_sklearn(model, scaler, feature_names, X_encoded, expected, dtype, atol):
+    engine = OnnxMLP(build_onnx(model, scaler, list(feature_names), dtype=dtype))
+
+    np.testing.assert_allclose(engine.predict_positive(X_encoded), expected, rtol=0, atol=atol)
+    assert engine.predict_proba(X_encoded[:1]).shape == (1, 2)
+
+
+def test_registry_serves_onnx(model_dir, tmp_path, test_records):
+    from app.model import predict as predict_module
+
+    copy = tmp_path / "model"
+    shutil.copytree(model_dir, copy, ignore=shutil.ignore_patterns("backup_*"))
+    export_onnx(copy, dtype="float64")
+
+    bundle = ModelRegistry(copy, engine="onnx", onnx_threads=2).get()
+    assert isinstance(bundle.model, OnnxMLP) and bundle.model.intra_op_threads == 2
+
+    reference = ModelRegistry(model_dir).get()
+    records = test_records[:200]
+    assert predict_module.predict_batch(records, bundle, use_cache=False) == \
+        predict_module.predict_batch(records, reference, use_cache=False)
+
+
+def test_load_onnx_rebuilds_a_stale_file(model, scaler, feature_names, model_dir, tmp_path):
+    from app.model.onnx_engine import load_onnx
+
+    copy = tmp_path / "model"
+    shutil.copytree(model_dir, copy, ignore=shutil.ignore_patterns("backup_*"))
+    (copy / ONNX_FILE).write_bytes(build_onnx(model, scaler, list(feature_names), version="old"))
+
+    version = ModelRegistry(copy).get().version
+    assert load_onnx(copy, version).version == version
+
+
+def test_graph_uses_a_runtime_compatible_ir_version(model, scaler, feature_names):
+    import onnx
+
+    graph = onnx.load_from_string(build_onnx(model, scaler, list(feature_names)))
+    assert graph.ir_version == IR_VERSION
+    assert graph.opset_import[0].version == OPSET
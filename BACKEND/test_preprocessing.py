@@ -0,0 +1,55 @@
+"""
+Tests for the shared PatientPreprocessor
+"""
+import numpy as np
+import pandas as pd
+from sklearn.preprocessing import StandardScaler
+
+from app.utils.preprocessing import PatientPreprocessor, clean_patient_frame
+
+
+def test_fit_reproduces_training_encoding(test_records):
+    X = pd.DataFrame(test_records)
+    pre = PatientPreprocessor().fit(X)
+
+    encoded = pd.get_dummies(X, drop_first=True)
+    scaler = StandardScaler().fit(encoded)
+
+    assert pre.feature_names == list(encoded.columns)
+    assert np.array_equal(pre.transform_frame(X, clean=False), scaler.transform(encoded))
+
+
+def test_frame_and_record_paths_agree(test_records, feature_names, scaler):
+    pre = PatientPreprocessor.from_artifacts(feature_names, scaler)
+    records = test_records[:500]
+
+    bulk = pre.transform_frame(pd.DataFrame(records))
+    assert np.array_equal(bulk, pre.transform_records(records))
+    assert np.array_equal(bulk[7], pre.transform_record(records[7])[0])
+
+
+def test_clean_matches_notebook_normalization():
+    raw = pd.DataFrame({
+        "age": ["[70-80)", "?"], "gender": ["Unknown/Invalid", np.nan],
+        "time_in_hospital": [1, 2], "num_lab_procedures": [3, 4],
+        "num_medications": [5, 6], "number_outpatient": [0, 0],
+        "number_emergency": [0, 0], "number_inpatient": [0, 0],
+        "number_diagnoses": [9, 1], "insulin": ["Down", "?"],
+        "diabetesMed": ["Ch", "No"], "race": ["?", "?"],
+    })
+    X = clean_patient_frame(raw)
+
+    assert list(X.columns)[:2] == ["age", "gender"] and "race" not in X
+    assert X["age"].iloc[0] == 75 and np.isnan(X["age"].iloc[1])
+    assert X["gender"].tolist() == ["Male", "Male"]
+    assert X["insulin"].tolist() == ["Yes", "No"]
+    assert X["diabetesMed"].tolist() == ["Yes", "No"]
+
+
+def test_pickle_round_trip(tmp_path, test_records):
+    pre = PatientPreprocessor().fit(pd.DataFrame(test_records))
+    pre.save(tmp_path / "preprocessor.pkl")
+    loaded = PatientPreprocessor.load(tmp_path / "preprocessor.pkl")
+
+    assert loaded.feature_names == pre.feature_names
+    assert np.array_equal(loaded.transform_record(test_records[0]), pre.transform_record(test_records[0]))
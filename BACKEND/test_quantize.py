@@ -0,0 +1,65 @@
+"""
+Tests for float16 / int8 quantized weights (app/model/quantize.py)
+"""
+import shutil
+
+import numpy as np
+import pytest
+
+from app.model.encoder import FeatureEncoder
+from app.model.engine import NumpyMLP
+from app.model.quantize import QUANTIZED_FORMATS, QuantizedMLP, quantize_layer, weights_file
+from app.model.registry import ModelRegistry
+from app.training.evaluate import roc_auc
+
+
+@pytest.fixture(scope="module")
+def X_test_scaled(test_records, feature_names, scaler):
+    return FeatureEncoder(feature_names, scaler).transform_many(test_records)
+
+
+def test_int8_per_channel_error_is_half_a_step(model):
+    coef = model.coefs_[1]
+    q, scale = quantize_layer(coef, "int8")
+
+    assert q.dtype == np.int8 and scale.shape == (coef.shape[1],)
+    assert np.all(np.abs(q.astype(np.float64) * scale - coef) <= scale / 2 + 1e-7)
+
+
+@pytest.mark.parametrize("fmt", QUANTIZED_FORMATS)
+def test_quantized_model_stays_close(model, X_test_scaled, y_test, fmt):
+    exact = NumpyMLP.from_sklearn(model).predict_positive(X_test_scaled)
+    engine = QuantizedMLP.from_sklearn(model, fmt)
+    approx = engine.predict_positive(X_test_scaled)
+
+    assert engine.nbytes < sum(c.nbytes for c in model.coefs_) / 3
+    assert np.max(np.abs(approx - exact)) < 0.1
+    assert np.mean((approx > 0.5) == (exact > 0.5)) > 0.999
+    assert abs(roc_auc(approx, y_test) - roc_auc(exact, y_test)) < 0.01
+
+
+def test_save_load_roundtrip(model, X_test_scaled, tmp_path):
+    engine = QuantizedMLP.from_sklearn(model, "int8")
+    engine.save(tmp_path / "w.npz")
+    loaded = QuantizedMLP.load(tmp_path / "w.npz")
+
+    assert loaded.format == "int8" and loaded.weights[0].dtype == np.int8
+    np.testing.assert_array_equal(loaded.predict_proba(X_test_scaled[:100]),
+                                  engine.predict_proba(X_test_scaled[:100]))
+
+
+def test_registry_serves_quantized_weights(model_dir, tmp_path):
+    bundle = ModelRegistry(model_dir, dtype="int8").get()
+    assert isinstance(bundle.model, QuantizedMLP) and bundle.source == "pickle"
+
+    # A stale export is ignored and the pickle quantized instead
+    copy = tmp_path / "model"
+    shutil.copytree(model_dir, copy, ignore=shutil.ignore_patterns("backup_*"))
+    QuantizedMLP.from_coefs([np.zeros_like(c) for c in bundle.model.coefs],
+                            bundle.model.intercepts, fmt="int8").save(copy / weights_file("int8"))
+    fallback = ModelRegistry(copy, dtype="int8").get().model
+    assert fallback.source_sha256 == "" and np.any(fallback.weights[0])
+
+
+def test_exact_model_is_the_default(model_dir):
+    assert isinstance(ModelRegistry(model_dir).get().model, NumpyMLP)
@@ -0,0 +1,69 @@
+"""
+Tests for the lazy, hot-swappable ModelRegistry
+"""
+import os
+import shutil
+import time
+
+import joblib
+import pytest
+
+from app.model.artifacts import SOURCE_FILES
+from app.model.registry import ModelRegistry
+
+
+@pytest.fixture
+def artifact_dir(tmp_path, model_dir):
+    for name in SOURCE_FILES + ("ann_weights.npz",):
+        shutil.copy(model_dir / name, tmp_path / name)
+    shutil.copytree(model_dir / "serving", tmp_path / "serving")
+    return tmp_path
+
+
+def touch(path, offset):
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + offset))
+
+
+def test_loads_lazily_on_first_use(artifact_dir):
+    registry = ModelRegistry(artifact_dir)
+    assert not registry.loaded
+
+    bundle = registry.get()
+    assert registry.loaded
+    assert registry.get() is bundle
+    assert len(bundle.version) == 12
+
+
+def test_reload_swaps_bundle_and_keeps_old_one_usable(artifact_dir):
+    registry = ModelRegistry(artifact_dir)
+    old = registry.get()
+
+    new = registry.reload()
+    assert registry.get() is new and new is not old
+
+    # A request that grabbed the old bundle still scores with it
+    row = old.preprocessor.transform_record({"age": 60, "gender": "Male"})
+    assert 0.0 <= old.model.predict_proba(row)[0, 1] <= 1.0
+
+
+def test_mismatched_artifacts_are_rejected(artifact_dir):
+    registry = ModelRegistry(artifact_dir)
+    live = registry.get()
+
+    joblib.dump(["age", "gender_Male"], artifact_dir / "feature_names.pkl")
+    with pytest.raises(ValueError):
+        registry.reload()
+    assert registry.get() is live
+
+
+def test_changed_files_are_picked_up_once_stable(artifact_dir):
+    registry = ModelRegistry(artifact_dir, reload_interval=0.01)
+    first = registry.get()
+
+    touch(artifact_dir / "scaler.pkl", 10**9)
+
+    time.sleep(0.02)
+    assert registry.get() is first  # change seen, waiting for files to settle
+    time.sleep(0.02)
+    assert registry.get() is not first
@@ -0,0 +1,49 @@
+"""
+Tests for the shared, config-driven risk banding
+"""
+import numpy as np
+import pytest
+
+from app.api.routes import get_next_steps, interpret_risk_level
+from app.config import RISK_THRESHOLDS
+from app.model.predict import interpret_probability, predict_batch
+from app.model.risk import RISK_BANDS, RiskBanding
+
+
+def test_bands_follow_config():
+    assert RISK_BANDS.edges == [RISK_THRESHOLDS["low"], RISK_THRESHOLDS["moderate"], RISK_THRESHOLDS["high"]]
+    levels = [interpret_probability(p)["risk_level"] for p in (0.0, 0.3, 0.5, 0.7, 1.0)]
+    assert levels == ["VERY LOW RISK", "LOW RISK", "MODERATE RISK", "HIGH RISK", "HIGH RISK"]
+
+
+def test_vectorized_codes_match_single_values():
+    p = np.concatenate([np.random.default_rng(0).random(10_000), RISK_BANDS.edges,
+                        np.nextafter(RISK_BANDS.edges, 0)])
+    codes = RISK_BANDS.codes(p)
+    assert codes.tolist() == [RISK_BANDS.code(float(x)) for x in p]
+    assert RISK_BANDS.interpret_many(p) == [interpret_probability(float(x)) for x in p]
+
+
+def test_custom_and_invalid_thresholds():
+    banding = RiskBanding({"low": 0.2, "moderate": 0.4, "high": 0.9})
+    assert banding.codes([0.1, 0.2, 0.5, 0.95]).tolist() == [0, 1, 2, 3]
+
+    with pytest.raises(ValueError):
+        RiskBanding({"low": 0.5, "moderate": 0.4, "high": 0.9})
+    with pytest.raises(ValueError):
+        RiskBanding({"low": 0.3, "moderate": 0.7})
+
+
+def test_outputs_share_the_band_texts(test_records):
+    results = predict_batch(test_records[:200])
+    for result in results:
+        band = RISK_BANDS.by_risk_level(result["risk_level"])
+        assert result["risk_level"] is band.risk_level
+        assert result["recommendation"] is band.recommendation
+
+
+def test_route_helpers_use_the_same_bands():
+    assert interpret_risk_level(0.75).startswith("High probability")
+    assert interpret_risk_level(0.55).startswith("Moderate risk")
+    assert get_next_steps("HIGH RISK")[0].startswith("Schedule appointment with ophthalmologist")
+    assert get_next_steps("LOW RISK") == get_next_steps("VERY LOW RISK")
@@ -0,0 +1,50 @@
+"""
+Tests for the offline chunked scorer
+"""
+import numpy as np
+import pandas as pd
+
+from app.model.registry import ModelRegistry
+from app.model.scoring import score_file
+
+
+def test_chunked_scores_match_online_path(tmp_path, model_dir, test_records):
+    records = test_records[:2500]
+    input_path = tmp_path / "patients.csv"
+    pd.DataFrame(records).assign(patient_id=range(len(records))).to_csv(input_path, index=False)
+
+    output_path = tmp_path / "scores.csv"
+    n_rows = score_file(input_path, output_path, model_dir, chunk_size=1000, keep_columns=["patient_id"])
+
+    scored = pd.read_csv(output_path)
+    assert n_rows == len(scored) == len(records)
+    assert list(scored.columns) == ["patient_id", "probability", "risk_level", "recommendation"]
+    assert scored["patient_id"].tolist() == list(range(len(records)))
+
+    bundle = ModelRegistry(model_dir).get()
+    expected = bundle.model.predict_proba(bundle.preprocessor.transform_records(records))[:, 1]
+    np.testing.assert_allclose(scored["probability"].to_numpy(), expected, rtol=1e-12)
+
+
+def test_raw_registry_values_are_cleaned(tmp_path, model_dir):
+    raw = pd.DataFrame({
+        "age": ["[60-70)", "?"], "gender": ["Unknown/Invalid", "Female"],
+        "time_in_hospital": [3, 5], "num_lab_procedures": [40, 10],
+        "num_medications": [12, 3], "number_outpatient": [0, 1],
+        "number_emergency": [0, 0], "number_inpatient": [1, 0],
+        "number_diagnoses": [7, 2], "insulin": ["Steady", "No"],
+        "diabetesMed": ["Ch", "No"],
+    })
+    clean = pd.DataFrame({
+        **raw, "age": [65, 0], "gender": ["Male", "Female"],
+        "insulin": ["Yes", "No"], "diabetesMed": ["Yes", "No"],
+    })
+    raw.to_csv(tmp_path / "raw.csv", index=False)
+    clean.to_csv(tmp_path / "clean.csv", index=False)
+
+    score_file(tmp_path / "raw.csv", tmp_path / "raw_out.csv", model_dir)
+    score_file(tmp_path / "clean.csv", tmp_path / "clean_out.csv", model_dir)
+
+    raw_scores = pd.read_csv(tmp_path / "raw_out.csv")["probability"]
+    clean_scores = pd.read_csv(tmp_path / "clean_out.csv")["probability"]
+    assert np.array_equal(raw_scores.to_numpy(), clean_scores.to_numpy())
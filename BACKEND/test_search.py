@@ -0,0 +1,43 @@
+"""
+Tests for the parallel hyperparameter search (app/training/search.py)
+"""
+import json
+
+import pytest
+
+from app.model.registry import ModelRegistry
+from app.training.search import DEFAULT_SPACE, make_trials, search
+
+
+def test_grid_and_random_trials():
+    grid = make_trials(DEFAULT_SPACE, "grid")
+    assert len(grid) == 4 * 3 * 3 * 2
+    assert len({json.dumps(t, sort_keys=True) for t in grid}) == len(grid)
+
+    random = make_trials(DEFAULT_SPACE, "random", n_trials=5)
+    assert len(random) == 5 and all(t in grid for t in random)
+    assert make_trials(DEFAULT_SPACE, "random", n_trials=5) == random  # seeded
+
+
+def test_empty_search_space_is_rejected(tmp_path):
+    with pytest.raises(ValueError, match="no trials"):
+        search(tmp_path / "unused.csv", tmp_path, space={"alpha": []}, workers=1)
+
+
+def test_search_exports_a_loadable_model(raw_csv, tmp_path):
+    space = {
+        "hidden_layer_sizes": [(8,)],
+        "alpha": [1e-4],
+        "batch_size": [64],
+        "learning_rate_init": [1e-2, 1e-7],  # the second one is hopeless
+    }
+    out_dir = tmp_path / "candidate"
+    summary = search(raw_csv, out_dir, space=space, workers=1,
+                     max_epochs=8, grace_epochs=2, abort_margin=0.01, log=lambda _: None)
+
+    assert summary["best"]["params"]["learning_rate_init"] == 1e-2
+    assert len(summary["trials"]) == 2
+    assert json.loads((out_dir / "search_results.json").read_text())["best"] == summary["best"]
+
+    bundle = ModelRegistry(out_dir).get()
+    assert bundle.source == "serving" and len(bundle.feature_names) == 11
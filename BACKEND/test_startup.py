@@ -0,0 +1,60 @@
+"""
+Worker boot cost: the API's import graph must stay free of pandas / sklearn
+"""
+import json
+import os
+import subprocess
+import sys
+
+from conftest import BACKEND_DIR
+
+# Never imported by app.main, nor by the first model load from model/serving/
+HEAVY_MODULES = ("pandas", "sklearn", "scipy", "joblib", "matplotlib", "tensorflow")
+
+# Cumulative `python -X importtime -c "import app.main"` (fastapi itself is
+# most of it); generous enough for a loaded CI box, far below pandas + sklearn
+IMPORT_BUDGET_US = int(os.getenv("IMPORT_TIME_BUDGET_US", "1500000"))
+
+
+def _python(*args):
+    env = dict(os.environ, MODEL_RELOAD_INTERVAL="0", PRELOAD_MODEL="0")
+    return subprocess.run(
+        [sys.executable, *args], cwd=BACKEND_DIR, env=env,
+        capture_output=True, text=True, check=True,
+    )
+
+
+def _import_times(stderr):
+    """
+    {module: cumulative µs} from -X importtime output
+    """
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_app_import_stays_within_budget():
+    times = _import_times(_python("-X", "importtime", "-c", "import app.main").stderr)
+
+    heavy = sorted(m for m in times if m.split(".")[0] in HEAVY_MODULES)
+    assert not heavy, f"app.main imports {heavy[:5]}"
+    assert times["app.main"] < IMPORT_BUDGET_US, f"import app.main took {times['app.main'] / 1e6:.2f}s"
+
+
+def test_first_model_load_needs_only_numpy():
+    script = (
+        "import json, sys\n"
+        "from app.model.predict import predict_diabetic_retinopathy, registry\n"
+        "result = predict_diabetic_retinopathy({})\n"
+        "print(json.dumps({'success': result['success'], 'source': registry.get().source,\n"
+        "                  'modules': sorted(sys.modules)}))\n"
+    )
+    out = json.loads(_python("-W", "ignore", "-c", script).stdout.splitlines()[-1])
+
+    assert out["success"]
+    assert out["source"] == "serving"
+    assert not [m for m in out["modules"] if m.split(".")[0] in HEAVY_MODULES]
@@ -0,0 +1,96 @@
+"""
+Tests for POST /api/predict/stream (NDJSON in, NDJSON out)
+"""
+import asyncio
+import copy
+import json
+
+from fastapi.testclient import TestClient
+
+from app.api import stream
+from app.main import app
+from app.model.predict import registry
+
+client = TestClient(app)
+
+
+def ndjson(records):
+    return "".join(json.dumps(r) + "\n" for r in records)
+
+
+def test_stream_matches_batch_endpoint(monkeypatch, test_records):
+    monkeypatch.setattr(stream, "STREAM_CHUNK_SIZE", 7)
+    records = test_records[300:330]
+
+    response = client.post("/api/predict/stream", content=ndjson(records))
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    batch = client.post("/api/predict/batch", json=records).json()["results"]
+    assert [line["index"] for line in lines] == list(range(30))
+    assert [line["probability"] for line in lines] == [r["probability"] for r in batch]
+
+
+def test_unversioned_model_streams_without_a_version_header(monkeypatch, test_records):
+    bundle = copy.copy(registry.get())
+    bundle.version = None
+
+    async def current_bundle():
+        return bundle
+
+    monkeypatch.setattr(stream, "current_bundle", current_bundle)
+    response = client.post("/api/predict/stream", content=ndjson(test_records[:3]))
+    assert response.status_code == 200
+    assert "x-model-version" not in response.headers
+    assert all(json.loads(line)["success"] for line in response.text.splitlines())
+
+
+def test_bad_lines_are_reported_in_place(monkeypatch, test_records):
+    monkeypatch.setattr(stream, "STREAM_MAX_LINE_BYTES", 1024)
+    good = json.dumps(test_records[0])
+    body = "\n".join([
+        good,
+        "{not json",
+        json.dumps({**test_records[0], "age": 500}),
+        "[1, 2]",
+        '{"pad": "' + "x" * 5000 + '"}',
+        "",
+        good,
+    ])
+
+    lines = [json.loads(line) for line in client.post("/api/predict/stream", content=body).text.splitlines()]
+    assert [line["success"] for line in lines] == [True, False, False, False, False, True]
+    assert lines[2]["errors"][0]["loc"] == ["age"]
+    assert "longer than" in lines[4]["errors"][0]["msg"]
+    assert lines[0]["probability"] == lines[5]["probability"]
+
+
+def test_results_stream_before_upload_finishes(monkeypatch, test_records):
+    """Drive the ASGI app directly: output must start while input is pending"""
+    monkeypatch.setattr(stream, "STREAM_CHUNK_SIZE", 10)
+    chunks = [ndjson(test_records[i:i + 10]).encode() for i in range(0, 100, 10)]
+    sent, first_output_after = 0, None
+
+    async def receive():
+        nonlocal sent
+        await asyncio.sleep(0)
+        if sent == len(chunks):
+            return {"type": "http.request", "body": b"", "more_body": False}
+        sent += 1
+        return {"type": "http.request", "body": chunks[sent - 1], "more_body": True}
+
+    async def send(message):
+        nonlocal first_output_after
+        if message["type"] == "http.response.body" and message.get("body") and first_output_after is None:
+            first_output_after = sent
+
+    scope = {
+        "type": "http", "asgi": {"version": "3.0", "spec_version": "2.3"},
+        "http_version": "1.1", "method": "POST", "scheme": "http",
+        "path": "/api/predict/stream", "raw_path": b"/api/predict/stream",
+        "query_string": b"", "headers": [], "server": ("test", 80),
+        "client": ("test", 1), "root_path": "",
+    }
+    asyncio.run(app(scope, receive, send))
+    assert first_output_after is not None and first_output_after < len(chunks)
@@ -0,0 +1,38 @@
+"""
+Tests for the per-node thread budget (BLAS limits, inference thread setup)
+"""
+import threading
+
+import pytest
+
+from app.model.executor import InferenceExecutor
+from app.utils.threads import limit_blas_threads, thread_plan
+
+
+def test_thread_plan_flags_oversubscription():
+    assert not thread_plan(8, 2, 4, 1)["oversubscribed"]
+    plan = thread_plan(8, 4, 4, 2)
+    assert plan["compute_threads"] == 32 and plan["oversubscribed"]
+
+
+def test_blas_limit_is_applied():
+    threadpoolctl = pytest.importorskip("threadpoolctl")
+    import numpy  # noqa: F401  (loads the BLAS library)
+
+    original = threadpoolctl.threadpool_info()
+    try:
+        libraries = limit_blas_threads(1)
+        assert libraries and all(n == 1 for _, n in libraries)
+    finally:
+        for lib in original:
+            threadpoolctl.threadpool_limits(limits=lib["num_threads"], user_api=lib["user_api"])
+
+
+def test_initializer_runs_in_every_inference_thread():
+    seen = set()
+    executor = InferenceExecutor(max_workers=2, initializer=lambda: seen.add(threading.current_thread().name))
+    try:
+        names = {executor.pool.submit(lambda: threading.current_thread().name).result() for _ in range(20)}
+    finally:
+        executor.shutdown()
+    assert names <= seen and all(name.startswith("inference") for name in seen)
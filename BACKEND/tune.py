@@ -0,0 +1,68 @@
+"""
+Hyperparameter search for the MLP over all cores
+
+Usage:
+    python tune.py data/diabetic_data.csv
+    python tune.py data/diabetic_data.csv --mode random --trials 30 --workers 8
+    python tune.py data/diabetic_data.csv --space space.json --publish
+
+--space takes a JSON file like {"hidden_layer_sizes": [[128, 64]], "alpha": [0.001]}.
+The best model is exported to --output (default model_search/<timestamp>/)
+in the same layout as model/; --publish also copies it into MODEL_DIR.
+"""
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from app.config import MODEL_DIR
+from app.training.publish import publish
+from app.training.search import load_space, make_trials, search
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parallel MLP hyperparameter search")
+    parser.add_argument("data", help="diabetic_data.csv")
+    parser.add_argument("--mode", choices=("grid", "random"), default="grid")
+    parser.add_argument("--trials", type=int, default=None, help="number of trials (random mode: default 20)")
+    parser.add_argument("--space", default=None, help="JSON file with the values to try per parameter")
+    parser.add_argument("--workers", type=int, default=0, help="processes (0 = one per core)")
+    parser.add_argument("--max-epochs", type=int, default=200)
+    parser.add_argument("--patience", type=int, default=10, help="epochs without validation AUC gain before stopping")
+    parser.add_argument("--abort-margin", type=float, default=0.02,
+                        help="abort a trial that trails the best AUC by this much after 5 epochs")
+    parser.add_argument("--output", default=None, help="directory for the best model's artifacts")
+    parser.add_argument("--publish", action="store_true", help=f"copy the best model into {MODEL_DIR}")
+    args = parser.parse_args()
+
+    space = load_space(args.space)
+    out_dir = Path(args.output or Path(__file__).parent / "model_search" / time.strftime("%Y%m%d-%H%M%S"))
+
+    print("=" * 60)
+    print(f"🧠 MLP HYPERPARAMETER SEARCH ({len(make_trials(space, args.mode, args.trials))} trials)")
+    print("=" * 60)
+
+    started = time.perf_counter()
+    summary = search(
+        args.data, out_dir, space=space, mode=args.mode, n_trials=args.trials,
+        workers=args.workers or None, max_epochs=args.max_epochs,
+        patience=args.patience, abort_margin=args.abort_margin,
+    )
+    best = summary["best"]
+
+    print("\n" + "=" * 60)
+    print(f"🏆 Best: {json.dumps(best['params'])}")
+    print(f"   validation AUC {best['val_auc']:.4f}, test AUC {best['test_auc']:.4f}, "
+          f"test accuracy {best['test_accuracy'] * 100:.2f}%")
+    print(f"✅ Artifacts written to {out_dir} ({time.perf_counter() - started:.0f}s total)")
+
+    if args.publish:
+        publish(out_dir, MODEL_DIR)
+        print(f"🚀 Published to {MODEL_DIR}")
+
+
+if __name__ == "__main__":
+    main()